@@ -56,22 +56,31 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.AccessLogMiddleware',
+    'core.middleware.SamplingProfilerMiddleware',
+    'core.middleware.TemplateProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'core_account.middleware.HashingBusyMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.middleware.StrictLazyLoadMiddleware',
 ]
 
 ROOT_URLCONF = 'application.urls'
 
+TEMPLATE_LOADERS = [
+    'django.template.loaders.filesystem.Loader',
+    'django.template.loaders.app_directories.Loader',
+]
+
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [],
-        'APP_DIRS': True,
         'OPTIONS': {
             'context_processors': [
                 'django.template.context_processors.debug',
@@ -79,12 +88,44 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
             ],
+            # Templates are compiled once per worker outside of DEBUG
+            'loaders': TEMPLATE_LOADERS if DEBUG else [('django.template.loaders.cached.Loader', TEMPLATE_LOADERS)],
         },
     },
 ]
 
+# Warm up of the workers when application.wsgi is loaded: URLs, templates, database and cache connections
+WARMUP_ON_START = getattr(local_settings, 'WARMUP_ON_START', True)
+# Set when the server loads application.wsgi before forking the workers (e.g. gunicorn --preload):
+# the application is fully initialized in the master and shared copy-on-write by the workers
+WSGI_PRELOAD = getattr(local_settings, 'WSGI_PRELOAD', False)
+# Templates compiled by the warm up, by name prefix
+WARMUP_TEMPLATES = getattr(local_settings, 'WARMUP_TEMPLATES', ['boards/', 'accounts/'])
+
+# Logs (core.template_profiler) and sends in a Server-Timing header the slowest templates, includes and filters
+TEMPLATE_PROFILING = getattr(local_settings, 'TEMPLATE_PROFILING', False)
+TEMPLATE_PROFILING_LIMIT = getattr(local_settings, 'TEMPLATE_PROFILING_LIMIT', 10)
+
+# Sampling profiler of the live workers, turned on and off by the staff from /profiler/ (core.sampling_profiler)
+# Workers check whether it's on every SAMPLING_PROFILER_POLL seconds, and sample every SAMPLING_PROFILER_INTERVAL.
+SAMPLING_PROFILER = getattr(local_settings, 'SAMPLING_PROFILER', True)
+SAMPLING_PROFILER_CACHE = getattr(local_settings, 'SAMPLING_PROFILER_CACHE', 'default')
+SAMPLING_PROFILER_POLL = getattr(local_settings, 'SAMPLING_PROFILER_POLL', 5)
+SAMPLING_PROFILER_INTERVAL = getattr(local_settings, 'SAMPLING_PROFILER_INTERVAL', 0.005)
+SAMPLING_PROFILER_MAX_SECONDS = getattr(local_settings, 'SAMPLING_PROFILER_MAX_SECONDS', 3600)
+# Seconds the stacks sampled by a worker are kept in the cache
+SAMPLING_PROFILER_TIMEOUT = getattr(local_settings, 'SAMPLING_PROFILER_TIMEOUT', 3600)
+
 WSGI_APPLICATION = 'application.wsgi.application'
 
+TEST_RUNNER = 'core.runner.StrictTestRunner'
+
+# STRICT LAZY LOADS: '' (off), 'log' or 'raise' on implicit foreign key loads in the views of these modules
+# and on related object or manager queries fired while rendering these templates
+STRICT_LAZY_LOADS = getattr(local_settings, 'STRICT_LAZY_LOADS', '')
+STRICT_LAZY_LOADS_MODULES = getattr(local_settings, 'STRICT_LAZY_LOADS_MODULES', ['boards.'])
+STRICT_LAZY_LOADS_TEMPLATES = getattr(local_settings, 'STRICT_LAZY_LOADS_TEMPLATES', ['boards/', 'accounts/'])
+
 
 # Database
 # https://docs.djangoproject.com/en/2.2/ref/settings/#databases
@@ -97,10 +138,119 @@ DATABASES = {
         'PASSWORD': getattr(local_settings, 'POSTGRESQL_PASSWORD', ''),
         'HOST': 'localhost',
         'PORT': 5432,
+        # Seconds a connection is kept open across requests, 0 closes it at the end of every request. Opt in to
+        # persistent connections, e.g. 60, for the warm up to open them before the first request.
+        'CONN_MAX_AGE': getattr(local_settings, 'POSTGRESQL_CONN_MAX_AGE', 0),
     }
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/2.2/topics/cache/
+
+CACHES = getattr(local_settings, 'CACHES', {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+})
+
+
+# Sessions
+# https://docs.djangoproject.com/en/2.2/topics/http/sessions/
+# 'core.sessions.cached_db' reads sessions from the cache and writes them through to the database,
+# 'core.sessions.db' only uses the database, both skip saving sessions whose data didn't change.
+# 'django.contrib.sessions.backends.signed_cookies' keeps sessions out of the database entirely.
+# Expired database sessions are removed by `manage.py purge_sessions`.
+
+SESSION_ENGINE = getattr(local_settings, 'SESSION_ENGINE', 'core.sessions.cached_db')
+SESSION_CACHE_ALIAS = getattr(local_settings, 'SESSION_CACHE_ALIAS', 'default')
+SESSION_SAVE_EVERY_REQUEST = False
+
+
+# Rate limiting of the posting endpoints, token buckets per user and per IP stored in the cache
+# Rates are 'capacity/period' with period one of s, m, h or d
+
+RATELIMIT_ENABLED = getattr(local_settings, 'RATELIMIT_ENABLED', True)
+RATELIMIT_CACHE = getattr(local_settings, 'RATELIMIT_CACHE', 'default')
+RATELIMIT_IP_HEADER = getattr(local_settings, 'RATELIMIT_IP_HEADER', 'REMOTE_ADDR')
+# With RATELIMIT_IP_HEADER = 'HTTP_X_FORWARDED_FOR', the number of proxies in front of the application appending to it.
+RATELIMIT_TRUSTED_PROXIES = getattr(local_settings, 'RATELIMIT_TRUSTED_PROXIES', 1)
+RATELIMITS = getattr(local_settings, 'RATELIMITS', {
+    'new_topic': '5/m',
+    'reply_topic': '20/m',
+    'signup': '5/h',
+})
+
+
+# Maximum length of the post messages, checked by the forms and the database
+# Changing it changes the Post model, it needs a migration.
+# The listings only read the first POST_PREVIEW_LENGTH characters.
+
+POST_MESSAGE_MAX_LENGTH = getattr(local_settings, 'POST_MESSAGE_MAX_LENGTH', 4000)
+POST_PREVIEW_LENGTH = getattr(local_settings, 'POST_PREVIEW_LENGTH', 200)
+
+
+# Boards and topics resolved from the URLs are kept this many seconds in the cache (0 disables it)
+
+LOOKUP_CACHE = getattr(local_settings, 'LOOKUP_CACHE', 'default')
+LOOKUP_CACHE_TIMEOUT = getattr(local_settings, 'LOOKUP_CACHE_TIMEOUT', 30)
+
+
+# Trending topics, ranked by their activity with exponential decay
+# A reply made HOT_SCORE_HALF_LIFE hours ago counts half as much as a reply made now.
+
+HOT_SCORE_HALF_LIFE = getattr(local_settings, 'HOT_SCORE_HALF_LIFE', 12)
+HOT_SCORE_WEIGHTS = getattr(local_settings, 'HOT_SCORE_WEIGHTS', {'topic': 1, 'reply': 1, 'view': 0.1})
+TRENDING_TOPICS = getattr(local_settings, 'TRENDING_TOPICS', 20)
+
+
+# Read markers of the topics, coalesced per user in the cache and written in batches
+
+READ_MARKERS_CACHE = getattr(local_settings, 'READ_MARKERS_CACHE', 'default')
+READ_MARKERS_BATCH = getattr(local_settings, 'READ_MARKERS_BATCH', 20)
+READ_MARKERS_FLUSH_INTERVAL = getattr(local_settings, 'READ_MARKERS_FLUSH_INTERVAL', 60)
+# Seconds the pending markers of a user are kept in the cache, well past the flush interval
+READ_MARKERS_TIMEOUT = getattr(local_settings, 'READ_MARKERS_TIMEOUT', 7 * 86400)
+
+
+# Topics not updated for this many months are moved to the archive tables by `manage.py archive_topics`
+
+ARCHIVE_TOPICS_AFTER_MONTHS = getattr(local_settings, 'ARCHIVE_TOPICS_AFTER_MONTHS', 6)
+
+
+# Password hashing
+# https://docs.djangoproject.com/en/2.2/topics/auth/passwords/
+# The first hasher hashes new passwords, hashes made with another one or other costs are upgraded on login.
+# Argon2 requires the argon2-cffi package.
+
+PASSWORD_HASHERS = getattr(local_settings, 'PASSWORD_HASHERS', [
+    'core_account.hashers.TunedPBKDF2PasswordHasher',
+    'core_account.hashers.ScryptPasswordHasher',
+    'core_account.hashers.TunedArgon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+])
+PASSWORD_PBKDF2_ITERATIONS = getattr(local_settings, 'PASSWORD_PBKDF2_ITERATIONS', 150000)
+PASSWORD_SCRYPT_N = getattr(local_settings, 'PASSWORD_SCRYPT_N', 2 ** 14)
+PASSWORD_SCRYPT_R = getattr(local_settings, 'PASSWORD_SCRYPT_R', 8)
+PASSWORD_SCRYPT_P = getattr(local_settings, 'PASSWORD_SCRYPT_P', 1)
+PASSWORD_ARGON2_TIME_COST = getattr(local_settings, 'PASSWORD_ARGON2_TIME_COST', 2)
+PASSWORD_ARGON2_MEMORY_COST = getattr(local_settings, 'PASSWORD_ARGON2_MEMORY_COST', 512)
+PASSWORD_ARGON2_PARALLELISM = getattr(local_settings, 'PASSWORD_ARGON2_PARALLELISM', 2)
+
+
+# Password hashing pool
+# Logins and sign ups hash the passwords in a pool of PASSWORD_HASHING_PROCESSES processes per worker, 0 hashes
+# them in the request thread. Past PASSWORD_HASHING_QUEUE passwords hashed or waiting in a worker, a request waits
+# PASSWORD_HASHING_WAIT seconds for a slot, then gets a 503 with Retry-After: PASSWORD_HASHING_RETRY_AFTER.
+
+AUTHENTICATION_BACKENDS = ['core_account.backends.PooledModelBackend']
+PASSWORD_HASHING_PROCESSES = getattr(local_settings, 'PASSWORD_HASHING_PROCESSES', 2)
+PASSWORD_HASHING_QUEUE = getattr(local_settings, 'PASSWORD_HASHING_QUEUE', 8)
+PASSWORD_HASHING_WAIT = getattr(local_settings, 'PASSWORD_HASHING_WAIT', 0.5)
+PASSWORD_HASHING_RETRY_AFTER = getattr(local_settings, 'PASSWORD_HASHING_RETRY_AFTER', 5)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/2.2/ref/settings/#auth-password-validators
 
@@ -142,6 +292,17 @@ LOGIN_URL = 'login'
 
 STATIC_URL = '/static/'
 STATIC_ROOT = getattr(local_settings, 'DJANGO_STATIC', os.path.join(BASE_DIR, 'static'))
+# collectstatic builds the bundles, adds content hashes to the file names and writes compressed versions
+STATICFILES_STORAGE = getattr(local_settings, 'STATICFILES_STORAGE', 'core.storage.CompressedManifestStaticFilesStorage')
+STATIC_BUNDLES = {
+    'css/base.bundle.css': ['css/bootstrap.min.css', 'css/app.css'],
+    'js/base.bundle.js': ['js/jquery-3.4.0.min.js', 'js/bootstrap.bundle.min.js'],
+}
+STATIC_BUNDLING = getattr(local_settings, 'STATIC_BUNDLING', not DEBUG)
+# Without DEBUG, application.wsgi serves STATIC_ROOT itself:
+# hashed files are cached for a year, the others for STATIC_MAX_AGE seconds
+STATIC_SERVE = getattr(local_settings, 'STATIC_SERVE', not DEBUG)
+STATIC_MAX_AGE = getattr(local_settings, 'STATIC_MAX_AGE', 60)
 MEDIA_URL = '/media/'
 MEDIA_ROOT = getattr(local_settings, 'DJANGO_MEDIA', os.path.join(PARENT_DIR, 'media'))
 
@@ -162,9 +323,34 @@ EMAIL_BACKEND = getattr(local_settings, 'EMAIL_BACKEND', 'django.core.mail.backe
 ADMINS = getattr(local_settings, 'ADMINS', ())
 MANAGERS = getattr(local_settings, 'MANAGERS', ())
 EMAIL_SUBJECT_PREFIX = '[EMAIL-VERIFY] '
+# LOGGING
+# The handlers run on background threads (core.log), errors are mailed on their own without blocking the request.
+# Records are written to stderr as JSON lines, with the request id, user id and URL name of their request.
+# 'core.access' logs every request, only ACCESS_LOG_SAMPLE_RATE of the successful ones are written,
+# failed and slower than ACCESS_LOG_SLOW_MS ones always are.
+ACCESS_LOG = getattr(local_settings, 'ACCESS_LOG', True)
+ACCESS_LOG_SAMPLE_RATE = getattr(local_settings, 'ACCESS_LOG_SAMPLE_RATE', 1.0)
+ACCESS_LOG_SLOW_MS = getattr(local_settings, 'ACCESS_LOG_SLOW_MS', 1000)
+# Records waiting for each logging thread, the records past it are dropped and counted.
+LOG_QUEUE_SIZE = getattr(local_settings, 'LOG_QUEUE_SIZE', 10000)
+LOGGING_CONFIG = 'core.log.configure'
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
+    'filters': {
+        'sample_info': {
+            '()': 'core.log.SamplingFilter',
+            'rate': ACCESS_LOG_SAMPLE_RATE,
+        },
+        'hashing_busy': {
+            '()': 'core_account.middleware.HashingBusyFilter',
+        },
+    },
+    'formatters': {
+        'json': {
+            '()': 'core.log.JsonFormatter',
+        },
+    },
     'handlers': {
         'null': {
             'level': 'DEBUG',
@@ -173,19 +359,50 @@ LOGGING = {
         'mail_admins': {
             'level': 'ERROR',
             'class': 'django.utils.log.AdminEmailHandler',
-        }
+        },
+        'json': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'json',
+        },
+        'access': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'json',
+            'filters': ['sample_info'],
+        },
     },
     'loggers': {
+        # Replaces the handlers of Django's DEFAULT_LOGGING, its records go to the root handler, django.request
+        # errors are mailed once.
+        'django': {
+            'handlers': [],
+            'level': 'INFO',
+            'propagate': True,
+        },
+        'django.server': {
+            'handlers': ['json'],
+            'level': 'INFO',
+            'propagate': False,
+        },
         'django.security.DisallowedHost': {
             'handlers': ['null'],
             'propagate': False,
         },
         'django.request': {
             'handlers': ['mail_admins'],
+            'filters': ['hashing_busy'],
             'level': 'ERROR',
             'propagate': True,
         },
-    }
+        'core.access': {
+            'handlers': ['access'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+    },
+    'root': {
+        'handlers': ['json'],
+        'level': 'WARNING',
+    },
 }
 
 # DEBUG TOOLBAR SETTINGS
@@ -20,6 +20,7 @@ from django.conf.urls.static import static
 from django.contrib.auth import views as auth_views
 
 from boards import views
+from core import views as core_views
 from core_account import views as accounts_views
 
 
@@ -45,12 +46,17 @@ urlpatterns = [
         name='password_change'),
     path('settings/password/done', auth_views.PasswordChangeDoneView.as_view(template_name='accounts/password_change_done.html'),
         name='password_change_done'),
+    path('users/<str:username>/', accounts_views.UserActivityView.as_view(), name='user_activity'),
 
     path('boards/<int:pk>/', views.BoardTopicsView.as_view(), name='board_topics'),
+    path('boards/<int:pk>/trending/', views.BoardTrendingView.as_view(), name='board_trending'),
     path('boards/<int:pk>/new', views.NewTopicView.as_view(), name='new_topic'),
     path('boards/<int:pk>/topics/<int:topic_pk>/', views.TopicPostsView.as_view(), name='topic_posts'),
     path('boards/<int:pk>/topics/<int:topic_pk>/reply', views.ReplyTopicView.as_view(), name='reply_topic'),
     path('boards/<int:pk>/topics/<int:topic_pk>/posts/<int:post_pk>/edit/', views.PostUpdateView.as_view(), name='edit_post'),
+    path('profiler/', core_views.ProfilerView.as_view(), name='profiler'),
+    path('profiler/stacks', core_views.ProfilerStacksView.as_view(), name='profiler_stacks'),
+    path('metrics/hashing', accounts_views.HashingMetricsView.as_view(), name='hashing_metrics'),
     path('admin/', admin.site.urls),
 ]
 
@@ -9,8 +9,20 @@ https://docs.djangoproject.com/en/2.2/howto/deployment/wsgi/
 
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'application.settings')
 
 application = get_wsgi_application()
+
+if settings.WSGI_PRELOAD:
+    from core.warmup import preload
+    preload()
+elif settings.WARMUP_ON_START:
+    from core.warmup import warm_up
+    warm_up()
+
+if settings.STATIC_SERVE:
+    from core.static_wsgi import StaticFilesApplication
+    application = StaticFilesApplication(application)
@@ -1,8 +1,24 @@
 from django.contrib import admin
+from django.core.exceptions import ValidationError
 
 from .models import Board, Topic, Post
 
 
+class PostAdmin(admin.ModelAdmin):
+    list_display = ('__str__', 'created_by', 'created_at')
+    list_select_related = ('topic', 'created_by')
+
+    def get_object(self, request, object_id, from_field=None):
+        # The change, delete and history pages name the post, with its subject only. Not in get_queryset(),
+        # the counts of the list would be grouped by post.
+        queryset = self.get_queryset(request).with_subject()
+        field = Post._meta.pk if from_field is None else Post._meta.get_field(from_field)
+        try:
+            return queryset.get(**{field.name: field.to_python(object_id)})
+        except (Post.DoesNotExist, ValidationError, ValueError):
+            return None
+
+
 admin.site.register(Board)
 admin.site.register(Topic)
-admin.site.register(Post)
+admin.site.register(Post, PostAdmin)
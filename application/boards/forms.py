@@ -1,11 +1,20 @@
 from django import forms
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
 
-from .models import Topic, Post
+from core_account.models import Profile
+from . import ranking
+from .models import Board, Topic, Post
 
 
 class NewTopicForm(forms.ModelForm):
-    message = forms.CharField(max_length=4000, widget=forms.Textarea(attrs={'rows': 5, 'placeholder': 'What is on your mind?'}), help_text='The max length of the text is 4000.')
+    message = forms.CharField(
+        max_length=settings.POST_MESSAGE_MAX_LENGTH,
+        widget=forms.Textarea(attrs={'rows': 5, 'placeholder': 'What is on your mind?'}),
+        help_text='The max length of the text is {0}.'.format(settings.POST_MESSAGE_MAX_LENGTH)
+    )
 
     class Meta:
         model = Topic
@@ -21,13 +30,19 @@ class NewTopicForm(forms.ModelForm):
         if commit:
             topic.board = self.board
             topic.starter = self.user
-            topic.save()
-
-            Post.objects.create(
-                message=self.cleaned_data.get('message'),
-                topic=topic,
-                created_by=self.user
-            )
+            topic.hot_score = ranking.event_score(ranking.get_weight('topic'))
+            with transaction.atomic():
+                topic.save()
+                Post.objects.create(
+                    message=self.cleaned_data.get('message'),
+                    topic=topic,
+                    created_by=self.user
+                )
+                Profile.objects.filter(user=self.user).update(post_count=F('post_count') + 1)
+                # Last statement of the transaction, the board row is only locked until the commit.
+                Board.objects.filter(pk=self.board.pk).update(
+                    topics_count=F('topics_count') + 1, posts_count=F('posts_count') + 1
+                )
         return topic
 
 
@@ -47,10 +62,15 @@ class PostForm(forms.ModelForm):
         if commit:
             post.topic = self.topic
             post.created_by = self.user
-            post.save()
-
-            self.topic.last_updated = timezone.now()
-            self.topic.save()
+            with transaction.atomic():
+                post.save()
+                # Only these columns, a full save would overwrite the views counted meanwhile.
+                Topic.objects.filter(pk=self.topic.pk).update(
+                    last_updated=timezone.now(), reply_count=F('reply_count') + 1,
+                    hot_score=ranking.add_event(ranking.get_weight('reply'))
+                )
+                Profile.objects.filter(user=self.user).update(post_count=F('post_count') + 1)
+                Board.objects.filter(pk=self.topic.board_id).update(posts_count=F('posts_count') + 1)
         return post
 
 
@@ -0,0 +1,59 @@
+"""
+Resolution of the boards and topics named in the URLs: at most once per request (identity map on the request),
+and usually without query thanks to a short lived copy in the shared cache, dropped when the object is saved or
+deleted. The counters updated in place (views, replies, hot score) aren't refreshed in the cached copies, they
+can lag behind by up to `LOOKUP_CACHE_TIMEOUT` seconds.
+"""
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.http import Http404
+
+
+def get_cache():
+    return caches[getattr(settings, 'LOOKUP_CACHE', 'default')]
+
+
+def cache_key(model, pk):
+    return 'lookup:{0}:{1}'.format(model._meta.label_lower, pk)
+
+
+def invalidate(model, pk):
+    get_cache().delete(cache_key(model, pk))
+
+
+def get_object(request, model, pk):
+    """
+    Returns the `model` instance with the primary key `pk`, raises Http404 when there is none.
+    """
+    identity_map = request.__dict__.setdefault('_lookups', {})
+    key = cache_key(model, pk)
+    if key not in identity_map:
+        timeout = getattr(settings, 'LOOKUP_CACHE_TIMEOUT', 30)
+        instance = get_cache().get(key) if timeout else None
+        if instance is None:
+            try:
+                instance = model._default_manager.get(pk=pk)
+            except model.DoesNotExist:
+                raise Http404('No {0} matches the given query.'.format(model._meta.object_name))
+            if timeout:
+                get_cache().set(key, instance, timeout)
+        identity_map[key] = instance
+    return identity_map[key]
+
+
+def get_board(request, pk):
+    return get_object(request, apps.get_model('boards', 'Board'), pk)
+
+
+def get_topic(request, board_pk, topic_pk):
+    """
+    Returns the topic `topic_pk` of the board `board_pk`, with its board.
+    """
+    topic_model = apps.get_model('boards', 'Topic')
+    board = get_board(request, board_pk)
+    topic = get_object(request, topic_model, topic_pk)
+    if topic.board_id != board.pk:
+        raise Http404('No Topic matches the given query.')
+    topic_model.board.field.set_cached_value(topic, board)
+    return topic
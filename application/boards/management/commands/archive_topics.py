@@ -0,0 +1,79 @@
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from boards.models import ArchivedPost, ArchivedTopic, Post, Topic
+
+TOPIC_FIELDS = ('id', 'subject', 'last_updated', 'board_id', 'starter_id', 'views', 'reply_count')
+# Below the number of query parameters of SQLite.
+DELETE_BATCH_SIZE = 500
+POST_FIELDS = ('id', 'message', 'message_html', 'topic_id', 'created_at', 'updated_at', 'created_by_id', 'updated_by_id')
+
+
+class Command(BaseCommand):
+    help = (
+        'Moves the topics not updated for some months, with their posts, to the archive tables. '
+        'Every batch is moved in its own transaction, an interrupted run is resumed by running the command again.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months', type=int, default=getattr(settings, 'ARCHIVE_TOPICS_AFTER_MONTHS', 6),
+            help='Archive the topics not updated for this many months (30 days).'
+        )
+        parser.add_argument('--batch-size', type=int, default=100, help='Number of topics moved per transaction.')
+        parser.add_argument('--sleep', type=float, default=0, help='Seconds to wait between two batches.')
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=30 * options['months'])
+        archived, last_pk = 0, 0
+        while True:
+            # Past the topics of the previous batch, the ones it kept (replied to meanwhile) included.
+            last_pk, moved = self.archive_batch(cutoff, options['batch_size'], last_pk)
+            if last_pk is None:
+                break
+            archived += moved
+            self.stdout.write('Archived {0} topics.'.format(archived))
+            if options['sleep']:
+                time.sleep(options['sleep'])
+        self.stdout.write('Done, {0} topics archived.'.format(archived))
+
+    def archive_batch(self, cutoff, batch_size, after_pk=0):
+        """
+        Archives the next `batch_size` topics older than `cutoff` whose pk is above `after_pk`. Returns the pk of the
+        last topic of the batch, None when there is none left, and the number of topics archived.
+        """
+        with transaction.atomic():
+            # Locked, a reply (its post insert and topic update) waits for the batch to be committed.
+            locked = list(
+                Topic.objects.select_for_update().filter(last_updated__lt=cutoff, pk__gt=after_pk).order_by(
+                    'pk'
+                ).values_list('pk', flat=True)[:batch_size]
+            )
+            if not locked:
+                return None, 0
+            # Filtered again under the lock, a topic replied to since it was selected stays.
+            topics = list(Topic.objects.filter(pk__in=locked, last_updated__lt=cutoff).values(*TOPIC_FIELDS))
+            ids = [topic['id'] for topic in topics]
+            ArchivedTopic.objects.bulk_create([ArchivedTopic(**topic) for topic in topics])
+            posts = list(Post.objects.filter(topic__in=ids).order_by('pk').values(*POST_FIELDS))
+            ArchivedPost.objects.bulk_create([ArchivedPost(**post) for post in posts], batch_size=1000)
+            # Posts the lock didn't keep out, added since the copy: their topics stay, their copies are dropped.
+            copied = Counter(post['topic_id'] for post in posts)
+            current = Post.objects.filter(topic__in=ids).order_by().values_list('topic').annotate(count=Count('pk'))
+            kept = {topic for topic, count in current if count != copied[topic]}
+            if kept:
+                ArchivedTopic.objects.filter(pk__in=kept).delete()
+            # Posts first, the topics (and their read markers) are then deleted without collecting posts.
+            # Only the copied posts, and only the topics left without posts.
+            pks = [post['id'] for post in posts if post['topic_id'] not in kept]
+            for start in range(0, len(pks), DELETE_BATCH_SIZE):
+                Post.objects.filter(pk__in=pks[start:start + DELETE_BATCH_SIZE]).delete()
+            Topic.objects.filter(pk__in=ids, posts__isnull=True).exclude(pk__in=kept).delete()
+        return locked[-1], len(ids) - len(kept)
@@ -0,0 +1,35 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from boards import partitioning
+
+
+class Command(BaseCommand):
+    help = (
+        'Creates the monthly partitions of the Post table for the coming months, to run e.g. daily from cron. '
+        'With --convert, first turns the Post table into a table partitioned by created_at. PostgreSQL only.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--months-ahead', type=int, default=3, help='Number of future months to create.')
+        parser.add_argument(
+            '--convert', action='store_true',
+            help='Convert the Post table, blocking the writes to the posts while the rows are copied.'
+        )
+
+    def handle(self, *args, **options):
+        if not partitioning.is_supported(connection):
+            self.stdout.write('Partitioning needs PostgreSQL, the {0} Post table is left as is.'.format(connection.vendor))
+            return
+        last = timezone.now() + timedelta(days=31 * options['months_ahead'])
+        with transaction.atomic():
+            if not partitioning.is_partitioned(connection):
+                if not options['convert']:
+                    raise CommandError('The Post table is not partitioned, run with --convert to partition it.')
+                partitioning.convert(connection, last)
+                self.stdout.write('Converted the Post table.')
+            created = partitioning.create_partitions(connection, timezone.now(), last)
+        self.stdout.write('Created {0} partitions{1}'.format(len(created), ': ' + ', '.join(created) if created else '.'))
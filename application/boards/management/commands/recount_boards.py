@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from boards import ranking
+from boards.models import ArchivedPost, ArchivedTopic, Board, Post, Topic
+
+
+def count(model, board_field):
+    """
+    Returns the subquery counting the `model` rows of the board.
+    """
+    rows = model.objects.filter(**{board_field: OuterRef('pk')}).order_by().values(board_field)
+    return Coalesce(Subquery(rows.annotate(count=Count('pk')).values('count'), output_field=IntegerField()), 0)
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the counters of the boards and topics, e.g. after deleting topics or posts.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--hot-scores', action='store_true',
+            help='Also rebuild the hot scores, from the replies and views counts dated at the last update.'
+        )
+        parser.add_argument('--batch-size', type=int, default=1000, help='Number of hot scores written per query.')
+
+    def handle(self, *args, **options):
+        replies = Post.objects.filter(topic=OuterRef('pk')).order_by().values('topic')
+        Topic.objects.update(
+            reply_count=Coalesce(Subquery(replies.annotate(count=Count('pk') - 1).values('count'), output_field=IntegerField()), 0),
+        )
+        # Archived topics and posts still count
+        updated = Board.objects.update(
+            topics_count=count(Topic, 'board') + count(ArchivedTopic, 'board'),
+            posts_count=count(Post, 'topic__board') + count(ArchivedPost, 'topic__board'),
+        )
+        self.stdout.write('Recounted {0} boards.'.format(updated))
+        if options['hot_scores']:
+            self.rebuild_hot_scores(options['batch_size'])
+
+    def rebuild_hot_scores(self, batch_size):
+        weights = {event: ranking.get_weight(event) for event in ('topic', 'reply', 'view')}
+        topics = Topic.objects.only('pk', 'reply_count', 'views', 'last_updated').order_by('pk')
+        batch = []
+        for topic in topics.iterator(chunk_size=batch_size):
+            weight = weights['topic'] + topic.reply_count * weights['reply'] + topic.views * weights['view']
+            topic.hot_score = ranking.event_score(weight, topic.last_updated)
+            batch.append(topic)
+            if len(batch) == batch_size:
+                Topic.objects.bulk_update(batch, ['hot_score'])
+                batch = []
+        Topic.objects.bulk_update(batch, ['hot_score'])
+        self.stdout.write('Rebuilt the hot scores.')
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from boards import markup
+from boards.models import ArchivedPost, Post
+
+
+class Command(BaseCommand):
+    help = 'Renders the HTML and the preview of the posts (and archived posts) saved without them, in batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all', action='store_true', help='Render every post again, e.g. after changing the allowed tags.'
+        )
+        parser.add_argument('--batch-size', type=int, default=500, help='Number of posts written per query.')
+
+    def handle(self, *args, **options):
+        for model in (Post, ArchivedPost):
+            if options['all']:
+                posts = model.objects.all()
+            elif model is Post:
+                # Posts saved before the previews have their HTML but no preview.
+                posts = model.objects.filter(Q(message_html='') | Q(preview=''))
+            else:
+                posts = model.objects.filter(message_html='')
+            rendered = self.render(posts.only('pk', 'message').order_by('pk'), model, options['batch_size'])
+            self.stdout.write('Rendered {0} {1}.'.format(rendered, model._meta.verbose_name_plural))
+
+    def render(self, posts, model, batch_size):
+        # Keyset batches, the page cost stays the same however far the backfill is.
+        rendered, last_pk = 0, 0
+        while True:
+            batch = list(posts.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                return rendered
+            for post in batch:
+                if model is Post:
+                    post.render_message()
+                else:
+                    post.message_html = markup.render(post.message)
+            model.objects.bulk_update(batch, ['message_html', 'preview'] if model is Post else ['message_html'])
+            rendered += len(batch)
+            last_pk = batch[-1].pk
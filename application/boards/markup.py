@@ -0,0 +1,19 @@
+import bleach
+import markdown
+
+MARKDOWN_EXTENSIONS = ['markdown.extensions.fenced_code', 'markdown.extensions.sane_lists']
+
+ALLOWED_TAGS = [
+    'a', 'abbr', 'b', 'blockquote', 'br', 'code', 'em', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'hr', 'i', 'li', 'ol',
+    'p', 'pre', 'strong', 'ul',
+]
+ALLOWED_ATTRIBUTES = {'a': ['href', 'title'], 'abbr': ['title']}
+ALLOWED_PROTOCOLS = ['http', 'https', 'mailto']
+
+
+def render(message):
+    """
+    Renders a Markdown message to HTML, keeping only the allowed tags, attributes and link protocols.
+    """
+    html = markdown.markdown(message, extensions=MARKDOWN_EXTENSIONS)
+    return bleach.clean(html, tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRIBUTES, protocols=ALLOWED_PROTOCOLS, strip=True)
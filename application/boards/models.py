@@ -1,10 +1,21 @@
+from django.conf import settings
 from django.db import models
+from django.db.models import F
+from django.db.models.functions import Length
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.contrib.auth.models import User
+from django.utils.text import Truncator
+
+from . import lookups, markup
 
 
 class Board(models.Model):
     name = models.CharField(max_length=30, unique=True)
     description = models.CharField(max_length=100)
+    # Maintained with F() updates by the forms, recomputed by `manage.py recount_boards`
+    topics_count = models.PositiveIntegerField(default=0)
+    posts_count = models.PositiveIntegerField(default=0)
 
     def __str__(self):
         return self.name
@@ -18,22 +29,145 @@ class Board(models.Model):
 
 class Topic(models.Model):
     subject = models.CharField(max_length=255)
+    # Null for the topics created before it was added. The posts of a topic are never older than the topic.
+    created_at = models.DateTimeField(auto_now_add=True, null=True)
     last_updated = models.DateTimeField(auto_now_add=True)
     board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name='topics')
     starter = models.ForeignKey(User, on_delete=models.CASCADE, related_name='topics')
     views = models.PositiveIntegerField(default=0)
+    # Posts after the first one, maintained with F() updates by PostForm
+    reply_count = models.PositiveIntegerField(default=0)
+    # Time decayed activity, see boards.ranking
+    hot_score = models.FloatField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['board', '-hot_score'], name='boards_topic_hot_idx'),
+            models.Index(fields=['starter', '-id'], name='boards_topic_starter_idx'),
+        ]
 
     def __str__(self):
         return self.subject
 
 
+class MessageField(models.TextField):
+    """
+    Text field whose length can be checked in the database, see Post.Meta.constraints.
+    """
+
+
+MessageField.register_lookup(Length)
+
+
+@receiver([post_save, post_delete], sender=Board)
+@receiver([post_save, post_delete], sender=Topic)
+def invalidate_lookup(sender, instance, **kwargs):
+    lookups.invalidate(sender, instance.pk)
+
+
+class PostQuerySet(models.QuerySet):
+
+    def with_subject(self):
+        return self.annotate(topic_subject=F('topic__subject'))
+
+
 class Post(models.Model):
-    message = models.TextField(max_length=400)
+    message = MessageField(max_length=settings.POST_MESSAGE_MAX_LENGTH)
+    # Plain text start of the message for the listings, which defer the full message.
+    # Long messages are compressed and stored out of line by PostgreSQL (TOAST), deferring them skips reading them.
+    preview = models.CharField(max_length=settings.POST_PREVIEW_LENGTH, blank=True, default='')
+    # Sanitized HTML of the Markdown message, rendered when the message is saved
+    message_html = models.TextField(blank=True, default='')
     topic = models.ForeignKey(Topic, on_delete=models.CASCADE, related_name='posts')
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(null=True)
     created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='posts')
     updated_by = models.ForeignKey(User, null=True, on_delete=models.CASCADE, related_name='+')
 
+    objects = PostQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(message__length__lte=settings.POST_MESSAGE_MAX_LENGTH), name='boards_post_message_length'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['topic', 'created_at'], name='boards_post_topic_idx'),
+            # Last post of the boards, read newest first and partition by partition once partitioned
+            models.Index(fields=['-created_at'], name='boards_post_created_idx'),
+            # User activity pages, keyset paginated on (created_at, id)
+            models.Index(fields=['created_by', '-created_at', '-id'], name='boards_post_activity_idx'),
+        ]
+
+    def render_message(self):
+        """
+        Sets the fields derived from the message.
+        """
+        self.message_html = markup.render(self.message)
+        self.preview = Truncator(' '.join(self.message.split())).chars(settings.POST_PREVIEW_LENGTH)
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'message' in update_fields:
+            self.render_message()
+            if update_fields is not None:
+                kwargs['update_fields'] = set(update_fields) | {'message_html', 'preview'}
+        super(Post, self).save(*args, **kwargs)
+
+    def __str__(self):
+        # Never trigger a query here, use the topic only if it was selected with the post.
+        if Post.topic.is_cached(self):
+            return self.topic.subject
+        if hasattr(self, 'topic_subject'):
+            return self.topic_subject
+        return 'Post #{0}'.format(self.pk)
+
+
+class TopicReadMarker(models.Model):
+    """
+    The last post of a topic read by a user, written in batches by boards.readmarkers.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='+')
+    topic = models.ForeignKey(Topic, on_delete=models.CASCADE, related_name='+')
+    last_read_post_id = models.PositiveIntegerField()
+
+    class Meta:
+        unique_together = [('user', 'topic')]
+
+    def __str__(self):
+        return 'Read marker #{0}'.format(self.pk)
+
+
+class ArchivedTopic(models.Model):
+    """
+    A topic moved out of the Topic table by `manage.py archive_topics`, with its id kept. Read only.
+    """
+    id = models.IntegerField(primary_key=True)
+    subject = models.CharField(max_length=255)
+    last_updated = models.DateTimeField()
+    board = models.ForeignKey(Board, on_delete=models.CASCADE, related_name='archived_topics')
+    starter = models.ForeignKey(User, on_delete=models.CASCADE, related_name='+')
+    views = models.PositiveIntegerField(default=0)
+    reply_count = models.PositiveIntegerField(default=0)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.subject
+
+
+class ArchivedPost(models.Model):
+    """
+    A post of an archived topic, with its id kept.
+    """
+    id = models.IntegerField(primary_key=True)
+    message = models.TextField()
+    message_html = models.TextField(blank=True, default='')
+    topic = models.ForeignKey(ArchivedTopic, on_delete=models.CASCADE, related_name='posts')
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField(null=True)
+    created_by = models.ForeignKey(User, on_delete=models.CASCADE, related_name='+')
+    updated_by = models.ForeignKey(User, null=True, on_delete=models.CASCADE, related_name='+')
+
     def __str__(self):
-        return self.topic.subject
+        return 'Post #{0}'.format(self.pk)
@@ -0,0 +1,150 @@
+"""
+Monthly range partitioning of the Post table on created_at, PostgreSQL only.
+See `manage.py partition_posts`.
+"""
+from datetime import datetime
+
+from django.utils import timezone
+
+from .models import Post
+
+_partitioned = {}
+
+
+def month_start(value):
+    return datetime(value.year, value.month, 1, tzinfo=timezone.utc)
+
+
+def next_month(value):
+    return month_start(datetime(value.year + value.month // 12, value.month % 12 + 1, 1))
+
+
+def months(first, last):
+    """
+    Yields the first day of the months from the one of `first` to the one of `last`, both included.
+    """
+    month = month_start(first)
+    while month <= last:
+        yield month
+        month = next_month(month)
+
+
+def partition_name(month):
+    return '{0}_y{1:04d}m{2:02d}'.format(Post._meta.db_table, month.year, month.month)
+
+
+def is_supported(connection):
+    return connection.vendor == 'postgresql'
+
+
+def is_partitioned(connection):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(%s))',
+            [Post._meta.db_table]
+        )
+        return cursor.fetchone()[0]
+
+
+def has_partitions(connection):
+    """
+    Tells if the Post table is partitioned, checked once per process and database. A worker started before the
+    conversion keeps answering False, which only costs it the pruning of the partitions.
+    """
+    if connection.alias not in _partitioned:
+        _partitioned[connection.alias] = is_supported(connection) and is_partitioned(connection)
+    return _partitioned[connection.alias]
+
+
+def default_partition_name():
+    return '{0}_default'.format(Post._meta.db_table)
+
+
+def create_partitions(connection, first, last):
+    """
+    Creates the missing monthly partitions from the month of `first` to the one of `last`.
+    The rows of a month already in the default partition are moved to the month's new partition.
+    Returns the names of the partitions created.
+    """
+    quote = connection.ops.quote_name
+    table = Post._meta.db_table
+    default = default_partition_name()
+    created = []
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT to_regclass(%s) IS NOT NULL', [default])
+        has_default = cursor.fetchone()[0]
+        for month in months(first, last):
+            name = partition_name(month)
+            cursor.execute('SELECT to_regclass(%s) IS NULL', [name])
+            if not cursor.fetchone()[0]:
+                continue
+            bounds = [month, next_month(month)]
+            if not has_default:
+                cursor.execute('CREATE TABLE {0} PARTITION OF {1} FOR VALUES FROM (%s) TO (%s)'.format(
+                    quote(name), quote(table)
+                ), bounds)
+            else:
+                # A partition can't be created while the default one holds rows of its range: they're moved to
+                # a table attached as the partition afterwards. The posts of the default partition are blocked
+                # until the transaction ends.
+                cursor.execute('LOCK TABLE {0} IN EXCLUSIVE MODE'.format(quote(default)))
+                cursor.execute('CREATE TABLE {0} (LIKE {1} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'.format(
+                    quote(name), quote(table)
+                ))
+                cursor.execute(
+                    'WITH moved AS (DELETE FROM {0} WHERE created_at >= %s AND created_at < %s RETURNING *) '
+                    'INSERT INTO {1} SELECT * FROM moved'.format(quote(default), quote(name)), bounds
+                )
+                cursor.execute('ALTER TABLE {0} ATTACH PARTITION {1} FOR VALUES FROM (%s) TO (%s)'.format(
+                    quote(table), quote(name)
+                ), bounds)
+            created.append(name)
+    return created
+
+
+def convert(connection, last):
+    """
+    Replaces the Post table by a partitioned one holding the same rows, with monthly partitions up to the month
+    of `last` and a default partition catching the rows of the months not created yet. Runs in a transaction,
+    writes to the posts are blocked meanwhile.
+    """
+    quote = connection.ops.quote_name
+    table = Post._meta.db_table
+    old_table = '{0}_unpartitioned'.format(table)
+    with connection.cursor() as cursor:
+        cursor.execute('LOCK TABLE {0} IN EXCLUSIVE MODE'.format(quote(table)))
+        cursor.execute("SELECT pg_get_serial_sequence(%s, 'id'), MIN(created_at) FROM {0}".format(quote(table)), [table])
+        sequence, first = cursor.fetchone()
+        cursor.execute('ALTER TABLE {0} RENAME TO {1}'.format(quote(table), quote(old_table)))
+        # The partition key must be part of the primary key. The check constraints keep their names, so later
+        # migrations find them.
+        cursor.execute(
+            'CREATE TABLE {0} (LIKE {1} INCLUDING DEFAULTS INCLUDING CONSTRAINTS, PRIMARY KEY (id, created_at)) '
+            'PARTITION BY RANGE (created_at)'.format(quote(table), quote(old_table))
+        )
+        for field in ('topic', 'created_by', 'updated_by'):
+            column = Post._meta.get_field(field).column
+            target = Post._meta.get_field(field).related_model._meta.db_table
+            cursor.execute('ALTER TABLE {0} ADD FOREIGN KEY ({1}) REFERENCES {2} (id) DEFERRABLE INITIALLY DEFERRED'.format(
+                quote(table), quote(column), quote(target)
+            ))
+    create_partitions(connection, first or timezone.now(), last)
+    with connection.cursor() as cursor:
+        cursor.execute('CREATE TABLE {0} PARTITION OF {1} DEFAULT'.format(
+            quote(default_partition_name()), quote(table)
+        ))
+        cursor.execute('INSERT INTO {0} SELECT * FROM {1}'.format(quote(table), quote(old_table)))
+        if sequence:
+            cursor.execute('ALTER SEQUENCE {0} OWNED BY {1}.id'.format(sequence, quote(table)))
+        # Checks the deferred foreign keys of the rows written by the transaction, a table with pending checks
+        # can't be dropped.
+        cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+        cursor.execute('DROP TABLE {0}'.format(quote(old_table)))
+        cursor.execute('SET CONSTRAINTS ALL DEFERRED')
+        # Built after the copy, and with the model names so later migrations find them.
+        schema_editor = connection.schema_editor()
+        for index in Post._meta.indexes:
+            cursor.execute(str(index.create_sql(Post, schema_editor)))
+        for field in ('topic', 'created_by', 'updated_by'):
+            cursor.execute('CREATE INDEX ON {0} ({1})'.format(quote(table), quote(Post._meta.get_field(field).column)))
+    _partitioned[connection.alias] = True
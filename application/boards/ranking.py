@@ -0,0 +1,54 @@
+import math
+from datetime import datetime
+
+from django.conf import settings
+from django.db.models import F, FloatField, Value
+from django.db.models.functions import Abs, Exp, Greatest, Least, Ln
+from django.utils import timezone
+
+# Scores are relative to this date to keep them small, only their differences matter.
+EPOCH = datetime(2019, 1, 1, tzinfo=timezone.utc)
+
+# log(1 + exp(-x)) is below the precision of the scores past this difference. PostgreSQL raises an error instead
+# of returning 0 when exp() underflows, e.g. for the first activity of a topic, whose score is 0.
+MAX_DIFFERENCE = 50.0
+
+
+def get_tau():
+    """
+    Returns the decay time constant in seconds, from the `HOT_SCORE_HALF_LIFE` hours.
+    """
+    return getattr(settings, 'HOT_SCORE_HALF_LIFE', 12) * 3600 / math.log(2)
+
+
+def get_weight(event):
+    """
+    Returns the `HOT_SCORE_WEIGHTS` weight of a 'topic', 'reply' or 'view' event.
+    """
+    return getattr(settings, 'HOT_SCORE_WEIGHTS', {}).get(event, 1)
+
+
+def event_score(weight, when=None):
+    """
+    Returns the log of an activity of `weight` that happened at `when`, weighted by exp(time / tau).
+    An activity is worth half as much as the same activity one half-life later. Activities weighing nothing, e.g.
+    with a 0 `HOT_SCORE_WEIGHTS`, score 0 like a topic without activity.
+    """
+    if weight <= 0:
+        return 0.0
+    when = when or timezone.now()
+    return math.log(weight) + (when - EPOCH).total_seconds() / get_tau()
+
+
+def add_event(weight, when=None):
+    """
+    Returns the expression adding an activity to `hot_score` in an UPDATE.
+    The score is the log of the sum of the weighted activities, log(exp(score) + exp(event)), computed as
+    max + log(1 + exp(-|difference|)) so it never overflows. Older activities decay without rewriting the scores.
+    An activity weighing nothing leaves the score as is.
+    """
+    if weight <= 0:
+        return F('hot_score')
+    event = Value(event_score(weight, when), output_field=FloatField())
+    difference = Least(Abs(F('hot_score') - event), Value(MAX_DIFFERENCE))
+    return Greatest(F('hot_score'), event) + Ln(Value(1.0) + Exp(-difference))
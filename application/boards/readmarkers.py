@@ -0,0 +1,64 @@
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection, transaction
+
+from .models import Topic, TopicReadMarker
+
+
+def get_cache():
+    return caches[getattr(settings, 'READ_MARKERS_CACHE', 'default')]
+
+
+def get_pending(user_id):
+    """
+    Returns the markers of the user not written yet, as a {topic id: last read post id} dict.
+    """
+    pending = get_cache().get('readmarkers:{0}'.format(user_id))
+    return pending[1] if pending else {}
+
+
+def mark_read(user_id, topic_id, post_id):
+    """
+    Records that the user read the topic up to `post_id`. The markers of a user are coalesced in the cache and
+    written together once `READ_MARKERS_BATCH` topics are pending or the oldest pending one is
+    `READ_MARKERS_FLUSH_INTERVAL` seconds old. Markers only move forward.
+    Concurrent requests of a user may drop a pending marker, the next visit of the topic records it again.
+    """
+    cache = get_cache()
+    key = 'readmarkers:{0}'.format(user_id)
+    started, markers = cache.get(key) or (time.time(), {})
+    if markers.get(topic_id, 0) >= post_id:
+        return
+    markers[topic_id] = post_id
+    if (len(markers) >= getattr(settings, 'READ_MARKERS_BATCH', 20) or
+            time.time() - started >= getattr(settings, 'READ_MARKERS_FLUSH_INTERVAL', 60)):
+        write(user_id, markers)
+        cache.delete(key)
+    else:
+        # Kept well past the flush interval, in case the user doesn't come back for a while.
+        cache.set(key, (started, markers), getattr(settings, 'READ_MARKERS_TIMEOUT', 7 * 86400))
+
+
+def write(user_id, markers):
+    """
+    Upserts the {topic id: last read post id} markers of the user with a single statement.
+    """
+    topic_ids = set(Topic.objects.filter(pk__in=list(markers)).values_list('pk', flat=True))
+    rows = [(user_id, topic_id, post_id) for topic_id, post_id in markers.items() if topic_id in topic_ids]
+    if not rows:
+        return
+    quote = connection.ops.quote_name
+    table = quote(TopicReadMarker._meta.db_table)
+    # GREATEST on PostgreSQL, the two arguments MAX on SQLite
+    greatest = 'GREATEST' if connection.vendor == 'postgresql' else 'MAX'
+    sql = (
+        'INSERT INTO {table} ({user}, {topic}, {post}) VALUES {values} '
+        'ON CONFLICT ({user}, {topic}) DO UPDATE SET {post} = {greatest}({table}.{post}, excluded.{post})'
+    ).format(
+        table=table, user=quote('user_id'), topic=quote('topic_id'), post=quote('last_read_post_id'),
+        values=', '.join(['(%s, %s, %s)'] * len(rows)), greatest=greatest,
+    )
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(sql, [value for row in rows for value in row])
@@ -0,0 +1,104 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from boards.models import ArchivedPost, ArchivedTopic, Board, Post, Topic, TopicReadMarker
+
+
+class ArchiveTopicsTests(TestCase):
+
+    def setUp(self):
+        self.board = Board.objects.create(name='Django', description='Django board.')
+        self.user = User.objects.create_user(username='john', email='john@doe.com', password='123')
+        self.old_topics = []
+        for i in range(3):
+            topic = Topic.objects.create(subject='Old topic {0}'.format(i), board=self.board, starter=self.user)
+            Post.objects.create(message='Old post {0}'.format(i), topic=topic, created_by=self.user)
+            self.old_topics.append(topic)
+        Topic.objects.update(last_updated=timezone.now() - timedelta(days=365))
+        self.recent = Topic.objects.create(subject='Recent topic', board=self.board, starter=self.user)
+        Post.objects.create(message='Recent post', topic=self.recent, created_by=self.user)
+        TopicReadMarker.objects.create(user=self.user, topic=self.old_topics[0], last_read_post_id=1)
+
+    def archive(self, *args):
+        call_command('archive_topics', '--months=6', *args, stdout=StringIO())
+
+    def test_moves_old_topics_with_their_ids(self):
+        self.archive('--batch-size=2')
+        self.assertEqual([self.recent.pk], list(Topic.objects.values_list('pk', flat=True)))
+        self.assertEqual(
+            [topic.pk for topic in self.old_topics], list(ArchivedTopic.objects.order_by('pk').values_list('pk', flat=True))
+        )
+        self.assertEqual(3, ArchivedPost.objects.count())
+        self.assertEqual(['Recent post'], list(Post.objects.values_list('message', flat=True)))
+        self.assertFalse(TopicReadMarker.objects.exists())
+
+    def test_resumes(self):
+        """
+        Running again after a run moved part of the topics should move the rest.
+        """
+        ArchivedTopic.objects.create(
+            id=self.old_topics[0].pk, subject='Old topic 0', last_updated=self.old_topics[0].last_updated,
+            board=self.board, starter=self.user
+        )
+        Post.objects.filter(topic=self.old_topics[0]).delete()
+        self.old_topics[0].delete()
+        self.archive()
+        self.archive()
+        self.assertEqual(3, ArchivedTopic.objects.count())
+        self.assertEqual(1, Topic.objects.count())
+
+    def test_post_added_during_batch_not_lost(self):
+        """
+        A post added to a topic after its posts were copied should keep the topic out of the batch, not be lost.
+        """
+        bulk_create = ArchivedPost.objects.bulk_create
+        replies = ['Late reply']
+
+        def reply(*args, **kwargs):
+            result = bulk_create(*args, **kwargs)
+            if replies:
+                Post.objects.create(message=replies.pop(), topic=self.old_topics[0], created_by=self.user)
+            return result
+
+        with mock.patch.object(ArchivedPost.objects, 'bulk_create', side_effect=reply):
+            self.archive('--batch-size=1')
+        # Its batch archived nothing, the older topics after it are archived all the same.
+        self.assertEqual(
+            [self.old_topics[0].pk, self.recent.pk], list(Topic.objects.order_by('pk').values_list('pk', flat=True))
+        )
+        self.assertEqual(
+            [topic.pk for topic in self.old_topics[1:]],
+            list(ArchivedTopic.objects.order_by('pk').values_list('pk', flat=True))
+        )
+        # Archived with its late reply by the next run.
+        self.archive()
+        self.assertEqual([self.recent.pk], list(Topic.objects.values_list('pk', flat=True)))
+        self.assertEqual(
+            ['Late reply', 'Old post 0'],
+            sorted(ArchivedPost.objects.filter(topic=self.old_topics[0].pk).values_list('message', flat=True))
+        )
+        self.assertEqual(4, ArchivedPost.objects.count())
+
+    def test_archived_topic_viewable(self):
+        self.archive()
+        self.client.login(username='john', password='123')
+        url = reverse('topic_posts', kwargs={'pk': self.board.pk, 'topic_pk': self.old_topics[1].pk})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, 'Old post 1')
+        self.assertContains(response, 'archived')
+        self.assertNotContains(response, reverse('reply_topic', kwargs={'pk': self.board.pk, 'topic_pk': self.old_topics[1].pk}))
+
+    def test_recount_includes_archived(self):
+        self.archive()
+        call_command('recount_boards', stdout=StringIO())
+        self.board.refresh_from_db()
+        self.assertEqual(4, self.board.topics_count)
+        self.assertEqual(4, self.board.posts_count)
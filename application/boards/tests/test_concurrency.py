@@ -0,0 +1,111 @@
+import threading
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import Client, TestCase, TransactionTestCase, skipUnlessDBFeature
+from django.urls import reverse
+
+from boards.forms import PostForm
+from boards.models import Board, Post, Topic
+
+
+class TopicCountersTestCase:
+    """
+    Creates a topic with its first post, shared by the counter tests.
+    """
+
+    def create_topic(self):
+        self.board = Board.objects.create(name='Django', description='Django board.')
+        self.user = User.objects.create_user(username='john', email='john@doe.com', password='123')
+        self.topic = Topic.objects.create(subject='Hello, world', board=self.board, starter=self.user)
+        Post.objects.create(message='Lorem ipsum dolor sit amet', topic=self.topic, created_by=self.user)
+        self.url = reverse('topic_posts', kwargs={'pk': self.board.pk, 'topic_pk': self.topic.pk})
+
+    def reply(self, topic):
+        form = PostForm({'message': 'hello, world!'}, user=self.user, topic=topic)
+        self.assertTrue(form.is_valid())
+        form.save()
+
+
+class TopicCountersTests(TopicCountersTestCase, TestCase):
+
+    def setUp(self):
+        self.create_topic()
+        self.client.login(username='john', password='123')
+
+    def test_reply_keeps_views_counted_meanwhile(self):
+        """
+        A reply made with a topic loaded before a view was counted should not overwrite that view.
+        """
+        stale_topic = Topic.objects.get(pk=self.topic.pk)
+        self.client.get(self.url)
+        self.reply(stale_topic)
+        self.topic.refresh_from_db()
+        self.assertEqual(1, self.topic.views)
+        self.assertEqual(1, self.topic.reply_count)
+        self.assertGreater(self.topic.last_updated, stale_topic.last_updated)
+
+    def test_view_keeps_replies_made_meanwhile(self):
+        stale_topic = Topic.objects.get(pk=self.topic.pk)
+        self.reply(stale_topic)
+        self.reply(stale_topic)
+        self.client.get(self.url)
+        self.topic.refresh_from_db()
+        self.assertEqual(2, self.topic.reply_count)
+        self.assertEqual(1, self.topic.views)
+
+    def test_interleaved_updates_from_two_instances(self):
+        """
+        The interleaving of the threaded test below, which can't run on SQLite: every update is made through one of
+        two instances fetched before any of them.
+        """
+        topics = [Topic.objects.get(pk=self.topic.pk), Topic.objects.get(pk=self.topic.pk)]
+        iterations = 5
+        for i in range(iterations):
+            for topic in topics:
+                self.reply(topic)
+                self.client.get(self.url)
+        self.topic.refresh_from_db()
+        self.board.refresh_from_db()
+        self.assertEqual(2 * iterations, self.topic.views)
+        self.assertEqual(2 * iterations, self.topic.reply_count)
+        self.assertEqual(2 * iterations, self.board.posts_count)
+
+
+@skipUnlessDBFeature('test_db_allows_multiple_connections')
+class TopicCountersConcurrencyTests(TopicCountersTestCase, TransactionTestCase):
+    """
+    Replies and views hammered from several threads, each with its own connection.
+    """
+    threads = 8
+    iterations = 10
+
+    def setUp(self):
+        self.create_topic()
+
+    def hammer(self, errors):
+        client = Client()
+        client.force_login(self.user)
+        topic = Topic.objects.get(pk=self.topic.pk)
+        try:
+            for i in range(self.iterations):
+                self.reply(topic)
+                client.get(self.url)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            connection.close()
+
+    def test_no_lost_updates(self):
+        errors = []
+        threads = [threading.Thread(target=self.hammer, args=(errors,)) for i in range(self.threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([], errors)
+        self.topic.refresh_from_db()
+        self.board.refresh_from_db()
+        self.assertEqual(self.threads * self.iterations, self.topic.views)
+        self.assertEqual(self.threads * self.iterations, self.topic.reply_count)
+        self.assertEqual(self.threads * self.iterations, self.board.posts_count)
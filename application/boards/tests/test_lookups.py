@@ -0,0 +1,60 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.http import Http404
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+
+from boards import lookups
+from boards.models import Board, Topic
+
+
+class LookupsTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.board = Board.objects.create(name='Django', description='Django board.')
+        self.other_board = Board.objects.create(name='Python', description='Python board.')
+        self.user = User.objects.create_user(username='john', email='john@doe.com', password='123')
+        self.topic = Topic.objects.create(subject='Hello, world', board=self.board, starter=self.user)
+        self.factory = RequestFactory()
+
+    def test_once_per_request(self):
+        request = self.factory.get('/')
+        with self.assertNumQueries(2):
+            topic = lookups.get_topic(request, self.board.pk, self.topic.pk)
+            self.assertIs(topic, lookups.get_topic(request, self.board.pk, self.topic.pk))
+        self.assertEqual(self.board, topic.board)
+
+    def test_cached_between_requests(self):
+        lookups.get_topic(self.factory.get('/'), self.board.pk, self.topic.pk)
+        with self.assertNumQueries(0):
+            topic = lookups.get_topic(self.factory.get('/'), self.board.pk, self.topic.pk)
+        self.assertEqual('Django', topic.board.name)
+
+    def test_invalidated_on_save(self):
+        lookups.get_board(self.factory.get('/'), self.board.pk)
+        self.board.name = 'Django 2'
+        self.board.save()
+        self.assertEqual('Django 2', lookups.get_board(self.factory.get('/'), self.board.pk).name)
+
+    def test_invalidated_on_delete(self):
+        lookups.get_topic(self.factory.get('/'), self.board.pk, self.topic.pk)
+        self.topic.delete()
+        with self.assertRaises(Http404):
+            lookups.get_topic(self.factory.get('/'), self.board.pk, self.topic.pk)
+
+    def test_topic_of_another_board(self):
+        with self.assertRaises(Http404):
+            lookups.get_topic(self.factory.get('/'), self.other_board.pk, self.topic.pk)
+
+    def test_reply_page_resolves_topic_once(self):
+        """
+        The reply page should resolve its topic once, from the cache once it's warm.
+        """
+        self.client.login(username='john', password='123')
+        url = reverse('reply_topic', kwargs={'pk': self.board.pk, 'topic_pk': self.topic.pk})
+        self.client.get(url)
+        with self.assertNumQueries(2):
+            # User, and the posts of the topic
+            self.client.get(url)
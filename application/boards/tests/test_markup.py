@@ -0,0 +1,63 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from boards import markup
+from boards.models import Board, Post, Topic
+
+
+class RenderTests(TestCase):
+
+    def test_markdown(self):
+        self.assertEqual('<p><strong>Hello</strong>, <a href="https://example.com">world</a></p>', markup.render(
+            '**Hello**, [world](https://example.com)'
+        ))
+
+    def test_sanitized(self):
+        html = markup.render('<script>alert(1)</script> [link](javascript:alert(1)) <img src="x" onerror="alert(1)">')
+        self.assertNotIn('<script', html)
+        self.assertNotIn('javascript:', html)
+        self.assertNotIn('<img', html)
+
+
+class PostMessageHtmlTests(TestCase):
+
+    def setUp(self):
+        board = Board.objects.create(name='Django', description='Django board.')
+        self.user = User.objects.create_user(username='john', email='john@doe.com', password='123')
+        self.topic = Topic.objects.create(subject='Hello, world', board=board, starter=self.user)
+        self.post = Post.objects.create(message='*Lorem* ipsum', topic=self.topic, created_by=self.user)
+
+    def test_rendered_on_save(self):
+        self.assertEqual('<p><em>Lorem</em> ipsum</p>', self.post.message_html)
+        self.post.message = '`dolor`'
+        self.post.save(update_fields=['message'])
+        self.post.refresh_from_db()
+        self.assertEqual('<p><code>dolor</code></p>', self.post.message_html)
+
+    def test_edit_renders_again(self):
+        self.client.login(username='john', password='123')
+        url = reverse('edit_post', kwargs={'pk': self.topic.board_id, 'topic_pk': self.topic.pk, 'post_pk': self.post.pk})
+        self.client.post(url, {'message': '**edited**'})
+        self.post.refresh_from_db()
+        self.assertEqual('<p><strong>edited</strong></p>', self.post.message_html)
+
+    def test_topic_page_shows_html(self):
+        self.client.login(username='john', password='123')
+        response = self.client.get(reverse('topic_posts', kwargs={'pk': self.topic.board_id, 'topic_pk': self.topic.pk}))
+        self.assertContains(response, '<em>Lorem</em> ipsum')
+
+    def test_backfill(self):
+        Post.objects.update(message_html='')
+        call_command('render_posts', '--batch-size=1', stdout=StringIO())
+        self.post.refresh_from_db()
+        self.assertEqual('<p><em>Lorem</em> ipsum</p>', self.post.message_html)
+
+    def test_backfill_previews(self):
+        Post.objects.update(preview='')
+        call_command('render_posts', stdout=StringIO())
+        self.post.refresh_from_db()
+        self.assertEqual('*Lorem* ipsum', self.post.preview)
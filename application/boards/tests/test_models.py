@@ -0,0 +1,63 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import reverse
+
+from boards.models import Board, Post, Topic
+
+
+class PostStrTests(TestCase):
+
+    def setUp(self):
+        board = Board.objects.create(name='Django', description='Django board.')
+        user = User.objects.create_user(username='john', email='john@doe.com', password='123')
+        topic = Topic.objects.create(subject='Hello, world', board=board, starter=user)
+        self.post = Post.objects.create(message='Lorem ipsum dolor sit amet', topic=topic, created_by=user)
+
+    def test_str_uses_selected_topic(self):
+        """
+        A topic selected together with the post should be used without any extra query.
+        """
+        post = Post.objects.select_related('topic').get(pk=self.post.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual('Hello, world', str(post))
+
+    def test_str_uses_annotated_subject(self):
+        """
+        The subject annotated by `with_subject` should be used without any extra query.
+        """
+        post = Post.objects.with_subject().get(pk=self.post.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual('Hello, world', str(post))
+
+    def test_str_never_queries(self):
+        """
+        A post loaded without its topic should not trigger a lazy load of the topic.
+        """
+        post = Post.objects.get(pk=self.post.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual('Post #{0}'.format(post.pk), str(post))
+
+
+class PostAdminTests(TestCase):
+
+    def setUp(self):
+        board = Board.objects.create(name='Django', description='Django board.')
+        user = User.objects.create_superuser(username='admin', email='admin@doe.com', password='123')
+        topic = Topic.objects.create(subject='Hello, world', board=board, starter=user)
+        self.post = Post.objects.create(message='Lorem ipsum dolor sit amet', topic=topic, created_by=user)
+        self.client.force_login(user)
+
+    def test_changelist_shows_subjects_in_one_query(self):
+        Post.objects.create(message='Reply', topic=self.post.topic, created_by=self.post.created_by)
+        url = reverse('admin:boards_post_changelist')
+        self.client.get(url)
+        with self.assertNumQueries(4):
+            # User, the two counts and the posts with their topics and authors
+            response = self.client.get(url)
+        self.assertContains(response, 'Hello, world', count=2)
+
+    def test_change_page_named_with_subject(self):
+        response = self.client.get(reverse('admin:boards_post_change', args=[self.post.pk]))
+        # In the breadcrumbs, the topics of the form's choices are named the same.
+        self.assertContains(response, '&rsaquo; Hello, world')
+        self.assertEqual(302, self.client.get(reverse('admin:boards_post_change', args=[0])).status_code)
@@ -0,0 +1,104 @@
+from datetime import datetime, timedelta
+from io import StringIO
+from unittest import skipIf, skipUnless
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from boards import partitioning
+from boards.models import Board, Post, Topic
+
+
+class PartitioningTests(TestCase):
+
+    def test_months(self):
+        months = list(partitioning.months(
+            datetime(2019, 11, 15, tzinfo=timezone.utc), datetime(2020, 2, 1, tzinfo=timezone.utc)
+        ))
+        self.assertEqual([(2019, 11), (2019, 12), (2020, 1), (2020, 2)], [(month.year, month.month) for month in months])
+        self.assertEqual('boards_post_y2019m12', partitioning.partition_name(months[1]))
+
+    @skipIf(partitioning.is_supported(connection), 'Needs a database without partitioning support.')
+    def test_topic_page_shows_posts_dated_before_topic(self):
+        """
+        Without partitions, the posts aren't bounded by the topic creation date.
+        """
+        board = Board.objects.create(name='Django', description='Django board.')
+        user = User.objects.create_user(username='john', email='john@doe.com', password='123')
+        topic = Topic.objects.create(subject='Hello', board=board, starter=user)
+        post = Post.objects.create(message='Imported post', topic=topic, created_by=user)
+        Post.objects.filter(pk=post.pk).update(created_at=topic.created_at - timedelta(days=1))
+        self.client.login(username='john', password='123')
+        response = self.client.get(reverse('topic_posts', kwargs={'pk': board.pk, 'topic_pk': topic.pk}))
+        self.assertContains(response, 'Imported post')
+
+    @skipIf(partitioning.is_supported(connection), 'Needs a database without partitioning support.')
+    def test_other_databases_left_as_is(self):
+        out = StringIO()
+        call_command('partition_posts', '--convert', stdout=out)
+        self.assertIn('needs PostgreSQL', out.getvalue())
+
+
+@skipUnless(partitioning.is_supported(connection), 'Needs PostgreSQL.')
+class PostgreSQLPartitioningTests(TestCase):
+
+    def setUp(self):
+        self.board = Board.objects.create(name='Django', description='Django board.')
+        self.user = User.objects.create_user(username='john', email='john@doe.com', password='123')
+        self.topic = Topic.objects.create(subject='Hello', board=self.board, starter=self.user)
+        self.old = Post.objects.create(message='Old post', topic=self.topic, created_by=self.user)
+        self.new = Post.objects.create(message='New post', topic=self.topic, created_by=self.user)
+        self.topic.created_at = datetime(2019, 3, 2, tzinfo=timezone.utc)
+        self.topic.save()
+        Post.objects.filter(pk=self.old.pk).update(created_at=datetime(2019, 3, 10, tzinfo=timezone.utc))
+        # The conversion is rolled back after each test.
+        self.addCleanup(partitioning._partitioned.clear)
+
+    def get_partitions(self):
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT id, tableoid::regclass::text FROM boards_post')
+            return dict(cursor.fetchall())
+
+    def test_convert(self):
+        call_command('partition_posts', '--convert', stdout=StringIO())
+        self.assertTrue(partitioning.is_partitioned(connection))
+        partitions = self.get_partitions()
+        self.assertEqual('boards_post_y2019m03', partitions[self.old.pk])
+        self.assertEqual(partitioning.partition_name(timezone.now()), partitions[self.new.pk])
+        post = Post.objects.create(message='Reply', topic=self.topic, created_by=self.user)
+        self.assertEqual(partitioning.partition_name(timezone.now()), self.get_partitions()[post.pk])
+
+    def test_message_length_checked_after_conversion(self):
+        call_command('partition_posts', '--convert', stdout=StringIO())
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Post.objects.filter(pk=self.new.pk).update(message='a' * (settings.POST_MESSAGE_MAX_LENGTH + 1))
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(%s) AND contype = %s',
+                [Post._meta.db_table, 'c']
+            )
+            self.assertEqual([('boards_post_message_length',)], cursor.fetchall())
+
+    def test_partition_created_over_default_rows(self):
+        call_command('partition_posts', '--convert', stdout=StringIO())
+        later = timezone.now() + timedelta(days=365 * 2)
+        post = Post.objects.create(message='Future post', topic=self.topic, created_by=self.user)
+        Post.objects.filter(pk=post.pk).update(created_at=later)
+        self.assertEqual(partitioning.default_partition_name(), self.get_partitions()[post.pk])
+        created = partitioning.create_partitions(connection, later, later)
+        self.assertEqual([partitioning.partition_name(later)], created)
+        self.assertEqual(partitioning.partition_name(later), self.get_partitions()[post.pk])
+        self.assertEqual(3, Post.objects.count())
+
+    def test_topic_page_on_partitioned_table(self):
+        call_command('partition_posts', '--convert', stdout=StringIO())
+        self.client.login(username='john', password='123')
+        response = self.client.get(reverse('topic_posts', kwargs={'pk': self.board.pk, 'topic_pk': self.topic.pk}))
+        self.assertContains(response, 'Old post')
+        self.assertContains(response, 'New post')
+        self.assertTrue(partitioning.has_partitions(connection))
@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+
+from boards.forms import NewTopicForm, PostForm, PostUpdateForm
+from boards.models import Board, Post, Topic
+
+
+class PostLengthTests(TestCase):
+
+    def setUp(self):
+        self.board = Board.objects.create(name='Django', description='Django board.')
+        self.user = User.objects.create_user(username='john', email='john@doe.com', password='123')
+        self.topic = Topic.objects.create(subject='Hello, world', board=self.board, starter=self.user)
+        self.longest = 'a' * settings.POST_MESSAGE_MAX_LENGTH
+
+    def test_forms_share_the_limit(self):
+        """
+        A message accepted when creating a topic should be accepted by the other forms, a longer one by none.
+        """
+        forms = [
+            NewTopicForm({'subject': 'Long', 'message': self.longest}, user=self.user, board=self.board),
+            PostForm({'message': self.longest}, user=self.user, topic=self.topic),
+            PostUpdateForm({'message': self.longest}),
+        ]
+        self.assertEqual([True] * 3, [form.is_valid() for form in forms])
+        forms = [
+            NewTopicForm({'subject': 'Long', 'message': self.longest + 'a'}, user=self.user, board=self.board),
+            PostForm({'message': self.longest + 'a'}, user=self.user, topic=self.topic),
+            PostUpdateForm({'message': self.longest + 'a'}),
+        ]
+        self.assertEqual([False] * 3, [form.is_valid() for form in forms])
+
+    def test_database_constraint(self):
+        post = Post.objects.create(message=self.longest, topic=self.topic, created_by=self.user)
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Post.objects.filter(pk=post.pk).update(message=self.longest + 'a')
+
+    def test_preview(self):
+        post = Post.objects.create(message='Lorem\n\nipsum ' + self.longest[:1000], topic=self.topic, created_by=self.user)
+        self.assertEqual(settings.POST_PREVIEW_LENGTH, len(post.preview))
+        self.assertTrue(post.preview.startswith('Lorem ipsum a'))
@@ -0,0 +1,66 @@
+import math
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from boards import ranking
+from boards.models import Board, Topic
+
+
+@override_settings(HOT_SCORE_HALF_LIFE=1)
+class HotScoreTests(TestCase):
+
+    def setUp(self):
+        self.board = board = Board.objects.create(name='Django', description='Django board.')
+        user = User.objects.create_user(username='john', email='john@doe.com', password='123')
+        self.now = timezone.now()
+        self.topic = Topic.objects.create(
+            subject='Hello, world', board=board, starter=user, hot_score=ranking.event_score(1, self.now)
+        )
+
+    def add_event(self, weight, when):
+        Topic.objects.filter(pk=self.topic.pk).update(hot_score=ranking.add_event(weight, when))
+        self.topic.refresh_from_db()
+
+    def test_add_event_sums_activities(self):
+        """
+        The updated score should be the log of the sum of the weighted activities.
+        """
+        self.add_event(2, self.now)
+        self.assertAlmostEqual(math.log(3), self.topic.hot_score - ranking.event_score(1, self.now))
+
+    def test_activity_decays(self):
+        """
+        An activity one half-life old should be worth half of the same activity now.
+        """
+        self.assertAlmostEqual(
+            math.log(2), ranking.event_score(1, self.now) - ranking.event_score(1, self.now - timedelta(hours=1))
+        )
+
+    def test_recent_activity_outranks_old_activity(self):
+        old = ranking.event_score(10, self.now - timedelta(hours=5))
+        self.add_event(1, self.now)
+        self.assertGreater(self.topic.hot_score, old)
+
+    @override_settings(HOT_SCORE_WEIGHTS={'topic': 1, 'reply': 1, 'view': 0})
+    def test_zero_weight_not_counted(self):
+        score = self.topic.hot_score
+        self.client.login(username='john', password='123')
+        response = self.client.get(reverse('topic_posts', kwargs={'pk': self.board.pk, 'topic_pk': self.topic.pk}))
+        self.assertEqual(200, response.status_code)
+        self.topic.refresh_from_db()
+        self.assertEqual(1, self.topic.views)
+        self.assertEqual(score, self.topic.hot_score)
+        self.assertEqual(0, ranking.event_score(0, self.now))
+
+    def test_recount_rebuilds_hot_scores(self):
+        Topic.objects.update(hot_score=0, reply_count=1)
+        call_command('recount_boards', '--hot-scores', stdout=StringIO())
+        self.topic.refresh_from_db()
+        # reply_count was reset from the (missing) posts, only the topic itself is counted
+        self.assertAlmostEqual(ranking.event_score(1, self.topic.last_updated), self.topic.hot_score)
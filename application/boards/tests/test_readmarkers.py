@@ -0,0 +1,80 @@
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from boards import readmarkers
+from boards.models import Board, Post, Topic, TopicReadMarker
+
+
+class ReadMarkersTestCase(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.board = Board.objects.create(name='Django', description='Django board.')
+        self.user = User.objects.create_user(username='john', email='john@doe.com', password='123')
+        self.topic = Topic.objects.create(subject='Hello, world', board=self.board, starter=self.user)
+        self.post = Post.objects.create(message='Lorem ipsum dolor sit amet', topic=self.topic, created_by=self.user)
+
+
+class ReadMarkersTests(ReadMarkersTestCase):
+
+    def test_write_upserts_and_only_moves_forward(self):
+        readmarkers.write(self.user.pk, {self.topic.pk: 5})
+        readmarkers.write(self.user.pk, {self.topic.pk: 3, 999: 1})
+        self.assertEqual([(self.topic.pk, 5)], list(TopicReadMarker.objects.values_list('topic', 'last_read_post_id')))
+        readmarkers.write(self.user.pk, {self.topic.pk: 7})
+        self.assertEqual(7, TopicReadMarker.objects.get().last_read_post_id)
+
+    @override_settings(READ_MARKERS_BATCH=2, READ_MARKERS_FLUSH_INTERVAL=3600)
+    def test_markers_coalesced_until_batch_is_full(self):
+        other = Topic.objects.create(subject='Other', board=self.board, starter=self.user)
+        readmarkers.mark_read(self.user.pk, self.topic.pk, 1)
+        readmarkers.mark_read(self.user.pk, self.topic.pk, 2)
+        self.assertFalse(TopicReadMarker.objects.exists())
+        self.assertEqual({self.topic.pk: 2}, readmarkers.get_pending(self.user.pk))
+        readmarkers.mark_read(self.user.pk, other.pk, 3)
+        self.assertEqual(2, TopicReadMarker.objects.count())
+        self.assertEqual({}, readmarkers.get_pending(self.user.pk))
+
+    @override_settings(READ_MARKERS_FLUSH_INTERVAL=0)
+    def test_markers_written_after_interval(self):
+        readmarkers.mark_read(self.user.pk, self.topic.pk, 1)
+        self.assertTrue(TopicReadMarker.objects.exists())
+
+
+class BoardTopicsUnreadTests(ReadMarkersTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.client.login(username='john', password='123')
+        self.url = reverse('board_topics', kwargs={'pk': self.board.pk})
+        self.topic_url = reverse('topic_posts', kwargs={'pk': self.board.pk, 'topic_pk': self.topic.pk})
+
+    def get_topic(self):
+        return self.client.get(self.url).context['topics'][0]
+
+    def test_unread_until_visited(self):
+        self.assertTrue(self.get_topic().unread)
+        self.client.get(self.topic_url)
+        self.assertFalse(self.get_topic().unread)
+
+    def test_unread_after_new_post(self):
+        self.client.get(self.topic_url)
+        Post.objects.create(message='New reply', topic=self.topic, created_by=self.user)
+        self.assertTrue(self.get_topic().unread)
+        self.assertContains(self.client.get(self.url), 'New posts')
+
+    @override_settings(READ_MARKERS_FLUSH_INTERVAL=0)
+    def test_written_markers(self):
+        self.client.get(self.topic_url)
+        self.assertEqual(self.post.pk, TopicReadMarker.objects.get(user=self.user, topic=self.topic).last_read_post_id)
+        self.assertFalse(self.get_topic().unread)
+
+    def test_unread_flags_in_one_query(self):
+        Topic.objects.create(subject='Other', board=self.board, starter=self.user)
+        self.client.get(self.url)
+        # User (the session and the board are cached), and the topics with their flags
+        with self.assertNumQueries(2):
+            self.client.get(self.url)
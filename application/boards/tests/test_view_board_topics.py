@@ -1,7 +1,8 @@
+from django.contrib.auth.models import User
 from django.test import TestCase
 from django.urls import reverse, resolve
 
-from boards.models import Board
+from boards.models import Board, Post, Topic
 from boards.views import BoardTopicsView
 
 
@@ -48,3 +49,21 @@ class BoardTopicsTests(TestCase):
         new_topic_url = reverse('new_topic', kwargs={'pk': self.board.pk})
         self.assertContains(self.response, 'href="{0}"'.format(homepage_url))
         self.assertContains(self.response, 'href="{0}"'.format(new_topic_url))
+
+
+class BoardTopicsListTests(TestCase):
+
+    def setUp(self):
+        self.board = Board.objects.create(name='Django', description='Django board.')
+        user = User.objects.create_user(username='john', email='john@doe.com', password='123')
+        self.topic = Topic.objects.create(subject='Hello, world', board=self.board, starter=user)
+        Post.objects.create(message='Lorem ipsum dolor sit amet', topic=self.topic, created_by=user)
+        self.response = self.client.get(reverse('board_topics', kwargs={'pk': self.board.pk}))
+
+    def test_board_topics_view_lists_topics(self):
+        """
+        Check if response contains the topics with a link to them and their starter.
+        """
+        topic_posts_url = reverse('topic_posts', kwargs={'pk': self.board.pk, 'topic_pk': self.topic.pk})
+        self.assertContains(self.response, 'href="{0}"'.format(topic_posts_url))
+        self.assertContains(self.response, '<td>john</td>')
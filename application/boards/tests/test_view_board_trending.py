@@ -0,0 +1,42 @@
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import resolve, reverse
+
+from boards.forms import PostForm
+from boards.models import Board, Post, Topic
+from boards.views import BoardTrendingView
+
+
+class BoardTrendingTests(TestCase):
+
+    def setUp(self):
+        self.board = Board.objects.create(name='Django', description='Django board.')
+        self.user = User.objects.create_user(username='john', email='john@doe.com', password='123')
+        self.quiet = Topic.objects.create(subject='Quiet topic', board=self.board, starter=self.user, hot_score=1)
+        self.busy = Topic.objects.create(subject='Busy topic', board=self.board, starter=self.user, hot_score=1)
+        Post.objects.create(message='Lorem ipsum dolor sit amet', topic=self.busy, created_by=self.user)
+        self.url = reverse('board_trending', kwargs={'pk': self.board.pk})
+
+    def test_view_function(self):
+        view = resolve('/boards/1/trending/')
+        self.assertEqual(view.func.view_class, BoardTrendingView)
+
+    def test_reply_ranks_topic_first(self):
+        """
+        A reply should move its topic above the topics without activity.
+        """
+        form = PostForm({'message': 'hello, world!'}, user=self.user, topic=self.busy)
+        self.assertTrue(form.is_valid())
+        form.save()
+        response = self.client.get(self.url)
+        self.assertEqual([self.busy, self.quiet], list(response.context['topics']))
+        self.assertContains(response, 'href="{0}"'.format(reverse('board_topics', kwargs={'pk': self.board.pk})))
+
+    @override_settings(TRENDING_TOPICS=1)
+    def test_lists_top_topics_only(self):
+        response = self.client.get(self.url)
+        self.assertEqual(1, len(response.context['topics']))
+
+    def test_board_topics_links_to_trending(self):
+        response = self.client.get(reverse('board_topics', kwargs={'pk': self.board.pk}))
+        self.assertContains(response, 'href="{0}"'.format(self.url))
@@ -1,7 +1,11 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
 from django.test import TestCase
 from django.urls import reverse, resolve
 
-from boards.models import Board
+from boards.models import Board, Post, Topic
 from boards.views import HomeView
 
 
@@ -31,3 +35,32 @@ class HomeTests(TestCase):
         """
         board_topics_url = reverse('board_topics', kwargs={'pk': self.board.pk})
         self.assertContains(self.response, 'href="{0}"'.format(board_topics_url))
+
+
+class HomeLastPostTests(TestCase):
+
+    def setUp(self):
+        self.board = Board.objects.create(name='Django', description='Django board.')
+        user = User.objects.create_user(username='john', email='john@doe.com', password='123')
+        self.topic = Topic.objects.create(subject='Hello, world', board=self.board, starter=user)
+        Post.objects.create(message='Lorem ipsum dolor sit amet', topic=self.topic, created_by=user)
+        Post.objects.create(message='Consectetur adipiscing elit', topic=self.topic, created_by=user)
+        # The objects are created directly, not through the forms maintaining the counters.
+        call_command('recount_boards', stdout=StringIO())
+        self.response = self.client.get(reverse('home'))
+
+    def test_home_view_contains_counts(self):
+        """
+        Boards should be listed with their posts and topics counts.
+        """
+        board = self.response.context['object_list'][0]
+        self.assertEqual(2, board.posts_count)
+        self.assertEqual(1, board.topics_count)
+
+    def test_home_view_contains_link_to_last_post(self):
+        """
+        Check if response contains a link to the topic of the last post, by its author.
+        """
+        topic_posts_url = reverse('topic_posts', kwargs={'pk': self.board.pk, 'topic_pk': self.topic.pk})
+        self.assertContains(self.response, 'href="{0}"'.format(topic_posts_url))
+        self.assertContains(self.response, 'By john')
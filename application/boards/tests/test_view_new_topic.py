@@ -1,3 +1,6 @@
+from unittest import mock
+
+from django.db import DatabaseError
 from django.test import TestCase
 from django.urls import reverse, resolve
 from django.contrib.auth.models import User
@@ -63,6 +66,28 @@ class NewTopicTests(TestCase):
         self.assertTrue(Topic.objects.exists())
         self.assertTrue(Post.objects.exists())
 
+    def test_new_topic_updates_board_counters(self):
+        """
+        Creating a topic should count the topic and its first post on the board.
+        """
+        self.client.post(self.url, {'subject': 'Test title', 'message': 'Lorem ipsum dolor sit amet'})
+        self.board.refresh_from_db()
+        self.assertEqual(1, self.board.topics_count)
+        self.assertEqual(1, self.board.posts_count)
+
+    def test_new_topic_is_atomic(self):
+        """
+        The topic should not be kept when its first post can't be saved.
+        """
+        form = NewTopicForm({'subject': 'Test title', 'message': 'Lorem ipsum'}, user=self.user, board=self.board)
+        self.assertTrue(form.is_valid())
+        with mock.patch.object(Post.objects, 'create', side_effect=DatabaseError):
+            with self.assertRaises(DatabaseError):
+                form.save()
+        self.assertFalse(Topic.objects.exists())
+        self.board.refresh_from_db()
+        self.assertEqual(0, self.board.topics_count)
+
     def test_new_topic_invalid_post_data(self):
         """
         Invalid post data should not redirect. The expected behavior is to show the form again with validation errors.
@@ -0,0 +1,68 @@
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.urls import resolve, reverse
+
+from boards.forms import PostForm
+from boards.models import Board, Post, Topic
+from boards.views import ReplyTopicView
+
+
+class ReplyTopicTestCase(TestCase):
+    """
+    Base test case to be used in all `reply_topic` view tests
+    """
+    def setUp(self):
+        self.board = Board.objects.create(name='Django', description='Django board.')
+        self.username = 'john'
+        self.password = '123'
+        self.user = User.objects.create_user(username=self.username, email='john@doe.com', password=self.password)
+        self.topic = Topic.objects.create(subject='Hello, world', board=self.board, starter=self.user)
+        Post.objects.create(message='Lorem ipsum dolor sit amet', topic=self.topic, created_by=self.user)
+        self.url = reverse('reply_topic', kwargs={'pk': self.board.pk, 'topic_pk': self.topic.pk})
+
+
+class ReplyTopicTests(ReplyTopicTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.client.login(username=self.username, password=self.password)
+        self.response = self.client.get(self.url)
+
+    def test_status_code(self):
+        self.assertEqual(self.response.status_code, 200)
+
+    def test_view_function(self):
+        view = resolve('/boards/1/topics/1/reply')
+        self.assertEqual(view.func.view_class, ReplyTopicView)
+
+    def test_contains_form(self):
+        form = self.response.context.get('form')
+        self.assertIsInstance(form, PostForm)
+
+    def test_contains_posts(self):
+        """
+        The reply page should list the posts of the topic below the form.
+        """
+        self.assertContains(self.response, 'Lorem ipsum dolor sit amet')
+
+
+class SuccessfulReplyTopicTests(ReplyTopicTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.client.login(username=self.username, password=self.password)
+        self.response = self.client.post(self.url, {'message': 'hello, world!'})
+
+    def test_redirection(self):
+        """
+        A valid form submission should redirect the user to the topic posts
+        """
+        topic_posts_url = reverse('topic_posts', kwargs={'pk': self.board.pk, 'topic_pk': self.topic.pk})
+        self.assertRedirects(self.response, topic_posts_url)
+
+    def test_reply_created(self):
+        self.assertEqual(Post.objects.count(), 2)
+
+    def test_reply_counted_on_board(self):
+        self.board.refresh_from_db()
+        self.assertEqual(1, self.board.posts_count)
@@ -1,18 +1,38 @@
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Count
+from django.db import connection
+from django.db.models import F, OuterRef, Subquery
+from django.http import Http404
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse, reverse_lazy
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.views.generic import ListView, DetailView, CreateView, UpdateView
 
+from boards import lookups, partitioning, ranking, readmarkers
 from boards.forms import NewTopicForm, PostForm, PostUpdateForm
-from .models import Board, Topic, Post
+from core.ratelimit import RateLimitMixin
+from .models import ArchivedTopic, Board, Topic, TopicReadMarker, Post
 
 
 class HomeView(ListView):
     template_name = 'boards/boards.html'
     model = Board
-    queryset = Board.objects.all()
+
+    def get_queryset(self):
+        last_post = Post.objects.filter(topic__board=OuterRef('pk')).order_by('-created_at')
+        return Board.objects.annotate(last_post_pk=Subquery(last_post.values('pk')[:1]))
+
+    def get_context_data(self, **kwargs):
+        context = super(HomeView, self).get_context_data(**kwargs)
+        boards = list(context['object_list'])
+        last_posts = Post.objects.select_related('created_by').defer('message', 'message_html').in_bulk(
+            [board.last_post_pk for board in boards if board.last_post_pk]
+        )
+        for board in boards:
+            board.last_post = last_posts.get(board.last_post_pk)
+        context['object_list'] = context['board_list'] = boards
+        return context
 
 
 class BoardTopicsView(DetailView):
@@ -21,28 +41,68 @@ class BoardTopicsView(DetailView):
     context_object_name = 'board'
 
     def get_object(self, queryset=None):
-        return get_object_or_404(Board, pk=self.kwargs['pk'])
+        return lookups.get_board(self.request, self.kwargs['pk'])
 
     def get_context_data(self, **kwargs):
         context = super(BoardTopicsView, self).get_context_data(**kwargs)
-        context['topics'] = self.get_object().topics.order_by('-last_updated').annotate(replies=Count('posts') - 1)
+        context['topics'] = self.with_unread(self.get_topics())
+        return context
+
+    def get_topics(self):
+        return self.object.topics.select_related('starter').order_by('-last_updated')
+
+    def with_unread(self, topics):
+        """
+        Evaluates the topics with their last post and the user's read marker in the same query,
+        and flags the ones with posts the user didn't read.
+        """
+        user = self.request.user
+        if not user.is_authenticated:
+            return topics
+        last_post = Post.objects.filter(topic=OuterRef('pk')).order_by('-pk').values('pk')[:1]
+        last_read = TopicReadMarker.objects.filter(user=user, topic=OuterRef('pk')).values('last_read_post_id')[:1]
+        topics = list(topics.annotate(last_post_pk=Subquery(last_post), last_read_pk=Subquery(last_read)))
+        pending = readmarkers.get_pending(user.pk)
+        for topic in topics:
+            last_read_pk = max(topic.last_read_pk or 0, pending.get(topic.pk, 0))
+            topic.unread = (topic.last_post_pk or 0) > last_read_pk
+        return topics
+
+
+class BoardTrendingView(BoardTopicsView):
+    """
+    Lists the `TRENDING_TOPICS` topics of the board with the highest hot score, read from the index.
+    """
+
+    def get_context_data(self, **kwargs):
+        context = super(BoardTrendingView, self).get_context_data(**kwargs)
+        context['trending'] = True
         return context
 
+    def get_topics(self):
+        topics = self.object.topics.select_related('starter').order_by('-hot_score')
+        return topics[:getattr(settings, 'TRENDING_TOPICS', 20)]
+
 
-class NewTopicView(LoginRequiredMixin, CreateView):
+class NewTopicView(LoginRequiredMixin, RateLimitMixin, CreateView):
     template_name = 'boards/new_topic.html'
     model = Topic
     form_class = NewTopicForm
+    ratelimit_scope = 'new_topic'
+
+    @cached_property
+    def board(self):
+        return lookups.get_board(self.request, self.kwargs['pk'])
 
     def get_context_data(self, **kwargs):
         context = super(NewTopicView, self).get_context_data(**kwargs)
-        context['board'] = get_object_or_404(Board, pk=self.kwargs['pk'])
+        context['board'] = self.board
         return context
 
     def get_form_kwargs(self):
         kwargs = super(NewTopicView, self).get_form_kwargs()
         kwargs['user'] = self.request.user
-        kwargs['board'] = get_object_or_404(Board, pk=self.kwargs['pk'])
+        kwargs['board'] = self.board
         return kwargs
 
     def form_valid(self, form):
@@ -58,26 +118,49 @@ class TopicPostsView(LoginRequiredMixin, DetailView):
     context_object_name = 'topic'
 
     def get_object(self, queryset=None):
-        topic = get_object_or_404(Topic, board__pk=self.kwargs['pk'], pk=self.kwargs['topic_pk'])
+        try:
+            topic = lookups.get_topic(self.request, self.kwargs['pk'], self.kwargs['topic_pk'])
+        except Http404:
+            # Archived topics keep their ids, their URLs keep working.
+            return get_object_or_404(
+                ArchivedTopic.objects.select_related('board'), board__pk=self.kwargs['pk'], pk=self.kwargs['topic_pk']
+            )
+        Topic.objects.filter(pk=topic.pk).update(
+            views=F('views') + 1, hot_score=ranking.add_event(ranking.get_weight('view'))
+        )
         topic.views += 1
-        topic.save()
         return topic
 
+    def get_context_data(self, **kwargs):
+        context = super(TopicPostsView, self).get_context_data(**kwargs)
+        posts = self.object.posts.select_related('created_by__profile').order_by('created_at')
+        if getattr(self.object, 'created_at', None) and partitioning.has_partitions(connection):
+            # Bounds the scan to the partitions from the topic creation on. Posts dated before their topic
+            # (imported or back-dated rows) would be left out, the bound is only worth it on partitions.
+            posts = posts.filter(created_at__gte=self.object.created_at)
+        context['posts'] = list(posts)
+        context['archived'] = isinstance(self.object, ArchivedTopic)
+        if context['posts'] and not context['archived']:
+            readmarkers.mark_read(self.request.user.pk, self.object.pk, max(post.pk for post in context['posts']))
+        return context
+
 
-class ReplyTopicView(LoginRequiredMixin, CreateView):
+class ReplyTopicView(LoginRequiredMixin, RateLimitMixin, CreateView):
     template_name = 'boards/reply_topic.html'
     model = Post
     form_class = PostForm
+    ratelimit_scope = 'reply_topic'
 
     def get_context_data(self, **kwargs):
         context = super(ReplyTopicView, self).get_context_data(**kwargs)
-        context['topic'] = get_object_or_404(Topic, board__pk=self.kwargs['pk'], pk=self.kwargs['topic_pk'])
+        context['topic'] = lookups.get_topic(self.request, self.kwargs['pk'], self.kwargs['topic_pk'])
+        context['posts'] = context['topic'].posts.select_related('created_by').order_by('created_at')
         return context
 
     def get_form_kwargs(self):
         kwargs = super(ReplyTopicView, self).get_form_kwargs()
         kwargs['user'] = self.request.user
-        kwargs['topic'] = get_object_or_404(Topic, board__pk=self.kwargs['pk'], pk=self.kwargs['topic_pk'])
+        kwargs['topic'] = lookups.get_topic(self.request, self.kwargs['pk'], self.kwargs['topic_pk'])
         return kwargs
 
     def form_valid(self, form):
@@ -93,7 +176,13 @@ class PostUpdateView(LoginRequiredMixin, UpdateView):
     template_name = 'boards/edit_post.html'
 
     def get_object(self, queryset=None):
-        return get_object_or_404(Post, pk=self.kwargs['post_pk'], created_by=self.request.user)
+        return get_object_or_404(
+            Post.objects.select_related('topic__board'),
+            pk=self.kwargs['post_pk'],
+            topic__pk=self.kwargs['topic_pk'],
+            topic__board__pk=self.kwargs['pk'],
+            created_by=self.request.user
+        )
 
     def form_valid(self, form):
         form.instance.updated_by = self.request.user
@@ -101,4 +190,4 @@ class PostUpdateView(LoginRequiredMixin, UpdateView):
         return super(PostUpdateView, self).form_valid(form)
 
     def get_success_url(self):
-        return reverse('topic_posts', args=[self.get_object().topic.board.pk, self.get_object().topic.pk])
+        return reverse('topic_posts', kwargs={'pk': self.kwargs['pk'], 'topic_pk': self.kwargs['topic_pk']})
@@ -0,0 +1,240 @@
+"""
+Load generator replaying forum traffic against a running server, see `manage.py loadtest`.
+Every virtual user is an asyncio task sending one request at a time over plain HTTP/1.1 connections.
+"""
+import asyncio
+import bisect
+import random
+import re
+import time
+from collections import defaultdict
+from urllib.parse import urlencode
+
+from django.urls import reverse
+
+CSRF_TOKEN = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+
+# Upper bounds of the latency histogram buckets, in milliseconds.
+HISTOGRAM_BOUNDS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+
+DEFAULT_MIX = {
+    'browse': 40, 'read': 30, 'reply': 8, 'new_topic': 2, 'edit': 5, 'login': 10, 'password_reset': 5,
+}
+
+
+def parse_mix(value):
+    """
+    Parses a scenario mix like 'browse=40,read=30' into a {scenario: weight} dict.
+    """
+    mix = {}
+    for item in value.split(','):
+        name, weight = item.split('=')
+        if name.strip() not in SCENARIOS:
+            raise ValueError('Unknown scenario {0}, expected one of {1}.'.format(name, ', '.join(SCENARIOS)))
+        mix[name.strip()] = float(weight)
+    return mix
+
+
+class Response:
+
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def csrf_token(self):
+        match = CSRF_TOKEN.search(self.body.decode('utf-8', 'replace'))
+        return match.group(1) if match else ''
+
+
+class Stats:
+    """
+    Latencies, statuses and errors per URL name.
+    """
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+
+    def record(self, name, seconds, status):
+        self.latencies[name].append(seconds)
+        self.statuses[name][status] += 1
+        # Redirects are the expected answer to the form posts, 0 is a failed connection.
+        if not 0 < status < 400:
+            self.errors[name] += 1
+
+    @property
+    def count(self):
+        return sum(len(latencies) for latencies in self.latencies.values())
+
+    def summary(self, name):
+        """
+        Returns the count, error count and p50, p90, p99 and max latencies in seconds of a URL name.
+        """
+        latencies = sorted(self.latencies[name])
+        count = len(latencies)
+
+        def percentile(p):
+            return latencies[min(count - 1, int(count * p))]
+
+        return count, self.errors[name], percentile(0.5), percentile(0.9), percentile(0.99), latencies[-1]
+
+    def histogram(self, name):
+        """
+        Returns the number of requests of each HISTOGRAM_BOUNDS bucket, plus the slower ones last.
+        """
+        buckets = [0] * (len(HISTOGRAM_BOUNDS) + 1)
+        for seconds in self.latencies[name]:
+            buckets[bisect.bisect_left(HISTOGRAM_BOUNDS, seconds * 1000)] += 1
+        return buckets
+
+
+class Client:
+    """
+    A virtual user with its cookies, sending `Connection: close` requests.
+    """
+
+    def __init__(self, host, port, stats, timeout=30):
+        self.host = host
+        self.port = port
+        self.stats = stats
+        self.timeout = timeout
+        self.cookies = {}
+        self.logged_in = False
+
+    async def request(self, name, method, path, data=None):
+        body = urlencode(data).encode() if data is not None else b''
+        lines = [
+            '{0} {1} HTTP/1.1'.format(method, path),
+            'Host: {0}:{1}'.format(self.host, self.port),
+            'Connection: close',
+        ]
+        if self.cookies:
+            lines.append('Cookie: {0}'.format('; '.join('{0}={1}'.format(*cookie) for cookie in self.cookies.items())))
+        if data is not None:
+            lines += ['Content-Type: application/x-www-form-urlencoded', 'Content-Length: {0}'.format(len(body))]
+        started = time.perf_counter()
+        try:
+            raw = await asyncio.wait_for(self.exchange('\r\n'.join(lines).encode('latin-1') + b'\r\n\r\n' + body),
+                                         self.timeout)
+            response = self.parse(raw)
+        except (OSError, ValueError, asyncio.TimeoutError):
+            response = Response(0, [], b'')
+        self.stats.record(name, time.perf_counter() - started, response.status)
+        return response
+
+    async def exchange(self, request):
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            writer.write(request)
+            await writer.drain()
+            return await reader.read()
+        finally:
+            writer.close()
+
+    def parse(self, raw):
+        head, _, body = raw.partition(b'\r\n\r\n')
+        lines = head.decode('latin-1').split('\r\n')
+        status = int(lines[0].split()[1])
+        headers = [tuple(part.strip() for part in line.split(':', 1)) for line in lines[1:] if ':' in line]
+        for header, value in headers:
+            if header.lower() == 'set-cookie':
+                cookie = value.split(';')[0]
+                key, _, cookie_value = cookie.partition('=')
+                if cookie_value and 'max-age=0' not in value.lower():
+                    self.cookies[key] = cookie_value
+                else:
+                    self.cookies.pop(key, None)
+        return Response(status, headers, body)
+
+    async def get(self, name, path):
+        return await self.request(name, 'GET', path)
+
+    async def submit(self, name, path, data):
+        """
+        Gets the form page then posts `data` with its CSRF token, both recorded under `name`.
+        """
+        page = await self.get(name, path)
+        return await self.request(name, 'POST', path, dict(data, csrfmiddlewaretoken=page.csrf_token()))
+
+
+async def login(client, fixtures, user):
+    response = await client.submit('login', reverse('login'), {'username': user['username'], 'password': user['password']})
+    client.logged_in = response.status == 302
+    return response
+
+
+async def ensure_login(client, fixtures, user):
+    if not client.logged_in:
+        await login(client, fixtures, user)
+
+
+async def browse(client, fixtures, user):
+    await client.get('home', reverse('home'))
+    await client.get('board_topics', reverse('board_topics', args=[random.choice(fixtures['boards'])]))
+
+
+async def read(client, fixtures, user):
+    await ensure_login(client, fixtures, user)
+    await client.get('topic_posts', reverse('topic_posts', args=random.choice(fixtures['topics'])))
+
+
+async def reply(client, fixtures, user):
+    await ensure_login(client, fixtures, user)
+    path = reverse('reply_topic', args=random.choice(fixtures['topics']))
+    await client.submit('reply_topic', path, {'message': 'Load test reply {0}'.format(random.random())})
+
+
+async def new_topic(client, fixtures, user):
+    await ensure_login(client, fixtures, user)
+    path = reverse('new_topic', args=[random.choice(fixtures['boards'])])
+    await client.submit('new_topic', path, {
+        'subject': 'Load test topic', 'message': 'Load test message {0}'.format(random.random())
+    })
+
+
+async def edit(client, fixtures, user):
+    if not user['posts']:
+        return await read(client, fixtures, user)
+    await ensure_login(client, fixtures, user)
+    path = reverse('edit_post', args=random.choice(user['posts']))
+    await client.submit('edit_post', path, {'message': 'Load test edit {0}'.format(random.random())})
+
+
+async def password_reset(client, fixtures, user):
+    await client.submit('password_reset', reverse('password_reset'), {'email': user['email']})
+
+
+SCENARIOS = {
+    'browse': browse,
+    'read': read,
+    'reply': reply,
+    'new_topic': new_topic,
+    'edit': edit,
+    'login': login,
+    'password_reset': password_reset,
+}
+
+
+async def virtual_user(host, port, stats, fixtures, user, mix, deadline):
+    client = Client(host, port, stats)
+    names, weights = list(mix), list(mix.values())
+    while time.monotonic() < deadline:
+        await SCENARIOS[random.choices(names, weights)[0]](client, fixtures, user)
+
+
+async def run(host, port, fixtures, mix, clients, duration):
+    """
+    Runs `clients` virtual users for `duration` seconds, returns the Stats and the elapsed seconds.
+    `fixtures` holds the board pks, the (board pk, topic pk) of the topics and the users, dicts with their
+    username, password, email and the (board pk, topic pk, post pk) of their posts.
+    """
+    stats = Stats()
+    started = time.monotonic()
+    deadline = started + duration
+    users = fixtures['users']
+    await asyncio.gather(*[
+        virtual_user(host, port, stats, fixtures, users[i % len(users)], mix, deadline) for i in range(clients)
+    ])
+    return stats, time.monotonic() - started
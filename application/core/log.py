@@ -0,0 +1,180 @@
+"""
+Logging pipeline: the handlers of `LOGGING` run on background threads, the logging call only queues the record
+(see `configure`, the `LOGGING_CONFIG` function). The mails to the admins have their own thread, so a stalled SMTP
+server doesn't hold the other records, and each queue holds at most `LOG_QUEUE_SIZE` records, the records past it
+are dropped and counted (see `dropped`). Records are stamped with the request id, user id and URL name of the
+request being handled, and `JsonFormatter` writes them as JSON lines.
+"""
+import atexit
+import json
+import logging
+import logging.config
+import os
+import queue
+import random
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+from django.conf import settings
+from django.utils.log import AdminEmailHandler
+
+_context = threading.local()
+_lock = threading.Lock()
+_listeners = {}
+_queues = {}
+_dropped = {}
+
+CHANNELS = ('default', 'mail')
+
+CONTEXT_FIELDS = ('request_id', 'user_id', 'url_name')
+EXTRA_FIELDS = CONTEXT_FIELDS + ('method', 'path', 'status', 'duration_ms', 'queries')
+
+
+def set_context(**context):
+    """
+    Sets the fields stamped on the records logged by the current thread, e.g. request_id.
+    """
+    _context.fields = dict(getattr(_context, 'fields', {}), **context)
+
+
+def clear_context():
+    _context.fields = {}
+
+
+def make_record_factory(factory):
+    """
+    Wraps a log record factory to stamp the context fields of the current thread on the records.
+    """
+
+    def record_factory(*args, **kwargs):
+        record = factory(*args, **kwargs)
+        record.__dict__.update(getattr(_context, 'fields', {}))
+        return record
+
+    record_factory.stamps_context = True
+    return record_factory
+
+
+def get_channel(handler):
+    return 'mail' if isinstance(handler, AdminEmailHandler) else 'default'
+
+
+class QueuedHandler(QueueHandler):
+    """
+    Queues the records for its `target` handler, which handles them on the listener thread of its channel.
+    """
+
+    def __init__(self, target):
+        super(QueuedHandler, self).__init__(None)
+        self.target = target
+        self.channel = get_channel(target)
+        self.setLevel(target.level)
+
+    def prepare(self, record):
+        # The record is handled as is by the target, e.g. AdminEmailHandler needs its exc_info and request.
+        return record
+
+    def enqueue(self, record):
+        try:
+            _queues[self.channel].put_nowait((self.target, record))
+        except queue.Full:
+            with _lock:
+                _dropped[self.channel] += 1
+
+
+class TargetListener(QueueListener):
+    """
+    Hands each queued record to the handler it was queued for.
+    """
+
+    def enqueue_sentinel(self):
+        # Waits for room in a full queue, the listener is emptying it.
+        self.queue.put(self._sentinel)
+
+    def handle(self, item):
+        target, record = item
+        target.handle(record)
+
+
+def start_listener():
+    """
+    Starts a listener thread per channel, with empty queues.
+    """
+    for channel in CHANNELS:
+        _queues[channel] = queue.Queue(getattr(settings, 'LOG_QUEUE_SIZE', 10000))
+        _dropped[channel] = 0
+        _listeners[channel] = TargetListener(_queues[channel])
+        _listeners[channel].start()
+
+
+def stop_listener():
+    """
+    Handles the records still queued and stops the listener threads.
+    """
+    for listener in _listeners.values():
+        if listener._thread is not None:
+            listener.stop()
+
+
+def dropped():
+    """
+    Returns the number of records dropped per channel because its queue was full, since the listeners started.
+    """
+    with _lock:
+        return dict(_dropped)
+
+
+def configure(config):
+    """
+    Configures logging from `config` like logging.config.dictConfig, then moves the handlers of the configured
+    loggers behind a QueuedHandler each. The records are stamped with the context fields when created.
+    """
+    logging.config.dictConfig(config)
+    if not getattr(logging.getLogRecordFactory(), 'stamps_context', False):
+        logging.setLogRecordFactory(make_record_factory(logging.getLogRecordFactory()))
+    if not _listeners:
+        start_listener()
+        atexit.register(stop_listener)
+        # Threads don't survive a fork, e.g. from a preloading master to its workers.
+        os.register_at_fork(after_in_child=start_listener)
+    # Every logger with handlers, also the ones configured by Django's DEFAULT_LOGGING before `config`.
+    loggers = [logging.getLogger()] + [
+        logger for logger in logging.Logger.manager.loggerDict.values() if isinstance(logger, logging.Logger)
+    ]
+    for logger in loggers:
+        logger.handlers = [
+            handler if isinstance(handler, QueuedHandler) else QueuedHandler(handler) for handler in logger.handlers
+        ]
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Lets through the `rate` fraction of the records below WARNING, and every other record.
+    """
+
+    def __init__(self, rate=1.0):
+        super(SamplingFilter, self).__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        return record.levelno >= logging.WARNING or random.random() < self.rate
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats a record as a JSON object with its request context and access log fields.
+    """
+
+    def format(self, record):
+        data = {
+            'time': self.formatTime(record),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        for field in EXTRA_FIELDS:
+            if getattr(record, field, None) is not None:
+                data[field] = getattr(record, field)
+        if record.exc_info:
+            data['exception'] = self.formatException(record.exc_info)
+        return json.dumps(data, default=str)
@@ -0,0 +1,146 @@
+import asyncio
+import random
+import threading
+from urllib.parse import urlsplit
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler, get_internal_wsgi_application
+from django.test.utils import override_settings
+
+from boards.models import Board, Post, Topic
+from core import loadtest
+
+USERNAME_PREFIX = 'loadtest_'
+PASSWORD = 'loadtest-password'
+BOARD_NAME = 'Load test'
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+
+    def log_message(self, *args):
+        pass
+
+
+class LoadTestServer(ThreadedWSGIServer):
+    # Room for every client connecting at once, socketserver's default backlog is 5.
+    request_queue_size = 1024
+
+
+class Command(BaseCommand):
+    help = (
+        'Replays a mix of forum traffic (browsing, reading, replies, new topics, edits, logins, password resets) '
+        'from concurrent virtual users and reports the throughput, the latencies and the errors per URL name. '
+        'Without --url the application is served in process, with the locmem email backend and no rate limits. '
+        'The users and topics are read from the database, which must be the one of the server, only the topics of '
+        'the board created by --setup are posted to.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', help='Base URL of a running server, e.g. http://127.0.0.1:8000.')
+        parser.add_argument('--clients', type=int, default=20, help='Number of concurrent virtual users.')
+        parser.add_argument('--duration', type=float, default=30, help='Seconds to run.')
+        parser.add_argument(
+            '--mix', type=loadtest.parse_mix, default=loadtest.DEFAULT_MIX,
+            help='Weights of the scenarios, default {0}.'.format(
+                ','.join('{0}={1}'.format(*item) for item in loadtest.DEFAULT_MIX.items())
+            )
+        )
+        parser.add_argument('--users', type=int, default=10, help='Number of user accounts shared by the clients.')
+        parser.add_argument(
+            '--setup', action='store_true',
+            help='Create the {0}* users and a board with topics when missing.'.format(USERNAME_PREFIX)
+        )
+        parser.add_argument('--seed', type=int, help='Seed of the random choices, to replay the same traffic.')
+        parser.add_argument('--histograms', action='store_true', help='Also print the latency histograms.')
+
+    def handle(self, *args, **options):
+        if options['seed'] is not None:
+            random.seed(options['seed'])
+        if options['setup']:
+            self.setup(options['users'])
+        fixtures = self.get_fixtures(options['users'])
+
+        if options['url']:
+            url = urlsplit(options['url'])
+            stats, elapsed = self.run(url.hostname, url.port or 80, fixtures, options)
+        else:
+            with override_settings(
+                EMAIL_BACKEND='django.core.mail.backends.locmem.EmailBackend', RATELIMIT_ENABLED=False
+            ):
+                server = LoadTestServer(('127.0.0.1', 0), QuietRequestHandler)
+                server.set_app(get_internal_wsgi_application())
+                thread = threading.Thread(target=server.serve_forever, daemon=True)
+                thread.start()
+                try:
+                    stats, elapsed = self.run('127.0.0.1', server.server_address[1], fixtures, options)
+                finally:
+                    server.shutdown()
+                    server.server_close()
+        self.report(stats, elapsed, options['histograms'])
+
+    def run(self, host, port, fixtures, options):
+        self.stdout.write('Running {0} clients for {1:.0f}s against {2}:{3}...'.format(
+            options['clients'], options['duration'], host, port
+        ))
+        return asyncio.run(loadtest.run(host, port, fixtures, options['mix'], options['clients'], options['duration']))
+
+    def setup(self, users):
+        user_model = get_user_model()
+        accounts = []
+        for i in range(users):
+            username = '{0}{1}'.format(USERNAME_PREFIX, i)
+            user = user_model.objects.filter(username=username).first()
+            if user is None:
+                user = user_model.objects.create_user(username, '{0}@example.com'.format(username), PASSWORD)
+            accounts.append(user)
+        board, created = Board.objects.get_or_create(name=BOARD_NAME, defaults={'description': 'Load test board.'})
+        for i in range(max(0, 10 - board.topics.count())):
+            topic = Topic.objects.create(subject='Load test topic {0}'.format(i), board=board, starter=accounts[0])
+            for user in accounts:
+                Post.objects.create(message='Load test post', topic=topic, created_by=user)
+
+    def get_fixtures(self, users):
+        accounts = list(get_user_model().objects.filter(username__startswith=USERNAME_PREFIX).order_by('pk')[:users])
+        # The scenarios reply, create topics and edit posts, never in the real boards.
+        topics = list(Topic.objects.filter(board__name=BOARD_NAME).order_by('-last_updated').values_list(
+            'board', 'pk'
+        )[:100])
+        if not accounts or not topics:
+            raise CommandError('No load test users or topics, run with --setup first.')
+        fixtures = {
+            'boards': sorted({board for board, topic in topics}),
+            'topics': [list(topic) for topic in topics],
+            'users': [],
+        }
+        for user in accounts:
+            posts = Post.objects.filter(created_by=user, topic__board__name=BOARD_NAME).order_by('-pk').values_list('topic__board', 'topic', 'pk')
+            fixtures['users'].append({
+                'username': user.username, 'password': PASSWORD, 'email': user.email,
+                'posts': [list(post) for post in posts[:20]],
+            })
+        return fixtures
+
+    def report(self, stats, elapsed, histograms):
+        total = stats.count
+        errors = sum(stats.errors.values())
+        self.stdout.write('\n{0} requests in {1:.1f}s, {2:.1f} requests/s, {3} errors ({4:.1%}).\n'.format(
+            total, elapsed, total / elapsed if elapsed else 0, errors, errors / total if total else 0
+        ))
+        self.stdout.write('{0:<16} {1:>8} {2:>7} {3:>9} {4:>9} {5:>9} {6:>9}'.format(
+            'URL name', 'requests', 'errors', 'p50 [ms]', 'p90 [ms]', 'p99 [ms]', 'max [ms]'
+        ))
+        for name in sorted(stats.latencies):
+            count, failed, p50, p90, p99, slowest = stats.summary(name)
+            self.stdout.write('{0:<16} {1:>8} {2:>7} {3:>9.1f} {4:>9.1f} {5:>9.1f} {6:>9.1f}'.format(
+                name, count, failed, p50 * 1000, p90 * 1000, p99 * 1000, slowest * 1000
+            ))
+            statuses = ', '.join('{0}: {1}'.format(*status) for status in sorted(stats.statuses[name].items()))
+            self.stdout.write('{0:<16} statuses {1}'.format('', statuses))
+        if histograms:
+            labels = ['<={0}ms'.format(bound) for bound in loadtest.HISTOGRAM_BOUNDS] + ['slower']
+            for name in sorted(stats.latencies):
+                self.stdout.write('\n{0}'.format(name))
+                for label, count in zip(labels, stats.histogram(name)):
+                    if count:
+                        self.stdout.write('  {0:>9} {1:>7}'.format(label, count))
@@ -0,0 +1,71 @@
+import os
+
+from django.core.management.base import BaseCommand, CommandError
+
+FIELDS = ('Rss', 'Pss', 'Shared_Clean', 'Shared_Dirty', 'Private_Clean', 'Private_Dirty')
+
+
+def get_children(pid):
+    children = []
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open('/proc/{0}/stat'.format(entry)) as stat:
+                # The command name can contain spaces, the fields after it can't.
+                ppid = int(stat.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        if ppid == pid:
+            children.append(int(entry))
+    return sorted(children)
+
+
+def get_memory(pid):
+    """
+    Returns the FIELDS of the process memory in kB, summed over all its mappings.
+    """
+    memory = dict.fromkeys(FIELDS, 0)
+    path = '/proc/{0}/smaps_rollup'.format(pid)
+    if not os.path.exists(path):
+        path = '/proc/{0}/smaps'.format(pid)
+    with open(path) as smaps:
+        for line in smaps:
+            parts = line.split()
+            if len(parts) == 3 and parts[0].rstrip(':') in memory:
+                memory[parts[0].rstrip(':')] += int(parts[1])
+    return memory
+
+
+class Command(BaseCommand):
+    help = 'Reports the shared and private resident memory of the workers of a preforking server (Linux).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('master', type=int, help='PID of the master process, its children are the workers.')
+
+    def handle(self, *args, **options):
+        master = options['master']
+        if not os.path.exists('/proc/{0}'.format(master)):
+            raise CommandError('No process {0}.'.format(master))
+        self.stdout.write('{0:>8} {1:>8} {2:>10} {3:>10} {4:>10} {5:>10}'.format(
+            'pid', 'role', 'rss [MB]', 'pss [MB]', 'shared', 'private'
+        ))
+        total = dict.fromkeys(FIELDS, 0)
+        for pid in [master] + get_children(master):
+            try:
+                memory = get_memory(pid)
+            except OSError:
+                continue
+            for field in FIELDS:
+                total[field] += memory[field]
+            self.write_row(pid, 'master' if pid == master else 'worker', memory)
+        self.write_row('', 'total', total)
+        self.stdout.write('Pss splits shared pages between the processes sharing them, '
+                          'its total is the memory actually used.')
+
+    def write_row(self, pid, role, memory):
+        shared = memory['Shared_Clean'] + memory['Shared_Dirty']
+        private = memory['Private_Clean'] + memory['Private_Dirty']
+        self.stdout.write('{0:>8} {1:>8} {2:>10.1f} {3:>10.1f} {4:>10.1f} {5:>10.1f}'.format(
+            pid, role, memory['Rss'] / 1024, memory['Pss'] / 1024, shared / 1024, private / 1024
+        ))
@@ -0,0 +1,31 @@
+import time
+
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = 'Deletes expired database sessions in small batches, so the session table is never locked for long.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Number of sessions deleted per query.')
+        parser.add_argument('--sleep', type=float, default=0, help='Seconds to wait between two batches.')
+
+    def handle(self, *args, **options):
+        if 'signed_cookies' in settings.SESSION_ENGINE:
+            self.stdout.write('Sessions are stored in signed cookies, there is nothing to purge.')
+            return
+        now = timezone.now()
+        deleted = 0
+        while True:
+            keys = list(
+                Session.objects.filter(expire_date__lt=now).values_list('session_key', flat=True)[:options['batch_size']]
+            )
+            if not keys:
+                break
+            deleted += Session.objects.filter(session_key__in=keys).delete()[0]
+            if options['sleep']:
+                time.sleep(options['sleep'])
+        self.stdout.write('Deleted {0} expired sessions.'.format(deleted))
@@ -0,0 +1,59 @@
+import json
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Loads the WSGI application the way a fresh worker does, then prints the warm up steps.
+STARTUP_SCRIPT = """
+import json, os, time
+started = time.perf_counter()
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', {settings_module!r})
+from django.core.wsgi import get_wsgi_application
+get_wsgi_application()
+loaded = time.perf_counter()
+from core.warmup import warm_up
+steps = warm_up()
+print(json.dumps({{'load': loaded - started, 'steps': steps}}))
+"""
+
+
+class Command(BaseCommand):
+    help = 'Starts the WSGI application in a fresh interpreter and reports the import time of each module ' \
+           'and the time of each warm up step.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=30, help='Number of modules to report.')
+        parser.add_argument(
+            '--sort', choices=['cumulative', 'self'], default='cumulative',
+            help='Sort modules by their own import time or including the modules they import.'
+        )
+
+    def handle(self, *args, **options):
+        script = STARTUP_SCRIPT.format(settings_module=settings.SETTINGS_MODULE)
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', script],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=settings.BASE_DIR, universal_newlines=True
+        )
+        if process.returncode:
+            self.stderr.write(process.stderr)
+            return
+
+        modules = []
+        for line in process.stderr.splitlines():
+            if not line.startswith('import time:') or 'imported package' in line:
+                continue
+            own, cumulative, name = line[len('import time:'):].split('|')
+            modules.append((name.strip(), int(own), int(cumulative)))
+        modules.sort(key=lambda module: -module[2 if options['sort'] == 'cumulative' else 1])
+
+        result = json.loads(process.stdout.splitlines()[-1])
+        self.stdout.write('Application loaded in {0:.0f}ms, {1} modules imported.'.format(
+            result['load'] * 1000, len(modules)
+        ))
+        for name, seconds, warmed in result['steps']:
+            self.stdout.write('Warm up {0:<10} {1:>8.0f}ms  {2} items'.format(name, seconds * 1000, warmed))
+        self.stdout.write('\n{0:>10} {1:>12}  module'.format('self [ms]', 'cumul. [ms]'))
+        for name, own, cumulative in modules[:options['limit']]:
+            self.stdout.write('{0:>10.1f} {1:>12.1f}  {2}'.format(own / 1000, cumulative / 1000, name))
@@ -0,0 +1,168 @@
+import logging
+import re
+import time
+import uuid
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from core import log, sampling_profiler, strict, template_profiler
+
+template_logger = logging.getLogger('core.template_profiler')
+access_logger = logging.getLogger('core.access')
+
+REQUEST_ID = re.compile(r'^[\w-]{1,64}$')
+
+
+class StrictLazyLoadMiddleware:
+    """
+    Flags implicit foreign key loads done by the view code of `STRICT_LAZY_LOADS_MODULES` and related object
+    or manager queries fired while rendering `STRICT_LAZY_LOADS_TEMPLATES`.
+    Only active when `STRICT_LAZY_LOADS` is set to 'log' or 'raise'.
+    """
+
+    def __init__(self, get_response):
+        if not strict.get_mode():
+            raise MiddlewareNotUsed
+        strict.install()
+        self.get_response = get_response
+        self.modules = tuple(getattr(settings, 'STRICT_LAZY_LOADS_MODULES', ()))
+
+    def __call__(self, request):
+        request._strict_guarded = False
+        try:
+            return self.get_response(request)
+        finally:
+            self._leave(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if view_func.__module__.startswith(self.modules):
+            strict.enter('view {0}.{1}'.format(view_func.__module__, view_func.__name__))
+            request._strict_guarded = True
+
+    def process_exception(self, request, exception):
+        self._leave(request)
+
+    def process_template_response(self, request, response):
+        # The view is done, template rendering is not part of the view code.
+        self._leave(request)
+        return response
+
+    def _leave(self, request):
+        if getattr(request, '_strict_guarded', False):
+            strict.leave()
+            request._strict_guarded = False
+
+
+class TemplateProfilingMiddleware:
+    """
+    Reports the render time of each template, include and template filter of a request in the log and in
+    a Server-Timing header. Only active when `TEMPLATE_PROFILING` is on.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'TEMPLATE_PROFILING', False):
+            raise MiddlewareNotUsed
+        template_profiler.install()
+        self.get_response = get_response
+        self.limit = getattr(settings, 'TEMPLATE_PROFILING_LIMIT', 10)
+
+    def __call__(self, request):
+        template_profiler.start()
+        try:
+            response = self.get_response(request)
+        finally:
+            timings = template_profiler.stop()[:self.limit]
+        if timings:
+            template_logger.info('%s %s\n%s', request.method, request.path, '\n'.join(
+                '{0:>9.2f}ms {1:>5}x {2}'.format(seconds * 1000, calls, label) for label, calls, seconds in timings
+            ))
+            response['Server-Timing'] = ', '.join(
+                't{0};desc="{1}";dur={2:.2f}'.format(i, label.replace('"', "'"), seconds * 1000)
+                for i, (label, calls, seconds) in enumerate(timings)
+            )
+        return response
+
+
+class SamplingProfilerMiddleware:
+    """
+    Samples the stacks of the requests picked by core.sampling_profiler while it's enabled from the profiler
+    page. Not installed when `SAMPLING_PROFILER` is off.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'SAMPLING_PROFILER', True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not sampling_profiler.should_profile():
+            return self.get_response(request)
+        request.sampling_profiled = True
+        # The URL name is only known once the URL is resolved, see process_view.
+        sampling_profiler.start('unresolved')
+        try:
+            return self.get_response(request)
+        finally:
+            sampling_profiler.stop()
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if getattr(request, 'sampling_profiled', False):
+            match = request.resolver_match
+            sampling_profiler.relabel(match.url_name or match.view_name)
+
+
+class AccessLogMiddleware:
+    """
+    Logs every request to 'core.access' with its id, user id, URL name, status, duration and number of queries,
+    at WARNING when it failed or took more than `ACCESS_LOG_SLOW_MS`. The request id comes from the
+    `X-Request-ID` header set by the proxy, or is generated, and is sent back in the response.
+    Not installed when `ACCESS_LOG` is off.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'ACCESS_LOG', True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.slow = getattr(settings, 'ACCESS_LOG_SLOW_MS', 1000)
+
+    def __call__(self, request):
+        request_id = request.META.get('HTTP_X_REQUEST_ID', '')
+        if not REQUEST_ID.match(request_id):
+            request_id = uuid.uuid4().hex
+        log.set_context(request_id=request_id)
+        queries = [0]
+
+        def count_query(execute, sql, params, many, context):
+            queries[0] += 1
+            return execute(sql, params, many, context)
+
+        started = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(count_query))
+                response = self.get_response(request)
+            duration = (time.perf_counter() - started) * 1000
+            response['X-Request-ID'] = request_id
+            # The user may have logged in or out, the records are stamped with the context (core.log).
+            user = getattr(request, 'user', None)
+            log.set_context(user_id=user.pk if user is not None and user.is_authenticated else None)
+            fields = {
+                'method': request.method, 'path': request.path, 'status': response.status_code,
+                'duration_ms': round(duration, 2), 'queries': queries[0],
+            }
+            level = logging.WARNING if response.status_code >= 500 or duration > self.slow else logging.INFO
+            access_logger.log(level, '%s %s %s', request.method, request.path, response.status_code, extra=fields)
+            return response
+        finally:
+            log.clear_context()
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        user = getattr(request, 'user', None)
+        log.set_context(
+            url_name=request.resolver_match.url_name or request.resolver_match.view_name,
+            user_id=user.pk if user is not None and user.is_authenticated else None,
+        )
@@ -0,0 +1,117 @@
+import math
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+
+RATE_PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+# Buckets are dropped this many periods after their creation, however busy, and start over full. The timeout isn't
+# refreshed so taking a token stays a single `incr`.
+BUCKET_TIMEOUT_PERIODS = 10
+
+
+def parse_rate(rate):
+    """
+    Parses a rate like '5/m' into a (capacity, period in seconds) tuple.
+    """
+    capacity, period = rate.split('/')
+    return int(capacity), RATE_PERIODS[period]
+
+
+def get_client_ip(request):
+    """
+    Returns the client address from the `RATELIMIT_IP_HEADER` header. Proxies append the address they received the
+    request from to X-Forwarded-For, and the client can send any value in front: the client address is the one
+    added by the first of the `RATELIMIT_TRUSTED_PROXIES` proxies, counted from the right.
+    """
+    header = getattr(settings, 'RATELIMIT_IP_HEADER', 'REMOTE_ADDR')
+    addresses = [address.strip() for address in request.META.get(header, '').split(',')]
+    trusted = max(1, getattr(settings, 'RATELIMIT_TRUSTED_PROXIES', 1))
+    return addresses[-min(trusted, len(addresses))]
+
+
+def consume(cache, key, capacity, period):
+    """
+    Takes a token from the bucket stored under `key` and returns 0, or the number of seconds to wait when the
+    bucket is empty. The bucket only keeps its creation time and the number of tokens used since, so taking a
+    token is an atomic `incr` and no lock is needed.
+    """
+    now = time.time()
+    rate = capacity / period
+    timeout = period * BUCKET_TIMEOUT_PERIODS
+    stamp_key, used_key = '{0}:t'.format(key), '{0}:n'.format(key)
+
+    stamp = cache.get(stamp_key)
+    if stamp is None:
+        if cache.add(stamp_key, now, timeout):
+            # The counter may have outlived an evicted stamp, it would be read against the new one.
+            cache.set(used_key, 0, timeout)
+        stamp = cache.get(stamp_key, now)
+    try:
+        used = cache.incr(used_key)
+    except ValueError:
+        cache.add(used_key, 1, timeout)
+        used = 1
+
+    tokens = capacity + (now - stamp) * rate - used
+    if tokens < 0:
+        # Rejected requests don't take a token.
+        refund(cache, key)
+        return math.ceil(-tokens / rate)
+    surplus = math.floor(tokens - (capacity - 1))
+    if surplus > 0:
+        # The bucket can't hold more than `capacity` tokens, drop what was refilled on top of it.
+        cache.incr(used_key, surplus)
+    return 0
+
+
+def refund(cache, key):
+    """
+    Gives back a token taken from the bucket stored under `key`, unless the bucket was dropped meanwhile.
+    """
+    try:
+        cache.decr('{0}:n'.format(key))
+    except ValueError:
+        pass
+
+
+def check(request, scope):
+    """
+    Checks the `scope` limit for the user and the IP address of the request.
+    Returns 0 when the request is allowed, the seconds to wait before retrying otherwise.
+    """
+    rate = getattr(settings, 'RATELIMITS', {}).get(scope)
+    if not rate or not getattr(settings, 'RATELIMIT_ENABLED', True):
+        return 0
+    capacity, period = parse_rate(rate)
+    cache = caches[getattr(settings, 'RATELIMIT_CACHE', 'default')]
+
+    keys = ['rl:{0}:ip:{1}'.format(scope, get_client_ip(request))]
+    if request.user.is_authenticated:
+        keys.insert(0, 'rl:{0}:user:{1}'.format(scope, request.user.pk))
+    for i, key in enumerate(keys):
+        wait = consume(cache, key, capacity, period)
+        if wait:
+            for taken in keys[:i]:
+                refund(cache, taken)
+            return wait
+    return 0
+
+
+class RateLimitMixin:
+    """
+    Throttles the `ratelimit_methods` requests of a view with the `RATELIMITS` rate of its `ratelimit_scope`.
+    """
+    ratelimit_scope = None
+    ratelimit_methods = ('POST',)
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method in self.ratelimit_methods:
+            wait = check(request, self.ratelimit_scope)
+            if wait:
+                response = HttpResponse('Too many requests, please try again later.', status=429)
+                response['Retry-After'] = str(wait)
+                return response
+        return super(RateLimitMixin, self).dispatch(request, *args, **kwargs)
@@ -0,0 +1,41 @@
+import unittest
+
+from django.conf import settings
+from django.core.cache import caches
+from django.test.runner import DebugSQLTextTestResult, DiscoverRunner
+
+
+class LookupCacheTestResult(unittest.TextTestResult):
+    """
+    Clears the lookup cache before every test, the rows cached by the previous one were rolled back.
+    """
+
+    def startTest(self, test):
+        caches[getattr(settings, 'LOOKUP_CACHE', 'default')].clear()
+        super(LookupCacheTestResult, self).startTest(test)
+
+
+class DebugSQLLookupCacheTestResult(LookupCacheTestResult, DebugSQLTextTestResult):
+    pass
+
+
+class StrictTestRunner(DiscoverRunner):
+    """
+    Runs the test suite with strict lazy load detection turned on, so N+1 regressions fail the build.
+    Rate limits are turned off, all test requests come from the same address, their own tests turn them on.
+    Static files are served from the finders' storage, tests don't run collectstatic.
+    The lookup cache is cleared before every test, the rows cached by the previous one were rolled back.
+    The access log is turned off, its own tests turn it on.
+    Passwords are hashed in the test process, the hashing pool tests turn the pool on.
+    """
+
+    def setup_test_environment(self, **kwargs):
+        super(StrictTestRunner, self).setup_test_environment(**kwargs)
+        settings.STRICT_LAZY_LOADS = 'raise'
+        settings.RATELIMIT_ENABLED = False
+        settings.ACCESS_LOG = False
+        settings.PASSWORD_HASHING_PROCESSES = 0
+        settings.STATICFILES_STORAGE = 'django.contrib.staticfiles.storage.StaticFilesStorage'
+
+    def get_resultclass(self):
+        return DebugSQLLookupCacheTestResult if self.debug_sql else LookupCacheTestResult
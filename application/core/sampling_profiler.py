@@ -0,0 +1,197 @@
+"""
+Statistical profiler of live workers. While it's enabled (see the profiler views), a fraction of the requests is
+profiled: a sampler thread records the stack of the threads handling them every `SAMPLING_PROFILER_INTERVAL`
+seconds. The stacks are counted per URL name and exported in the collapsed format of flamegraph.pl and
+speedscope, 'url_name;outer frame;...;inner frame count'.
+The configuration and the stacks of every worker are shared through the cache. Workers read the configuration
+and publish their stacks every `SAMPLING_PROFILER_POLL` seconds, so a disabled profiler costs a clock read per
+request. Workers are identified by host name and pid, each one registers itself once in a numbered slot taken with
+an atomic `incr`, so concurrent workers don't overwrite each other.
+"""
+import os
+import random
+import socket
+import sys
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import caches
+
+CONFIG_KEY = 'sampling_profiler:config'
+# Number of slots taken, the worker of each slot, and the slot of each worker
+WORKERS_KEY = 'sampling_profiler:workers'
+SLOT_KEY = 'sampling_profiler:slot:{0}'
+REGISTERED_KEY = 'sampling_profiler:registered:{0}'
+STACKS_KEY = 'sampling_profiler:stacks:{0}'
+MAX_DEPTH = 100
+
+_lock = threading.Lock()
+_active = {}
+_stacks = Counter()
+_state = {'rate': 0, 'next_poll': 0, 'dirty': False}
+_sampler = None
+_wake_up = threading.Event()
+
+
+def get_cache():
+    return caches[getattr(settings, 'SAMPLING_PROFILER_CACHE', 'default')]
+
+
+def enable(rate=1.0, seconds=60):
+    """
+    Profiles the `rate` fraction of the requests of every worker for the next `seconds` seconds.
+    """
+    get_cache().set(CONFIG_KEY, {'rate': rate, 'until': time.time() + seconds}, seconds)
+
+
+def disable():
+    get_cache().delete(CONFIG_KEY)
+
+
+def get_config():
+    config = get_cache().get(CONFIG_KEY)
+    if config and config['until'] > time.time():
+        return config
+    return None
+
+
+def get_worker():
+    return '{0}:{1}'.format(socket.gethostname(), os.getpid())
+
+
+def get_workers(cache):
+    slots = [SLOT_KEY.format(slot) for slot in range(1, (cache.get(WORKERS_KEY) or 0) + 1)]
+    return cache.get_many(slots)
+
+
+def reset():
+    """
+    Drops the stacks recorded so far by every worker. The workers that keep running may publish theirs again.
+    """
+    cache = get_cache()
+    slots = get_workers(cache)
+    cache.delete_many(
+        [STACKS_KEY.format(worker) for worker in slots.values()] +
+        [REGISTERED_KEY.format(worker) for worker in slots.values()] +
+        list(slots) + [WORKERS_KEY]
+    )
+    with _lock:
+        _stacks.clear()
+
+
+def publish():
+    """
+    Stores the stacks recorded by this worker in the cache, when there are new ones.
+    """
+    if not _state['dirty']:
+        return
+    cache = get_cache()
+    with _lock:
+        stacks = dict(_stacks)
+        _state['dirty'] = False
+    timeout = getattr(settings, 'SAMPLING_PROFILER_TIMEOUT', 3600)
+    worker = get_worker()
+    cache.set(STACKS_KEY.format(worker), stacks, timeout)
+    if cache.add(REGISTERED_KEY.format(worker), 0, timeout):
+        cache.add(WORKERS_KEY, 0, timeout)
+        slot = cache.incr(WORKERS_KEY)
+        cache.set_many({REGISTERED_KEY.format(worker): slot, SLOT_KEY.format(slot): worker}, timeout)
+    else:
+        # Registered, the registration lasts as long as the stacks.
+        slot = cache.get(REGISTERED_KEY.format(worker))
+        for key in (WORKERS_KEY, SLOT_KEY.format(slot), REGISTERED_KEY.format(worker)):
+            cache.touch(key, timeout)
+
+
+def poll():
+    """
+    Publishes the stacks of this worker and reads the configuration again.
+    """
+    publish()
+    config = get_config()
+    _state['rate'] = config['rate'] if config else 0
+    _state['next_poll'] = time.monotonic() + getattr(settings, 'SAMPLING_PROFILER_POLL', 5)
+
+
+def should_profile():
+    """
+    Tells if the current request is to be profiled.
+    """
+    if time.monotonic() >= _state['next_poll']:
+        poll()
+    return bool(_state['rate']) and random.random() < _state['rate']
+
+
+def start(label):
+    """
+    Starts sampling the current thread, its stacks are counted under `label`.
+    """
+    global _sampler
+    with _lock:
+        _active[threading.get_ident()] = label
+        if _sampler is None:
+            _sampler = threading.Thread(target=_sample, name='sampling-profiler', daemon=True)
+            _sampler.start()
+    _wake_up.set()
+
+
+def relabel(label):
+    ident = threading.get_ident()
+    with _lock:
+        if ident in _active:
+            _active[ident] = label
+
+
+def stop():
+    with _lock:
+        _active.pop(threading.get_ident(), None)
+
+
+def format_frame(frame):
+    code = frame.f_code
+    path = code.co_filename.replace(os.sep, '/').rsplit('/', 2)
+    return '{0} ({1}:{2})'.format(code.co_name, '/'.join(path[-2:]), frame.f_lineno)
+
+
+def collapse(label, frame):
+    frames = []
+    while frame is not None and len(frames) < MAX_DEPTH:
+        frames.append(format_frame(frame))
+        frame = frame.f_back
+    return ';'.join([label] + frames[::-1])
+
+
+def _sample():
+    interval = getattr(settings, 'SAMPLING_PROFILER_INTERVAL', 0.005)
+    while True:
+        _wake_up.clear()
+        with _lock:
+            active = dict(_active)
+        if not active:
+            # Sleeps until the next profiled request.
+            _wake_up.wait()
+            continue
+        frames = sys._current_frames()
+        stacks = [collapse(label, frames[ident]) for ident, label in active.items() if ident in frames]
+        with _lock:
+            _stacks.update(stacks)
+            _state['dirty'] = True
+        time.sleep(interval)
+
+
+def export(url_name=None):
+    """
+    Returns the collapsed stacks of every worker, of the `url_name` requests only when given.
+    """
+    publish()
+    cache = get_cache()
+    stacks = Counter()
+    keys = [STACKS_KEY.format(worker) for worker in get_workers(cache).values()]
+    for worker_stacks in cache.get_many(keys).values():
+        stacks.update(worker_stacks)
+    if url_name:
+        prefix = '{0};'.format(url_name)
+        stacks = Counter({stack: count for stack, count in stacks.items() if stack.startswith(prefix)})
+    return '\n'.join('{0} {1}'.format(stack, count) for stack, count in sorted(stacks.items()))
@@ -0,0 +1,21 @@
+class WriteAvoidingSessionMixin:
+    """
+    Skips saving a session whose data didn't change since it was loaded, e.g. when a view sets a key to the
+    value it already had. New sessions and key cycling (login) are always saved.
+    """
+    _loaded_data = None
+
+    def _serialize(self, data):
+        return self.serializer().dumps(data)
+
+    def load(self):
+        data = super(WriteAvoidingSessionMixin, self).load()
+        self._loaded_data = self._serialize(data)
+        return data
+
+    def save(self, must_create=False):
+        if not must_create and self.session_key is not None and self._loaded_data is not None:
+            if self._serialize(self._get_session()) == self._loaded_data:
+                return
+        super(WriteAvoidingSessionMixin, self).save(must_create)
+        self._loaded_data = self._serialize(self._get_session(no_load=True))
@@ -0,0 +1,7 @@
+from django.contrib.sessions.backends.db import SessionStore as DBStore
+
+from core.sessions import WriteAvoidingSessionMixin
+
+
+class SessionStore(WriteAvoidingSessionMixin, DBStore):
+    pass
@@ -0,0 +1,92 @@
+import json
+import mimetypes
+import os
+from wsgiref.util import FileWrapper
+
+from django.conf import settings
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+class StaticFile:
+
+    def __init__(self, path):
+        self.path = path
+        self.content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        if self.content_type.startswith('text/') or self.content_type == 'application/javascript':
+            self.content_type += '; charset=utf-8'
+        self.variants = {}
+        for encoding, extension in (('identity', ''),) + ENCODINGS:
+            if os.path.isfile(path + extension):
+                stat = os.stat(path + extension)
+                etag = '"{0:x}-{1:x}{2}"'.format(int(stat.st_mtime), stat.st_size, extension)
+                self.variants[encoding] = (path + extension, stat.st_size, etag)
+
+    def get_variant(self, accept_encoding):
+        for encoding, extension in ENCODINGS:
+            if encoding in self.variants and encoding in accept_encoding:
+                return encoding, self.variants[encoding]
+        return 'identity', self.variants['identity']
+
+
+class StaticFilesApplication:
+    """
+    WSGI middleware serving `STATIC_ROOT` under `STATIC_URL` before the requests reach Django.
+    Files are indexed once at startup, hashed names get far-future cache headers, precompressed versions are
+    picked from Accept-Encoding and the content is handed to the server's `wsgi.file_wrapper` (sendfile).
+    """
+
+    def __init__(self, application, root=None, prefix=None):
+        self.application = application
+        self.root = root or settings.STATIC_ROOT
+        self.prefix = prefix or settings.STATIC_URL
+        self.max_age = getattr(settings, 'STATIC_MAX_AGE', 60)
+        self.files = {}
+        self.immutable = set()
+        self.index()
+
+    def index(self):
+        compressed = tuple(extension for encoding, extension in ENCODINGS)
+        for directory, dirnames, filenames in os.walk(self.root):
+            for filename in filenames:
+                if filename.endswith(compressed):
+                    continue
+                path = os.path.join(directory, filename)
+                name = os.path.relpath(path, self.root).replace(os.sep, '/')
+                self.files[self.prefix + name] = StaticFile(path)
+        manifest = os.path.join(self.root, 'staticfiles.json')
+        if os.path.isfile(manifest):
+            with open(manifest) as manifest_file:
+                hashed = json.load(manifest_file).get('paths', {}).values()
+            self.immutable = {self.prefix + name for name in hashed}
+
+    def __call__(self, environ, start_response):
+        static_file = self.files.get(environ.get('PATH_INFO', ''))
+        if static_file is None:
+            return self.application(environ, start_response)
+        method = environ['REQUEST_METHOD']
+        if method not in ('GET', 'HEAD'):
+            start_response('405 Method Not Allowed', [('Allow', 'GET, HEAD')])
+            return []
+
+        encoding, (path, size, etag) = static_file.get_variant(environ.get('HTTP_ACCEPT_ENCODING', ''))
+        if environ['PATH_INFO'] in self.immutable:
+            cache_control = IMMUTABLE_CACHE_CONTROL
+        else:
+            cache_control = 'public, max-age={0}'.format(self.max_age)
+        headers = [('Cache-Control', cache_control), ('ETag', etag)]
+        if len(static_file.variants) > 1:
+            headers.append(('Vary', 'Accept-Encoding'))
+        if environ.get('HTTP_IF_NONE_MATCH') == etag:
+            start_response('304 Not Modified', headers)
+            return []
+
+        headers += [('Content-Type', static_file.content_type), ('Content-Length', str(size))]
+        if encoding != 'identity':
+            headers.append(('Content-Encoding', encoding))
+        start_response('200 OK', headers)
+        if method == 'HEAD':
+            return []
+        file_wrapper = environ.get('wsgi.file_wrapper', FileWrapper)
+        return file_wrapper(open(path, 'rb'), 64 * 1024)
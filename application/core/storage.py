@@ -0,0 +1,57 @@
+import gzip
+import re
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+from django.core.files.base import ContentFile
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SOURCE_MAP_RE = re.compile(rb'^\s*(//|/\*)# sourceMappingURL=.*$', re.MULTILINE)
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    Manifest storage that also builds the `STATIC_BUNDLES` and writes gzip (and brotli, when the brotli
+    package is installed) versions of the text files next to them at collectstatic time.
+    """
+    compressible_extensions = ('.css', '.js', '.svg', '.map', '.txt', '.json')
+
+    def post_process(self, paths, dry_run=False, **options):
+        if not dry_run:
+            for name, sources in getattr(settings, 'STATIC_BUNDLES', {}).items():
+                self.save_bundle(name, sources, paths)
+                paths[name] = (self, name)
+        for result in super(CompressedManifestStaticFilesStorage, self).post_process(paths, dry_run, **options):
+            yield result
+        if not dry_run:
+            for name in set(paths) | set(self.hashed_files.values()):
+                if name.endswith(self.compressible_extensions) and self.exists(name):
+                    self.compress(name)
+
+    def save_bundle(self, name, sources, paths):
+        separator = b'\n;\n' if name.endswith('.js') else b'\n'
+        contents = []
+        for source in sources:
+            storage, path = paths[source]
+            with storage.open(path) as source_file:
+                # The source maps of the bundled files don't match the bundle.
+                contents.append(SOURCE_MAP_RE.sub(b'', source_file.read()).strip())
+        if self.exists(name):
+            self.delete(name)
+        self._save(name, ContentFile(separator.join(contents)))
+
+    def compress(self, name):
+        with self.open(name) as original:
+            content = original.read()
+        variants = [('.gz', gzip.compress(content, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            variants.append(('.br', brotli.compress(content)))
+        for extension, compressed in variants:
+            if len(compressed) < len(content):
+                if self.exists(name + extension):
+                    self.delete(name + extension)
+                self._save(name + extension, ContentFile(compressed))
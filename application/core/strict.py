@@ -0,0 +1,134 @@
+import logging
+import threading
+
+from django.conf import settings
+from django.db.models.fields.related_descriptors import (
+    ForwardManyToOneDescriptor, ReverseManyToOneDescriptor, ReverseOneToOneDescriptor
+)
+from django.template.base import Node, TextNode
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+_original_get_object = ForwardManyToOneDescriptor.get_object
+_original_reverse_one_to_one_get = ReverseOneToOneDescriptor.__get__
+_original_related_manager_get = ReverseManyToOneDescriptor.__get__
+_original_render_annotated = Node.render_annotated
+_strict_managers = {}
+_templates = ()
+
+
+class LazyLoadError(Exception):
+    pass
+
+
+def get_mode():
+    """
+    Returns the configured strict mode: '' (off), 'log' or 'raise'.
+    """
+    return getattr(settings, 'STRICT_LAZY_LOADS', '')
+
+
+def _get_stack():
+    if not hasattr(_local, 'stack'):
+        _local.stack = []
+    return _local.stack
+
+
+def enter(label, template=False):
+    _get_stack().append((label, template))
+
+
+def leave():
+    stack = _get_stack()
+    if stack:
+        stack.pop()
+
+
+def in_template():
+    stack = _get_stack()
+    return bool(stack) and stack[-1][1]
+
+
+class guard:
+    """
+    Context manager flagging lazy loads that happen inside its block, reported against `label`.
+    Inside a `template` block related manager queries are flagged as well.
+    """
+
+    def __init__(self, label, template=False):
+        self.label = label
+        self.template = template
+
+    def __enter__(self):
+        enter(self.label, self.template)
+
+    def __exit__(self, *exc_info):
+        leave()
+
+
+def report(message):
+    stack = _get_stack()
+    if not stack:
+        return
+    message = '{0} in {1}'.format(message, stack[-1][0])
+    if get_mode() == 'raise':
+        raise LazyLoadError(message)
+    logger.warning(message)
+
+
+def _get_object(self, instance):
+    report('Lazy load of {0}.{1}'.format(instance.__class__.__name__, self.field.name))
+    return _original_get_object(self, instance)
+
+
+def _reverse_one_to_one_get(self, instance, cls=None):
+    if instance is not None and in_template() and not self.related.is_cached(instance):
+        report('Lazy load of {0}.{1}'.format(instance.__class__.__name__, self.related.get_accessor_name()))
+    return _original_reverse_one_to_one_get(self, instance, cls)
+
+
+def _strict_manager_class(manager_class):
+    if manager_class not in _strict_managers:
+        class StrictRelatedManager(manager_class):
+
+            def get_queryset(self):
+                queryset = super(StrictRelatedManager, self).get_queryset()
+                # Prefetched relations come back already evaluated.
+                if queryset._result_cache is None:
+                    report('Related manager query on {0}'.format(self._strict_label))
+                return queryset
+
+        _strict_managers[manager_class] = StrictRelatedManager
+    return _strict_managers[manager_class]
+
+
+def _related_manager_get(self, instance, cls=None):
+    manager = _original_related_manager_get(self, instance, cls)
+    if instance is not None and in_template():
+        manager.__class__ = _strict_manager_class(manager.__class__)
+        # Forward many to many managers are named after the field, the reverse ones after the accessor.
+        name = self.rel.get_accessor_name() if getattr(self, 'reverse', True) else self.field.name
+        manager._strict_label = '{0}.{1}'.format(instance.__class__.__name__, name)
+    return manager
+
+
+def _render_annotated(self, context):
+    origin = getattr(self, 'origin', None)
+    name = getattr(origin, 'template_name', None)
+    if isinstance(self, TextNode) or not isinstance(name, str) or not name.startswith(_templates):
+        return _original_render_annotated(self, context)
+    enter('template {0}, line {1}'.format(name, self.token.lineno), template=True)
+    try:
+        return _original_render_annotated(self, context)
+    finally:
+        leave()
+
+
+def install():
+    global _templates
+    _templates = tuple(getattr(settings, 'STRICT_LAZY_LOADS_TEMPLATES', ()))
+    ForwardManyToOneDescriptor.get_object = _get_object
+    ReverseOneToOneDescriptor.__get__ = _reverse_one_to_one_get
+    ReverseManyToOneDescriptor.__get__ = _related_manager_get
+    Node.render_annotated = _render_annotated
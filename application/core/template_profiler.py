@@ -0,0 +1,94 @@
+import functools
+import threading
+import time
+from collections import defaultdict
+
+from django.template import engines
+from django.template.base import Template
+from django.template.loader_tags import IncludeNode
+
+_local = threading.local()
+_original_render = None
+_original_include_render = None
+
+
+def start():
+    """
+    Starts collecting the render times of the current thread.
+    """
+    _local.timings = defaultdict(lambda: [0, 0.0])
+
+
+def stop():
+    """
+    Stops collecting and returns the timings as (label, calls, seconds) tuples, slowest first.
+    Template and include times include the time of what they render.
+    """
+    timings = getattr(_local, 'timings', None)
+    _local.timings = None
+    if not timings:
+        return []
+    return sorted(((label, calls, seconds) for label, (calls, seconds) in timings.items()), key=lambda t: -t[2])
+
+
+def record(label, seconds):
+    timings = getattr(_local, 'timings', None)
+    if timings is not None:
+        timing = timings[label]
+        timing[0] += 1
+        timing[1] += seconds
+
+
+def _render(self, context):
+    started = time.perf_counter()
+    try:
+        return _original_render(self, context)
+    finally:
+        record('template {0}'.format(self.origin.template_name or self.name), time.perf_counter() - started)
+
+
+def _include_render(self, context):
+    started = time.perf_counter()
+    try:
+        return _original_include_render(self, context)
+    finally:
+        record(
+            'include {0} at {1}, line {2}'.format(self.template.token, self.origin.template_name, self.token.lineno),
+            time.perf_counter() - started
+        )
+
+
+def _timed_filter(library_name, name, func):
+    label = 'filter {0}.{1}'.format(library_name, name)
+
+    @functools.wraps(func)
+    def timed(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record(label, time.perf_counter() - started)
+
+    return timed
+
+
+def install():
+    """
+    Instruments template rendering, includes and the filters of the `{% load %}` libraries.
+    Must run before the templates are compiled, the compiled ones keep the filters they were built with.
+    """
+    global _original_render, _original_include_render
+    if _original_render is not None:
+        return
+    # Keep whatever is in place now, e.g. the test runner instrumentation.
+    _original_render = Template._render
+    _original_include_render = IncludeNode.render
+    Template._render = _render
+    IncludeNode.render = _include_render
+    for backend in engines.all():
+        engine = getattr(backend, 'engine', None)
+        if engine is None:
+            continue
+        for library_name, library in engine.template_libraries.items():
+            for name, func in list(library.filters.items()):
+                library.filters[name] = _timed_filter(library_name, name, func)
@@ -0,0 +1,21 @@
+from django import template
+from django.conf import settings
+from django.templatetags.static import static
+from django.utils.html import format_html_join
+
+register = template.Library()
+
+
+@register.simple_tag
+def bundle(name):
+    """
+    Renders the tags loading a `STATIC_BUNDLES` bundle: the bundle itself when `STATIC_BUNDLING` is on,
+    one tag per bundled file otherwise.
+    """
+    if getattr(settings, 'STATIC_BUNDLING', True):
+        urls = [static(name)]
+    else:
+        urls = [static(source) for source in settings.STATIC_BUNDLES[name]]
+    if name.endswith('.css'):
+        return format_html_join('\n', '<link rel="stylesheet" href="{}">', ((url,) for url in urls))
+    return format_html_join('\n', '<script src="{}"></script>', ((url,) for url in urls))
@@ -0,0 +1,57 @@
+from django.contrib.auth.models import User
+from django.test import SimpleTestCase, TestCase
+
+from boards.models import Board, Post, Topic
+from core import loadtest
+from core.management.commands.loadtest import BOARD_NAME, Command
+
+
+class LoadTestTests(SimpleTestCase):
+
+    def test_parse_mix(self):
+        self.assertEqual({'browse': 3.0, 'reply': 1.0}, loadtest.parse_mix('browse=3, reply=1'))
+        with self.assertRaises(ValueError):
+            loadtest.parse_mix('browse=3,unknown=1')
+
+    def test_stats(self):
+        stats = loadtest.Stats()
+        for i in range(1, 101):
+            stats.record('home', i / 1000, 200)
+        stats.record('home', 5, 500)
+        stats.record('login', 0.01, 0)
+        count, errors, p50, p90, p99, slowest = stats.summary('home')
+        self.assertEqual((101, 1), (count, errors))
+        self.assertEqual((0.051, 0.091, 0.1, 5), (p50, p90, p99, slowest))
+        self.assertEqual(1, stats.errors['login'])
+        self.assertEqual(102, stats.count)
+        histogram = stats.histogram('home')
+        self.assertEqual([1, 1, 3, 5, 10, 30, 50, 0, 0, 0, 0, 1, 0], histogram)
+
+    def test_response_parsing(self):
+        client = loadtest.Client('127.0.0.1', 8000, loadtest.Stats())
+        client.cookies['messages'] = 'old'
+        response = client.parse(
+            b'HTTP/1.1 200 OK\r\nSet-Cookie: csrftoken=abc; expires=Thu; Path=/\r\n'
+            b'Set-Cookie: messages=""; expires=Thu, 01 Jan 1970 00:00:00 GMT; Max-Age=0; Path=/\r\n\r\n'
+            b'<input type="hidden" name="csrfmiddlewaretoken" value="xyz">'
+        )
+        self.assertEqual(200, response.status)
+        self.assertEqual({'csrftoken': 'abc'}, client.cookies)
+        self.assertEqual('xyz', response.csrf_token())
+
+
+class LoadTestCommandTests(TestCase):
+
+    def test_fixtures_of_load_test_board_only(self):
+        board = Board.objects.create(name='Django', description='Django board.')
+        Command().setup(2)
+        user = User.objects.get(username='loadtest_0')
+        topic = Topic.objects.create(subject='Real topic', board=board, starter=user)
+        Post.objects.create(message='Real post', topic=topic, created_by=user)
+        fixtures = Command().get_fixtures(2)
+        load_board = Board.objects.get(name=BOARD_NAME)
+        self.assertEqual([load_board.pk], fixtures['boards'])
+        self.assertEqual(10, len(fixtures['topics']))
+        self.assertEqual(2, len(fixtures['users']))
+        for account in fixtures['users']:
+            self.assertEqual({load_board.pk}, {board_pk for board_pk, topic_pk, post_pk in account['posts']})
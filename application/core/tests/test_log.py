@@ -0,0 +1,139 @@
+import json
+import logging
+import threading
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils.log import AdminEmailHandler
+
+from core import log
+
+
+class EventHandler(logging.Handler):
+
+    def __init__(self):
+        super(EventHandler, self).__init__()
+        self.records = []
+        self.handled = threading.Event()
+
+    def emit(self, record):
+        self.records.append((record, threading.current_thread()))
+        self.handled.set()
+
+
+class LogTests(TestCase):
+
+    def tearDown(self):
+        log.clear_context()
+
+    def test_queued_handler_handles_on_listener_thread(self):
+        target = EventHandler()
+        logger = logging.getLogger('core.tests.queued')
+        logger.addHandler(log.QueuedHandler(target))
+        logger.propagate = False
+        self.addCleanup(logger.handlers.clear)
+        log.set_context(request_id='abc', user_id=1)
+        logger.warning('queued %s', 'message')
+        self.assertTrue(target.handled.wait(5))
+        record, thread = target.records[0]
+        self.assertNotEqual(threading.current_thread(), thread)
+        self.assertEqual('queued message', record.getMessage())
+        self.assertEqual('abc', record.request_id)
+        self.assertEqual(1, record.user_id)
+
+    @override_settings(ADMINS=[('Admin', 'admin@doe.com')])
+    def test_request_errors_mailed_once_on_listener_thread(self):
+        threads = []
+        with mock.patch.object(AdminEmailHandler, 'send_mail', lambda *args, **kwargs: threads.append(
+            threading.current_thread()
+        )), mock.patch.object(logging.StreamHandler, 'emit'):
+            logging.getLogger('django.request').error('Internal Server Error: /')
+            # Stopping the listener handles the queued records.
+            log.stop_listener()
+            log.start_listener()
+        self.assertEqual(1, len(threads))
+        self.assertNotEqual(threading.current_thread(), threads[0])
+
+    def test_stalled_mail_doesnt_hold_other_records(self):
+        stalled = threading.Event()
+        self.addCleanup(stalled.set)
+        mail = AdminEmailHandler()
+        target = EventHandler()
+        logger = logging.getLogger('core.tests.stalled')
+        logger.handlers = [log.QueuedHandler(mail), log.QueuedHandler(target)]
+        logger.propagate = False
+        self.addCleanup(logger.handlers.clear)
+        with mock.patch.object(AdminEmailHandler, 'emit', lambda *args: stalled.wait(5)):
+            logger.error('stalled mail')
+            self.assertTrue(target.handled.wait(5))
+            stalled.set()
+
+    @override_settings(LOG_QUEUE_SIZE=2)
+    def test_queue_full_records_dropped(self):
+        log.stop_listener()
+        log.start_listener()
+        self.addCleanup(log.start_listener)
+        self.addCleanup(log.stop_listener)
+        release = threading.Event()
+        self.addCleanup(release.set)
+        target = EventHandler()
+        target.emit = lambda record: (target.handled.set(), release.wait(5))
+        logger = logging.getLogger('core.tests.full')
+        logger.addHandler(log.QueuedHandler(target))
+        logger.propagate = False
+        self.addCleanup(logger.handlers.clear)
+        logger.warning('handled')
+        self.assertTrue(target.handled.wait(5))
+        for i in range(4):
+            logger.warning('queued or dropped')
+        self.assertEqual({'default': 2, 'mail': 0}, log.dropped())
+
+    def test_json_formatter(self):
+        record = logging.LogRecord('core.access', logging.INFO, __file__, 1, 'GET %s', ('/',), None)
+        record.request_id = 'abc'
+        record.status = 200
+        data = json.loads(log.JsonFormatter().format(record))
+        self.assertEqual('INFO', data['level'])
+        self.assertEqual('core.access', data['logger'])
+        self.assertEqual('GET /', data['message'])
+        self.assertEqual('abc', data['request_id'])
+        self.assertEqual(200, data['status'])
+        self.assertNotIn('user_id', data)
+
+    def test_sampling_filter_keeps_warnings(self):
+        sampling = log.SamplingFilter(0)
+        self.assertFalse(sampling.filter(logging.makeLogRecord({'levelno': logging.INFO})))
+        self.assertTrue(sampling.filter(logging.makeLogRecord({'levelno': logging.WARNING})))
+
+
+@override_settings(ACCESS_LOG=True, ACCESS_LOG_SLOW_MS=1000)
+class AccessLogMiddlewareTests(TestCase):
+
+    def test_request_logged(self):
+        with self.assertLogs('core.access', logging.INFO) as logs:
+            response = self.client.get(reverse('home'))
+        record = logs.records[0]
+        self.assertEqual(logging.INFO, record.levelno)
+        self.assertEqual(response['X-Request-ID'], record.request_id)
+        self.assertEqual('home', record.url_name)
+        self.assertEqual(200, record.status)
+        self.assertEqual('GET', record.method)
+        self.assertIsNone(record.user_id)
+        self.assertGreater(record.queries, 0)
+
+    def test_request_id_from_proxy(self):
+        user = User.objects.create_user('john', 'john@doe.com', '123')
+        self.client.force_login(user)
+        with self.assertLogs('core.access', logging.INFO) as logs:
+            response = self.client.get(reverse('home'), HTTP_X_REQUEST_ID='proxy-id')
+        self.assertEqual('proxy-id', response['X-Request-ID'])
+        self.assertEqual('proxy-id', logs.records[0].request_id)
+        self.assertEqual(user.pk, logs.records[0].user_id)
+
+    @override_settings(ACCESS_LOG_SLOW_MS=-1)
+    def test_slow_request_logged_as_warning(self):
+        with self.assertLogs('core.access', logging.INFO) as logs:
+            self.client.get(reverse('home'))
+        self.assertEqual(logging.WARNING, logs.records[0].levelno)
@@ -0,0 +1,127 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from boards.models import Board, Post, Topic
+from core import ratelimit
+
+
+class TokenBucketTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.now = 1000.0
+        patcher = mock.patch('core.ratelimit.time.time', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_parse_rate(self):
+        self.assertEqual((5, 60), ratelimit.parse_rate('5/m'))
+        self.assertEqual((20, 3600), ratelimit.parse_rate('20/h'))
+
+    def test_empty_bucket(self):
+        """
+        A bucket allows `capacity` requests in a row, then tells how long to wait for the next token.
+        """
+        for i in range(3):
+            self.assertEqual(0, ratelimit.consume(cache, 'bucket', 3, 60))
+        self.assertEqual(20, ratelimit.consume(cache, 'bucket', 3, 60))
+
+    def test_refill(self):
+        """
+        Tokens are refilled at `capacity / period`, rejected requests don't take any.
+        """
+        for i in range(4):
+            ratelimit.consume(cache, 'bucket', 3, 60)
+        self.now += 20
+        self.assertEqual(0, ratelimit.consume(cache, 'bucket', 3, 60))
+        self.assertNotEqual(0, ratelimit.consume(cache, 'bucket', 3, 60))
+
+    def test_refill_up_to_capacity(self):
+        """
+        An idle bucket doesn't hold more than `capacity` tokens.
+        """
+        ratelimit.consume(cache, 'bucket', 3, 60)
+        self.now += 3600
+        for i in range(3):
+            self.assertEqual(0, ratelimit.consume(cache, 'bucket', 3, 60))
+        self.assertNotEqual(0, ratelimit.consume(cache, 'bucket', 3, 60))
+
+    def test_evicted_stamp_starts_over(self):
+        """
+        A counter whose stamp was evicted shouldn't be read against a new stamp.
+        """
+        for i in range(4):
+            ratelimit.consume(cache, 'bucket', 3, 60)
+        cache.delete('bucket:t')
+        for i in range(3):
+            self.assertEqual(0, ratelimit.consume(cache, 'bucket', 3, 60))
+        self.assertEqual(20, ratelimit.consume(cache, 'bucket', 3, 60))
+
+    def test_rejected_after_counter_evicted(self):
+        for i in range(3):
+            ratelimit.consume(cache, 'bucket', 3, 60)
+        incr = cache.incr
+
+        def incr_then_evict(key, delta=1, **kwargs):
+            # cache.decr() is incr() with a negative delta.
+            value = incr(key, delta, **kwargs)
+            if delta > 0:
+                cache.delete(key)
+            return value
+
+        with mock.patch.object(cache, 'incr', incr_then_evict):
+            self.assertEqual(20, ratelimit.consume(cache, 'bucket', 3, 60))
+
+
+@override_settings(RATELIMIT_IP_HEADER='HTTP_X_FORWARDED_FOR')
+class ClientIpTests(TestCase):
+
+    def get_ip(self, forwarded_for):
+        return ratelimit.get_client_ip(RequestFactory().get('/', HTTP_X_FORWARDED_FOR=forwarded_for))
+
+    def test_spoofed_addresses_ignored(self):
+        self.assertEqual('10.0.0.1', self.get_ip('1.2.3.4, 10.0.0.1'))
+        self.assertEqual('10.0.0.1', self.get_ip('10.0.0.1'))
+
+    @override_settings(RATELIMIT_TRUSTED_PROXIES=2)
+    def test_trusted_proxies(self):
+        self.assertEqual('10.0.0.1', self.get_ip('1.2.3.4, 10.0.0.1, 192.168.0.1'))
+        self.assertEqual('10.0.0.1', self.get_ip('10.0.0.1, 192.168.0.1'))
+        self.assertEqual('10.0.0.1', self.get_ip('10.0.0.1'))
+
+
+@override_settings(RATELIMIT_ENABLED=True, RATELIMITS={'reply_topic': '2/m'})
+class ReplyTopicRateLimitTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        board = Board.objects.create(name='Django', description='Django board.')
+        user = User.objects.create_user(username='john', email='john@doe.com', password='123')
+        topic = Topic.objects.create(subject='Hello, world', board=board, starter=user)
+        Post.objects.create(message='Lorem ipsum dolor sit amet', topic=topic, created_by=user)
+        self.url = reverse('reply_topic', kwargs={'pk': board.pk, 'topic_pk': topic.pk})
+        self.client.login(username='john', password='123')
+
+    def test_throttled_reply(self):
+        """
+        Replies over the limit should get a 429 response with a Retry-After header and no post should be created.
+        """
+        for i in range(2):
+            self.client.post(self.url, {'message': 'hello, world!'})
+        response = self.client.post(self.url, {'message': 'hello, world!'})
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '30')
+        self.assertEqual(Post.objects.count(), 3)
+
+    def test_get_not_throttled(self):
+        """
+        Only posting is throttled, the reply form is still shown.
+        """
+        for i in range(3):
+            self.client.post(self.url, {'message': 'hello, world!'})
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
@@ -0,0 +1,103 @@
+import time
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from core import sampling_profiler
+
+
+def busy_wait(seconds):
+    started = time.perf_counter()
+    while time.perf_counter() - started < seconds:
+        pass
+
+
+@override_settings(SAMPLING_PROFILER_POLL=0)
+class SamplingProfilerTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        sampling_profiler.reset()
+        # Cleanups run last in first, the configuration is read again once the cache is cleared.
+        self.addCleanup(sampling_profiler.poll)
+        self.addCleanup(sampling_profiler.reset)
+        self.addCleanup(cache.clear)
+
+    def test_disabled(self):
+        self.assertFalse(sampling_profiler.should_profile())
+
+    def test_enabled(self):
+        sampling_profiler.enable(1, 60)
+        self.assertTrue(sampling_profiler.should_profile())
+        sampling_profiler.disable()
+        self.assertFalse(sampling_profiler.should_profile())
+
+    def test_samples_exported_collapsed(self):
+        sampling_profiler.start('home')
+        try:
+            busy_wait(0.1)
+        finally:
+            sampling_profiler.stop()
+        stacks = sampling_profiler.export().splitlines()
+        self.assertTrue(stacks)
+        stack, count = stacks[0].rsplit(' ', 1)
+        self.assertTrue(stack.startswith('home;'))
+        self.assertIn('busy_wait (tests/test_sampling_profiler.py:', stack)
+        self.assertGreater(int(count), 0)
+        self.assertEqual('', sampling_profiler.export('board_topics'))
+
+    def test_workers_of_every_host_exported(self):
+        """
+        Workers of different hosts may have the same pid, their stacks shouldn't overwrite each other.
+        """
+        for host, stack in (('web1', 'home;view'), ('web2', 'board_topics;view')):
+            with mock.patch('core.sampling_profiler.socket.gethostname', return_value=host), \
+                    mock.patch.dict(sampling_profiler._stacks, {stack: 1}, clear=True), \
+                    mock.patch.dict(sampling_profiler._state, dirty=True):
+                sampling_profiler.publish()
+        # Published again, registered once.
+        with mock.patch('core.sampling_profiler.socket.gethostname', return_value='web1'), \
+                mock.patch.dict(sampling_profiler._stacks, {'home;view': 2}, clear=True), \
+                mock.patch.dict(sampling_profiler._state, dirty=True):
+            sampling_profiler.publish()
+        self.assertEqual(2, len(sampling_profiler.get_workers(cache)))
+        self.assertEqual('board_topics;view 1\nhome;view 2', sampling_profiler.export())
+        sampling_profiler.reset()
+        self.assertEqual('', sampling_profiler.export())
+
+    def test_middleware_labels_with_url_name(self):
+        sampling_profiler.enable(1, 60)
+        with mock.patch.object(sampling_profiler, 'start') as start, \
+                mock.patch.object(sampling_profiler, 'relabel') as relabel:
+            self.client.get(reverse('home'))
+        start.assert_called_once_with('unresolved')
+        relabel.assert_called_once_with('home')
+
+
+class ProfilerViewTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(sampling_profiler.poll)
+        self.addCleanup(cache.clear)
+        self.user = User.objects.create_user(username='john', email='john@doe.com', password='123')
+        self.url = reverse('profiler')
+
+    def test_staff_only(self):
+        self.client.login(username='john', password='123')
+        self.assertEqual(403, self.client.get(self.url).status_code)
+        self.assertEqual(403, self.client.get(reverse('profiler_stacks')).status_code)
+
+    def test_start_and_stop(self):
+        User.objects.filter(pk=self.user.pk).update(is_staff=True)
+        self.client.login(username='john', password='123')
+        response = self.client.post(self.url, {'action': 'start', 'rate': '0.5', 'seconds': '30'})
+        self.assertRedirects(response, self.url)
+        self.assertEqual(0.5, sampling_profiler.get_config()['rate'])
+        self.assertContains(self.client.get(self.url), 'Sampling 50% of the requests')
+        self.client.post(self.url, {'action': 'stop'})
+        self.assertIsNone(sampling_profiler.get_config())
+        self.assertEqual(400, self.client.post(self.url, {'action': 'start', 'rate': '2'}).status_code)
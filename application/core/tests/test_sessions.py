@@ -0,0 +1,50 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from core.sessions.cached_db import SessionStore
+
+
+class WriteAvoidingSessionTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        session = SessionStore()
+        session['foo'] = 'bar'
+        session.save()
+        self.session_key = session.session_key
+
+    def test_unchanged_session_not_saved(self):
+        """
+        Setting a key to its current value should not write the session.
+        """
+        session = SessionStore(self.session_key)
+        session['foo'] = 'bar'
+        with self.assertNumQueries(0):
+            session.save()
+
+    def test_changed_session_saved(self):
+        session = SessionStore(self.session_key)
+        session['foo'] = 'baz'
+        session.save()
+        cache.clear()
+        self.assertEqual('baz', SessionStore(self.session_key)['foo'])
+
+
+class PurgeSessionsTests(TestCase):
+
+    def setUp(self):
+        for i in range(5):
+            Session.objects.create(
+                session_key='expired{0}'.format(i), session_data='', expire_date=timezone.now() - timedelta(days=1)
+            )
+        Session.objects.create(session_key='active', session_data='', expire_date=timezone.now() + timedelta(days=1))
+
+    def test_purge_expired_sessions(self):
+        call_command('purge_sessions', batch_size=2, stdout=StringIO())
+        self.assertEqual(['active'], list(Session.objects.values_list('session_key', flat=True)))
@@ -0,0 +1,95 @@
+import gzip
+import json
+import os
+import shutil
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.template import Context, Template
+from django.test import SimpleTestCase, override_settings
+
+from core.static_wsgi import StaticFilesApplication
+
+BUNDLES = {
+    'css/base.bundle.css': ['css/bootstrap.min.css', 'css/app.css'],
+    'js/base.bundle.js': ['js/jquery-3.4.0.min.js', 'js/bootstrap.bundle.min.js'],
+}
+
+
+@override_settings(STATIC_BUNDLES=BUNDLES)
+class BundleTagTests(SimpleTestCase):
+
+    def render(self):
+        return Template("{% load bundles %}{% bundle 'js/base.bundle.js' %}").render(Context())
+
+    @override_settings(STATIC_BUNDLING=True)
+    def test_bundled(self):
+        self.assertEqual('<script src="/static/js/base.bundle.js"></script>', self.render())
+
+    @override_settings(STATIC_BUNDLING=False)
+    def test_not_bundled(self):
+        """
+        Without bundling every file of the bundle gets its own tag.
+        """
+        html = self.render()
+        self.assertIn('<script src="/static/js/jquery-3.4.0.min.js"></script>', html)
+        self.assertIn('<script src="/static/js/bootstrap.bundle.min.js"></script>', html)
+
+
+class CollectStaticTests(SimpleTestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        with self.settings(
+            STATIC_ROOT=self.root,
+            STATIC_BUNDLES=BUNDLES,
+            STATICFILES_STORAGE='core.storage.CompressedManifestStaticFilesStorage'
+        ):
+            call_command('collectstatic', interactive=False, verbosity=0, stdout=StringIO())
+        with open(os.path.join(self.root, 'staticfiles.json')) as manifest:
+            self.paths = json.load(manifest)['paths']
+
+    def test_bundle_hashed_and_compressed(self):
+        """
+        The bundle should be listed in the manifest with a gzipped version of the hashed file.
+        """
+        hashed = self.paths['js/base.bundle.js']
+        self.assertNotEqual('js/base.bundle.js', hashed)
+        with open(os.path.join(self.root, hashed), 'rb') as bundle:
+            content = bundle.read()
+        with gzip.open(os.path.join(self.root, hashed + '.gz')) as compressed:
+            self.assertEqual(content, compressed.read())
+        self.assertIn(b'jQuery', content)
+        self.assertNotIn(b'sourceMappingURL', content)
+
+    def test_serve_hashed_file(self):
+        """
+        The WSGI layer should serve the gzipped hashed file with far-future cache headers.
+        """
+        application = StaticFilesApplication(None, root=self.root, prefix='/static/')
+        path = '/static/' + self.paths['js/base.bundle.js']
+        response = {}
+
+        def start_response(status, headers):
+            response['status'] = status
+            response['headers'] = dict(headers)
+
+        body = application({'PATH_INFO': path, 'REQUEST_METHOD': 'GET', 'HTTP_ACCEPT_ENCODING': 'gzip'}, start_response)
+        self.assertEqual('200 OK', response['status'])
+        self.assertEqual('gzip', response['headers']['Content-Encoding'])
+        self.assertIn('immutable', response['headers']['Cache-Control'])
+        self.assertEqual(int(response['headers']['Content-Length']), len(b''.join(body)))
+        body.close()
+
+        etag = response['headers']['ETag']
+        application(
+            {'PATH_INFO': path, 'REQUEST_METHOD': 'GET', 'HTTP_ACCEPT_ENCODING': 'gzip', 'HTTP_IF_NONE_MATCH': etag},
+            start_response
+        )
+        self.assertEqual('304 Not Modified', response['status'])
+
+    def test_unknown_path_passed_to_application(self):
+        application = StaticFilesApplication(lambda environ, start_response: ['django'], root=self.root, prefix='/static/')
+        self.assertEqual(['django'], application({'PATH_INFO': '/boards/1/', 'REQUEST_METHOD': 'GET'}, None))
@@ -0,0 +1,91 @@
+from django.contrib.auth.models import User
+from django.template import Context, Origin, Template
+from django.test import TestCase, override_settings
+
+from boards.models import Board, Post, Topic
+from core import strict
+
+
+class StrictLazyLoadTests(TestCase):
+
+    def setUp(self):
+        strict.install()
+        board = Board.objects.create(name='Django', description='Django board.')
+        user = User.objects.create_user(username='john', email='john@doe.com', password='123')
+        topic = Topic.objects.create(subject='Hello, world', board=board, starter=user)
+        self.post = Post.objects.create(message='Lorem ipsum dolor sit amet', topic=topic, created_by=user)
+
+    @override_settings(STRICT_LAZY_LOADS='raise')
+    def test_lazy_load_inside_guard_raises(self):
+        """
+        A foreign key loaded implicitly inside a guarded block should raise.
+        """
+        post = Post.objects.get(pk=self.post.pk)
+        with strict.guard('test'):
+            with self.assertRaises(strict.LazyLoadError):
+                post.topic
+
+    @override_settings(STRICT_LAZY_LOADS='log')
+    def test_lazy_load_inside_guard_logs(self):
+        """
+        In 'log' mode the lazy load should be reported and still return the related object.
+        """
+        post = Post.objects.get(pk=self.post.pk)
+        with strict.guard('test'):
+            with self.assertLogs('core.strict', level='WARNING') as logs:
+                self.assertEqual('Hello, world', post.topic.subject)
+        self.assertIn('Lazy load of Post.topic in test', logs.output[0])
+
+    @override_settings(STRICT_LAZY_LOADS='raise')
+    def test_selected_relation_inside_guard(self):
+        """
+        Relations selected with the query are not lazy loads.
+        """
+        post = Post.objects.select_related('topic').get(pk=self.post.pk)
+        with strict.guard('test'):
+            self.assertEqual('Hello, world', post.topic.subject)
+
+    @override_settings(STRICT_LAZY_LOADS='raise')
+    def test_lazy_load_outside_guard(self):
+        """
+        Code that isn't guarded is left alone.
+        """
+        post = Post.objects.get(pk=self.post.pk)
+        self.assertEqual('Hello, world', post.topic.subject)
+
+
+class StrictTemplateTests(TestCase):
+
+    def setUp(self):
+        strict.install()
+        self.board = Board.objects.create(name='Django', description='Django board.')
+        user = User.objects.create_user(username='john', email='john@doe.com', password='123')
+        self.topic = Topic.objects.create(subject='Hello, world', board=self.board, starter=user)
+
+    def render(self, source, context):
+        origin = Origin(name='test.html', template_name='boards/test.html')
+        return Template(source, origin=origin).render(Context(context))
+
+    @override_settings(STRICT_LAZY_LOADS='raise')
+    def test_related_manager_query_raises(self):
+        """
+        A related manager query fired by the template should name the template and the line.
+        """
+        with self.assertRaisesMessage(strict.LazyLoadError, 'Board.topics in template boards/test.html, line 2'):
+            self.render('{{ board.name }}\n{{ board.topics.count }}', {'board': self.board})
+
+    @override_settings(STRICT_LAZY_LOADS='raise')
+    def test_lazy_foreign_key_raises(self):
+        topic = Topic.objects.get(pk=self.topic.pk)
+        with self.assertRaisesMessage(strict.LazyLoadError, 'Topic.starter in template boards/test.html, line 1'):
+            self.render('{{ topic.starter.username }}', {'topic': topic})
+
+    @override_settings(STRICT_LAZY_LOADS='raise')
+    def test_prefetched_relations(self):
+        """
+        Relations loaded by the view should render without being flagged.
+        """
+        topic = Topic.objects.select_related('starter').get(pk=self.topic.pk)
+        board = Board.objects.prefetch_related('topics').get(pk=self.board.pk)
+        self.assertEqual('john', self.render('{{ topic.starter.username }}', {'topic': topic}))
+        self.assertEqual('1', self.render('{{ board.topics.count }}', {'board': board}))
@@ -0,0 +1,46 @@
+from django import forms
+from django.contrib.auth.models import User
+from django.template import Context, Template
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from boards.models import Board
+from core import template_profiler
+
+
+class ExampleForm(forms.Form):
+    name = forms.CharField()
+
+
+class TemplateProfilerTests(SimpleTestCase):
+
+    def setUp(self):
+        template_profiler.install()
+
+    def test_filter_timings(self):
+        """
+        Templates compiled after the profiler is installed report their custom filters.
+        """
+        template = Template('{% load form_tags %}{{ form.name|input_class }}')
+        template_profiler.start()
+        template.render(Context({'form': ExampleForm()}))
+        labels = [label for label, calls, seconds in template_profiler.stop()]
+        self.assertIn('filter form_tags.input_class', labels)
+
+
+@override_settings(TEMPLATE_PROFILING=True)
+class TemplateProfilingMiddlewareTests(TestCase):
+
+    def setUp(self):
+        board = Board.objects.create(name='Django', description='Django board.')
+        User.objects.create_user(username='john', email='john@doe.com', password='123')
+        self.client.login(username='john', password='123')
+        self.response = self.client.get(reverse('new_topic', kwargs={'pk': board.pk}))
+
+    def test_server_timing(self):
+        """
+        The response should report the render time of its templates and includes.
+        """
+        server_timing = self.response['Server-Timing']
+        self.assertIn('template boards/new_topic.html', server_timing)
+        self.assertIn("include 'boards/includes/form.html' at boards/new_topic.html, line 16", server_timing)
@@ -0,0 +1,71 @@
+import os
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+
+from core import warmup
+
+
+class WarmUpTests(TestCase):
+
+    def test_warm_templates(self):
+        names = warmup.warm_templates(['boards/', 'accounts/'])
+        self.assertIn('boards/base.html', names)
+        self.assertIn('boards/includes/form.html', names)
+        self.assertIn('accounts/password_reset_subject.txt', names)
+        self.assertNotIn('admin/base.html', names)
+
+    def test_warm_urls(self):
+        names = warmup.warm_urls()
+        self.assertIn('home', names)
+        self.assertIn('topic_posts', names)
+
+    def test_warm_database_needs_persistent_connections(self):
+        with mock.patch.dict(connection.settings_dict, CONN_MAX_AGE=0):
+            self.assertEqual([], warmup.warm_database())
+        with mock.patch.dict(connection.settings_dict, CONN_MAX_AGE=60):
+            self.assertEqual([connection.alias], warmup.warm_database())
+
+    def test_warm_up(self):
+        """
+        Every step should run and warm something.
+        """
+        with mock.patch.dict(connection.settings_dict, CONN_MAX_AGE=60):
+            steps = warmup.warm_up()
+        self.assertEqual([name for name, step in warmup.WARMUP_STEPS], [name for name, seconds, warmed in steps])
+        self.assertTrue(all(warmed for name, seconds, warmed in steps))
+
+
+class PreloadTests(SimpleTestCase):
+
+    def test_preload(self):
+        """
+        Preloading should warm everything but the connections and freeze the objects created so far.
+        """
+        with mock.patch('core.warmup.gc') as gc:
+            steps = warmup.preload()
+        names = [name for name, seconds, warmed in steps]
+        self.assertIn('models', names)
+        self.assertNotIn('database', names)
+        gc.freeze.assert_called_once_with()
+
+
+class MemoryReportTests(SimpleTestCase):
+
+    def test_memory_report(self):
+        out = StringIO()
+        call_command('memory_report', os.getpid(), stdout=out)
+        self.assertIn('master', out.getvalue())
+        self.assertIn('total', out.getvalue())
+
+
+class StartupProfileTests(SimpleTestCase):
+
+    def test_startup_profile(self):
+        out = StringIO()
+        call_command('startup_profile', limit=5, stdout=out)
+        self.assertIn('Warm up templates', out.getvalue())
+        self.assertIn('django.core.wsgi', out.getvalue())
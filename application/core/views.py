@@ -1,3 +1,62 @@
-from django.shortcuts import render
+import time
 
-# Create your views here.
+from django.conf import settings
+from django.contrib.auth.mixins import UserPassesTestMixin
+from django.http import HttpResponse, HttpResponseBadRequest
+from django.shortcuts import redirect
+from django.views.generic import TemplateView, View
+
+from core import sampling_profiler
+
+
+class StaffRequiredMixin(UserPassesTestMixin):
+
+    def test_func(self):
+        return self.request.user.is_staff
+
+
+class ProfilerView(StaffRequiredMixin, TemplateView):
+    """
+    Turns the sampling profiler of the workers on and off.
+    """
+    template_name = 'core/profiler.html'
+
+    def get_context_data(self, **kwargs):
+        context = super(ProfilerView, self).get_context_data(**kwargs)
+        config = sampling_profiler.get_config()
+        if config:
+            context['rate'] = config['rate']
+            context['remaining'] = int(config['until'] - time.time())
+        context['max_seconds'] = getattr(settings, 'SAMPLING_PROFILER_MAX_SECONDS', 3600)
+        return context
+
+    def post(self, request, *args, **kwargs):
+        action = request.POST.get('action')
+        if action == 'start':
+            try:
+                rate = float(request.POST.get('rate', 1))
+                seconds = int(request.POST.get('seconds', 60))
+            except ValueError:
+                return HttpResponseBadRequest('Invalid rate or duration.')
+            max_seconds = getattr(settings, 'SAMPLING_PROFILER_MAX_SECONDS', 3600)
+            if not 0 < rate <= 1 or not 0 < seconds <= max_seconds:
+                return HttpResponseBadRequest('The rate must be in ]0, 1], the duration in ]0, {0}].'.format(max_seconds))
+            sampling_profiler.enable(rate, seconds)
+        elif action == 'stop':
+            sampling_profiler.disable()
+        elif action == 'reset':
+            sampling_profiler.reset()
+        else:
+            return HttpResponseBadRequest('Unknown action.')
+        return redirect('profiler')
+
+
+class ProfilerStacksView(StaffRequiredMixin, View):
+    """
+    Exports the sampled stacks in the collapsed format, e.g. for `flamegraph.pl stacks.txt > flamegraph.svg`.
+    """
+
+    def get(self, request, *args, **kwargs):
+        response = HttpResponse(sampling_profiler.export(request.GET.get('url_name')), content_type='text/plain')
+        response['Content-Disposition'] = 'attachment; filename="stacks.txt"'
+        return response
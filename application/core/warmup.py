@@ -0,0 +1,160 @@
+import gc
+import logging
+import os
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.contrib.auth.hashers import get_hashers
+from django.core.cache import caches
+from django.db import connections
+from django.template import engines
+from django.template.utils import get_app_template_dirs
+from django.urls import get_resolver, resolve
+from django.utils import translation
+
+logger = logging.getLogger(__name__)
+
+
+def get_template_names(prefixes):
+    """
+    Lists the templates found in the template directories whose names start with one of `prefixes`.
+    """
+    names = set()
+    for backend in engines.all():
+        for directory in set(getattr(backend, 'template_dirs', ())) | set(get_app_template_dirs('templates')):
+            for root, dirnames, filenames in os.walk(directory):
+                for filename in filenames:
+                    name = os.path.relpath(os.path.join(root, filename), directory).replace(os.sep, '/')
+                    if name.startswith(tuple(prefixes)) and name.endswith(('.html', '.txt')):
+                        names.add(name)
+    return sorted(names)
+
+
+def warm_templates(prefixes=None):
+    """
+    Compiles the `WARMUP_TEMPLATES` templates so the cached loader holds them before the first request.
+    """
+    prefixes = prefixes if prefixes is not None else getattr(settings, 'WARMUP_TEMPLATES', ())
+    names = get_template_names(prefixes)
+    for backend in engines.all():
+        for name in names:
+            backend.get_template(name)
+    return names
+
+
+def warm_urls():
+    """
+    Imports the URLconf (and the views), populates the resolver and resolves a path of every named URL.
+    """
+    resolver = get_resolver()
+    names = [name for name in resolver.reverse_dict if isinstance(name, str)]
+    for name in names:
+        for possibility, pattern, defaults, converters in resolver.reverse_dict.getlist(name):
+            for result, params in possibility:
+                path = '/' + result % {param: '1' for param in params}
+                try:
+                    resolve(path)
+                except Exception:
+                    # Converters that don't accept the placeholder value, nothing to warm.
+                    pass
+    return names
+
+
+def warm_database():
+    """
+    Opens the connection of every database with persistent connections. Without (CONN_MAX_AGE 0), the first
+    request would close it before using it.
+    """
+    warmed = []
+    for connection in connections.all():
+        if connection.settings_dict['CONN_MAX_AGE']:
+            connection.ensure_connection()
+            warmed.append(connection.alias)
+    return warmed
+
+
+def warm_caches():
+    """
+    Connects to every cache backend.
+    """
+    for alias in settings.CACHES:
+        caches[alias].get('warmup')
+    return list(settings.CACHES)
+
+
+def warm_models():
+    """
+    Fills the cached metadata of every model (fields, relations, managers).
+    """
+    models = apps.get_models()
+    for model in models:
+        opts = model._meta
+        opts.get_fields()
+        for name in ('fields_map', 'related_objects', 'concrete_fields', 'local_concrete_fields', 'managers',
+                     'base_manager', 'default_manager', '_property_names', '_forward_fields_map'):
+            getattr(opts, name)
+    return models
+
+
+def warm_misc():
+    """
+    Loads the translation catalog and the password hashers (and their libraries).
+    """
+    translation.activate(settings.LANGUAGE_CODE)
+    hashers = get_hashers()
+    translation.deactivate()
+    return [hasher.algorithm for hasher in hashers]
+
+
+WARMUP_STEPS = [
+    ('urls', warm_urls),
+    ('templates', warm_templates),
+    ('models', warm_models),
+    ('database', warm_database),
+    ('caches', warm_caches),
+    ('misc', warm_misc),
+]
+
+# Connections can't be shared between forked workers, they're opened by each worker on its first request.
+CONNECTION_STEPS = ('database', 'caches')
+
+
+def warm_up(skip=()):
+    """
+    Runs the warm up steps so the first requests of a worker don't pay for them.
+    A failing step is logged and skipped, the worker must start anyway.
+    Returns (step, seconds, warmed items count) tuples.
+    """
+    steps = []
+    for name, step in WARMUP_STEPS:
+        if name in skip:
+            continue
+        started = time.perf_counter()
+        try:
+            warmed = len(step())
+        except Exception:
+            logger.exception('Warm up step %s failed.', name)
+            warmed = 0
+        steps.append((name, time.perf_counter() - started, warmed))
+    logger.info('Warmed up: %s', ', '.join('{0} {1} in {2:.0f}ms'.format(
+        name, warmed, seconds * 1000) for name, seconds, warmed in steps
+    ))
+    return steps
+
+
+def preload():
+    """
+    Fully initializes the application in the master process of a preforking server, before the workers are
+    forked. The connections are left closed and the objects created so far are moved out of the garbage
+    collector's reach (gc.freeze), so collections in the workers don't write to the pages they share with the
+    master and the other workers.
+    """
+    steps = warm_up(skip=CONNECTION_STEPS)
+    connections.close_all()
+    for cache in caches.all():
+        cache.close()
+    gc.collect()
+    gc.freeze()
+    logger.info('Preloaded, %d objects frozen.', gc.get_freeze_count())
+    return steps
@@ -0,0 +1,31 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+from core_account import hashing
+
+
+class PooledModelBackend(ModelBackend):
+    """
+    ModelBackend checking the passwords in the hashing pool (see core_account.hashing), raises hashing.Busy when
+    its queue is full, answered 503 by HashingBusyMiddleware.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        user_model = get_user_model()
+        if username is None:
+            username = kwargs.get(user_model.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+        try:
+            user = user_model._default_manager.get_by_natural_key(username)
+        except user_model.DoesNotExist:
+            # Hashes anyway, like ModelBackend, so unknown usernames don't answer faster.
+            hashing.make_password(password)
+            return None
+        correct, must_update = hashing.verify(password, user.password)
+        if not correct or not self.user_can_authenticate(user):
+            return None
+        if must_update:
+            user.password = hashing.make_password(password)
+            user.save(update_fields=['password'])
+        return user
@@ -1,11 +1,56 @@
+import operator
+from functools import reduce
+
 from django import forms
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth.models import User
+from django.db.models import Q
+
+from core_account import hashing
+
+DUPLICATE_USERNAME = 'A user with that username already exists.'
+DUPLICATE_EMAIL = 'A user with that email address already exists.'
 
 
 class SignUpForm(UserCreationForm):
-    email = forms.CharField(max_length=254, required=True, widget=forms.EmailInput())
+    email = forms.EmailField(max_length=254, required=True, widget=forms.EmailInput())
 
     class Meta:
         model = User
         fields = ['username', 'email', 'password1', 'password2']
+
+    def clean(self):
+        """
+        Checks the username and email are free, ignoring the case, in one query. The unique indexes on
+        UPPER(username) and UPPER(email) (see core_account.models) back it and serve it.
+        """
+        cleaned_data = super(SignUpForm, self).clean()
+        username = cleaned_data.get('username')
+        email = cleaned_data.get('email')
+        lookups = []
+        if username:
+            lookups.append(Q(username__iexact=username))
+        if email:
+            # Implies the condition of the partial index on UPPER(email), for PostgreSQL to use it.
+            lookups.append(Q(email__iexact=email) & ~Q(email=''))
+        if lookups:
+            taken = User.objects.filter(reduce(operator.or_, lookups)).values_list('username', 'email')
+            # At most a user with the username and another one with the email.
+            for taken_username, taken_email in taken[:2]:
+                if username and taken_username.upper() == username.upper():
+                    self.add_error('username', DUPLICATE_USERNAME)
+                if email and taken_email.upper() == email.upper():
+                    self.add_error('email', DUPLICATE_EMAIL)
+        return cleaned_data
+
+    def validate_unique(self):
+        # The username is already checked by clean().
+        pass
+
+    def save(self, commit=True):
+        # ModelForm.save(), the password is hashed in the hashing pool instead of by set_password().
+        user = super(UserCreationForm, self).save(commit=False)
+        user.password = hashing.make_password(self.cleaned_data['password1'])
+        if commit:
+            user.save()
+        return user
@@ -0,0 +1,88 @@
+import base64
+import hashlib
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher, BasePasswordHasher, PBKDF2PasswordHasher, mask_hash
+)
+from django.utils.crypto import constant_time_compare
+from django.utils.translation import gettext_noop as _
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2 with the iterations set by `PASSWORD_PBKDF2_ITERATIONS`.
+    Hashes with other iterations are rehashed on the next successful login.
+    """
+
+    def __init__(self):
+        self.iterations = getattr(settings, 'PASSWORD_PBKDF2_ITERATIONS', self.iterations)
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2 with the costs set by `PASSWORD_ARGON2_TIME_COST`, `PASSWORD_ARGON2_MEMORY_COST` and
+    `PASSWORD_ARGON2_PARALLELISM`. Requires the argon2-cffi package.
+    """
+
+    def __init__(self):
+        self.time_cost = getattr(settings, 'PASSWORD_ARGON2_TIME_COST', self.time_cost)
+        self.memory_cost = getattr(settings, 'PASSWORD_ARGON2_MEMORY_COST', self.memory_cost)
+        self.parallelism = getattr(settings, 'PASSWORD_ARGON2_PARALLELISM', self.parallelism)
+
+
+class ScryptPasswordHasher(BasePasswordHasher):
+    """
+    Scrypt from the standard library with the costs set by `PASSWORD_SCRYPT_N`, `PASSWORD_SCRYPT_R` and
+    `PASSWORD_SCRYPT_P`. The encoded format is the one of the scrypt hasher of later Django versions.
+    """
+    algorithm = 'scrypt'
+    work_factor = 2 ** 14
+    block_size = 8
+    parallelism = 1
+
+    def __init__(self):
+        self.work_factor = getattr(settings, 'PASSWORD_SCRYPT_N', self.work_factor)
+        self.block_size = getattr(settings, 'PASSWORD_SCRYPT_R', self.block_size)
+        self.parallelism = getattr(settings, 'PASSWORD_SCRYPT_P', self.parallelism)
+
+    def encode(self, password, salt, n=None, r=None, p=None):
+        assert password is not None
+        assert salt and '$' not in salt
+        n = n or self.work_factor
+        r = r or self.block_size
+        p = p or self.parallelism
+        hash = hashlib.scrypt(
+            password.encode(), salt=salt.encode(), n=n, r=r, p=p, maxmem=256 * n * r * p, dklen=64
+        )
+        hash = base64.b64encode(hash).decode('ascii').strip()
+        return '%s$%d$%s$%d$%d$%s' % (self.algorithm, n, salt, r, p, hash)
+
+    def decode(self, encoded):
+        algorithm, n, salt, r, p, hash = encoded.split('$', 5)
+        assert algorithm == self.algorithm
+        return int(n), salt, int(r), int(p), hash
+
+    def verify(self, password, encoded):
+        n, salt, r, p, hash = self.decode(encoded)
+        return constant_time_compare(encoded, self.encode(password, salt, n, r, p))
+
+    def safe_summary(self, encoded):
+        n, salt, r, p, hash = self.decode(encoded)
+        return OrderedDict([
+            (_('algorithm'), self.algorithm),
+            (_('work factor'), n),
+            (_('block size'), r),
+            (_('parallelism'), p),
+            (_('salt'), mask_hash(salt)),
+            (_('hash'), mask_hash(hash)),
+        ])
+
+    def must_update(self, encoded):
+        n, salt, r, p, hash = self.decode(encoded)
+        return (n, r, p) != (self.work_factor, self.block_size, self.parallelism)
+
+    def harden_runtime(self, password, encoded):
+        # The memory hard cost of scrypt can't be topped up like PBKDF2 iterations.
+        pass
@@ -0,0 +1,170 @@
+"""
+Password hashing offloaded to a process pool, so login bursts don't hold the request threads (and the GIL) of the
+workers. Every worker process has its own pool of `PASSWORD_HASHING_PROCESSES` processes, created on first use.
+At most `PASSWORD_HASHING_QUEUE` passwords are being hashed or waiting per worker: past it, a request waits up to
+`PASSWORD_HASHING_WAIT` seconds for a slot, then `Busy` is raised and the view answers 503 (see
+core_account.middleware).
+"""
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+LATENCY_SAMPLES = 1000
+
+_lock = threading.Lock()
+_executor = None
+_slots = None
+_state = {}
+_latencies = deque(maxlen=LATENCY_SAMPLES)
+_hash_times = deque(maxlen=LATENCY_SAMPLES)
+
+
+class Busy(Exception):
+    """
+    Raised when the hashing queue of the worker is full.
+    """
+
+
+def _reset():
+    global _executor, _slots
+    _executor = None
+    _slots = None
+    _state.update(in_flight=0, max_in_flight=0, completed=0, rejected=0)
+    _latencies.clear()
+    _hash_times.clear()
+
+
+def _after_fork():
+    global _lock
+    # The lock may have been held by another thread of the parent.
+    _lock = threading.Lock()
+    _reset()
+
+
+_reset()
+# The pool of the parent process can't be used by a forked one, e.g. a worker forked by a preloading master.
+os.register_at_fork(after_in_child=_after_fork)
+
+
+def shutdown():
+    """
+    Stops the pool of this worker, the next hash starts a new one with the current settings.
+    """
+    with _lock:
+        executor = _executor
+        _reset()
+    if executor is not None:
+        executor.shutdown()
+
+
+def get_processes():
+    return getattr(settings, 'PASSWORD_HASHING_PROCESSES', 2)
+
+
+def _get_executor():
+    global _executor, _slots
+    with _lock:
+        if _slots is None:
+            _slots = threading.BoundedSemaphore(getattr(settings, 'PASSWORD_HASHING_QUEUE', 8))
+        if _executor is None and get_processes():
+            _executor = ProcessPoolExecutor(get_processes())
+        return _executor, _slots
+
+
+def _timed(func, *args):
+    started = time.perf_counter()
+    return func(*args), time.perf_counter() - started
+
+
+def _verify(password, encoded):
+    # Runs in the pool, the hash is updated by the calling process when it must be.
+    must_update = []
+    correct = hashers.check_password(password, encoded, setter=must_update.append)
+    return correct, bool(must_update)
+
+
+def run(func, *args):
+    """
+    Runs `func(*args)` in the pool, `func` and the arguments must be picklable. Raises Busy when no slot frees up
+    within `PASSWORD_HASHING_WAIT` seconds.
+    """
+    global _executor
+    executor, slots = _get_executor()
+    if not slots.acquire(timeout=getattr(settings, 'PASSWORD_HASHING_WAIT', 0.5)):
+        with _lock:
+            _state['rejected'] += 1
+        raise Busy
+    started = time.perf_counter()
+    with _lock:
+        _state['in_flight'] += 1
+        _state['max_in_flight'] = max(_state['max_in_flight'], _state['in_flight'])
+    try:
+        if executor is None:
+            result, seconds = _timed(func, *args)
+        else:
+            result, seconds = executor.submit(_timed, func, *args).result()
+    except BrokenProcessPool:
+        # A pool process died, the next hash starts a new pool.
+        with _lock:
+            if _executor is executor:
+                _executor = None
+        raise
+    finally:
+        slots.release()
+        with _lock:
+            _state['in_flight'] -= 1
+    with _lock:
+        _state['completed'] += 1
+        _latencies.append(time.perf_counter() - started)
+        _hash_times.append(seconds)
+    return result
+
+
+def make_password(password):
+    return run(hashers.make_password, password)
+
+
+def verify(password, encoded):
+    """
+    Returns whether `password` matches `encoded` and whether `encoded` must be hashed again with the preferred
+    hasher.
+    """
+    return run(_verify, password, encoded)
+
+
+def metrics():
+    """
+    Returns the queue depth and the latencies of the hashes of this worker, in milliseconds. The latency is the
+    time a request waited for its hash, the hash time the part spent hashing.
+    """
+
+    def percentiles(samples):
+        samples = sorted(samples)
+        if not samples:
+            return {'p50': None, 'p99': None, 'max': None}
+        return {
+            'p50': round(samples[len(samples) // 2] * 1000, 2),
+            'p99': round(samples[min(len(samples) - 1, int(len(samples) * 0.99))] * 1000, 2),
+            'max': round(samples[-1] * 1000, 2),
+        }
+
+    with _lock:
+        state = dict(_state)
+        latencies = list(_latencies)
+        hash_times = list(_hash_times)
+    processes = get_processes()
+    return dict(
+        state,
+        pid=os.getpid(),
+        processes=processes,
+        capacity=getattr(settings, 'PASSWORD_HASHING_QUEUE', 8),
+        queued=max(0, state['in_flight'] - processes) if processes else 0,
+        latency_ms=percentiles(latencies),
+        hash_ms=percentiles(hash_times),
+    )
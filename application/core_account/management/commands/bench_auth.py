@@ -0,0 +1,48 @@
+import os
+import time
+from multiprocessing import Pool
+
+from django.contrib.auth.hashers import get_hashers
+from django.core.management.base import BaseCommand
+
+PASSWORD = 'correct horse battery staple'
+
+
+def verify_for(args):
+    """
+    Verifies the password against `encoded` for `seconds` and returns the number of verifications done.
+    """
+    algorithm, encoded, seconds = args
+    hasher = next(hasher for hasher in get_hashers() if hasher.algorithm == algorithm)
+    count = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        hasher.verify(PASSWORD, encoded)
+        count += 1
+    return count
+
+
+class Command(BaseCommand):
+    help = 'Measures password checks per second for each configured hasher, per CPU core and in total.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seconds', type=float, default=3, help='Duration of each measure.')
+        parser.add_argument('--processes', type=int, default=os.cpu_count(), help='Number of parallel processes.')
+
+    def handle(self, *args, **options):
+        seconds = options['seconds']
+        processes = options['processes']
+        self.stdout.write('{0:<30} {1:>12} {2:>14} {3:>12}'.format('hasher', 'ms/check', 'checks/s/core', 'checks/s'))
+        for hasher in get_hashers():
+            try:
+                encoded = hasher.encode(PASSWORD, hasher.salt())
+            except ValueError as e:
+                # Hashers with a missing library can't be measured.
+                self.stdout.write('{0:<30} skipped: {1}'.format(hasher.algorithm, e))
+                continue
+            single = verify_for((hasher.algorithm, encoded, seconds))
+            with Pool(processes) as pool:
+                total = sum(pool.map(verify_for, [(hasher.algorithm, encoded, seconds)] * processes))
+            self.stdout.write('{0:<30} {1:>12.2f} {2:>14.1f} {3:>12.1f}'.format(
+                hasher.algorithm, seconds * 1000 / single, single / seconds, total / seconds
+            ))
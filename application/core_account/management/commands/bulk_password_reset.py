@@ -0,0 +1,125 @@
+import queue
+import threading
+import time
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX
+from django.contrib.auth.tokens import default_token_generator
+from django.core.mail import EmailMessage, get_connection
+from django.core.management.base import BaseCommand
+from django.template import loader
+from django.utils.encoding import force_bytes
+from django.utils.http import urlsafe_base64_encode
+
+SUBJECT_TEMPLATE = 'accounts/password_reset_subject.txt'
+EMAIL_TEMPLATE = 'accounts/password_reset_email.html'
+
+
+class Sender(threading.Thread):
+    """
+    Sends the batches of messages put in `batches` over a single SMTP connection, kept open until a None batch.
+    """
+
+    def __init__(self, batches):
+        super(Sender, self).__init__(daemon=True)
+        self.batches = batches
+        self.sent = 0
+        self.failed = 0
+        self.error = None
+
+    def run(self):
+        connection = get_connection()
+        while True:
+            messages = self.batches.get()
+            if messages is None:
+                break
+            try:
+                # Opened once, send_messages() leaves open the connections it didn't open.
+                connection.open()
+                self.sent += connection.send_messages(messages) or 0
+            except Exception as e:
+                self.failed += len(messages)
+                self.error = e
+                # The server may have dropped the connection, the next batch opens a new one.
+                connection.close()
+        connection.close()
+
+
+class Command(BaseCommand):
+    help = (
+        'Sends the password reset email to every active user with a usable password, like the password reset '
+        'view but in batches. The templates are compiled once, the tokens and messages of the next batch are '
+        'generated while the current one is sent, over one reused connection per --connections.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--domain', required=True, help='Domain of the reset links, e.g. boards.example.com.')
+        parser.add_argument('--https', action='store_true', help='Reset links use https.')
+        parser.add_argument('--from-email', help='Sender address, DEFAULT_FROM_EMAIL by default.')
+        parser.add_argument('--batch-size', type=int, default=500, help='Number of users per batch.')
+        parser.add_argument('--connections', type=int, default=1, help='Number of concurrent SMTP connections.')
+
+    def handle(self, *args, **options):
+        subject_template = loader.get_template(SUBJECT_TEMPLATE)
+        email_template = loader.get_template(EMAIL_TEMPLATE)
+        context = {
+            'domain': options['domain'],
+            'site_name': options['domain'],
+            'protocol': 'https' if options['https'] else 'http',
+        }
+        users = get_user_model().objects.filter(is_active=True).exclude(email='').exclude(
+            password__startswith=UNUSABLE_PASSWORD_PREFIX
+        ).order_by('pk')
+        total = users.count()
+        self.stdout.write('Sending {0} password reset emails...'.format(total))
+
+        # Bounded, so the batches aren't generated faster than they're sent.
+        batches = queue.Queue(maxsize=options['connections'] * 2)
+        senders = [Sender(batches) for i in range(options['connections'])]
+        for sender in senders:
+            sender.start()
+        started = time.perf_counter()
+        generated = 0
+        last_pk = 0
+        try:
+            while True:
+                # The token is made of the pk, password and last login.
+                batch = list(users.filter(pk__gt=last_pk).only(
+                    'pk', 'username', 'email', 'password', 'last_login'
+                )[:options['batch_size']])
+                if not batch:
+                    break
+                last_pk = batch[-1].pk
+                messages = []
+                for user in batch:
+                    user_context = dict(
+                        context, email=user.email, user=user, uid=urlsafe_base64_encode(force_bytes(user.pk)),
+                        token=default_token_generator.make_token(user),
+                    )
+                    # Email subject *must not* contain newlines
+                    subject = ''.join(subject_template.render(user_context).splitlines())
+                    messages.append(EmailMessage(
+                        subject, email_template.render(user_context), options['from_email'], [user.email]
+                    ))
+                batches.put(messages)
+                generated += len(messages)
+                elapsed = time.perf_counter() - started
+                self.stdout.write('Generated {0}/{1}, sent {2} ({3:.1f} emails/s).'.format(
+                    generated, total, sum(sender.sent for sender in senders),
+                    sum(sender.sent for sender in senders) / elapsed if elapsed else 0
+                ))
+        finally:
+            for sender in senders:
+                batches.put(None)
+            for sender in senders:
+                sender.join()
+
+        elapsed = time.perf_counter() - started
+        sent = sum(sender.sent for sender in senders)
+        failed = sum(sender.failed for sender in senders)
+        self.stdout.write('Sent {0} password reset emails in {1:.1f}s, {2:.1f} emails/s, {3} failed.'.format(
+            sent, elapsed, sent / elapsed if elapsed else 0, failed
+        ))
+        for sender in senders:
+            if sender.error is not None:
+                self.stderr.write('Last error: {0!r}'.format(sender.error))
@@ -0,0 +1,155 @@
+import csv
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Upper
+
+from core_account.models import Profile
+
+
+def hash_password(password):
+    # No password, an unusable one: the user sets it with a password reset.
+    return make_password(password or None)
+
+
+class Command(BaseCommand):
+    help = (
+        'Creates the users of a CSV file with username, email and optional password columns, with bulk inserts. '
+        'The passwords are hashed in a process pool while the previous batches are inserted. Users whose username '
+        'or email (ignoring the case) is taken or repeated in the file, and invalid rows, are skipped. A batch '
+        'failing on a user created meanwhile is inserted again without the users taken, and reported.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV file, - for the standard input.')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Number of users per insert.')
+        parser.add_argument('--processes', type=int, default=os.cpu_count(), help='Number of hashing processes.')
+
+    def handle(self, *args, **options):
+        if options['path'] == '-':
+            rows = list(csv.DictReader(sys.stdin))
+        else:
+            with open(options['path'], newline='') as f:
+                rows = list(csv.DictReader(f))
+        if rows and not {'username', 'email'} <= set(rows[0]):
+            raise CommandError('The CSV file needs username and email columns.')
+        rows, invalid = self.validate(rows)
+        rows, taken = self.exclude_taken(rows, options['batch_size'])
+        self.stdout.write('Creating {0} users, {1} invalid or repeated and {2} taken skipped...'.format(
+            len(rows), invalid, taken
+        ))
+
+        user_model = get_user_model()
+        batch_size = options['batch_size']
+        started = time.perf_counter()
+        created = 0
+        skipped = 0
+        with Pool(options['processes']) as pool:
+            hashes = pool.imap(
+                hash_password, [row.get('password') for row in rows],
+                chunksize=max(1, batch_size // options['processes'])
+            )
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start:start + batch_size]
+                users = [
+                    user_model(username=row['username'], email=row['email'], password=next(hashes)) for row in batch
+                ]
+                try:
+                    self.insert(users)
+                except IntegrityError:
+                    # A username or email taken since exclude_taken(), e.g. by a signup: the rows still free are
+                    # inserted again, once.
+                    free, taken = self.exclude_taken(batch, batch_size)
+                    free = {row['username'] for row in free}
+                    users = [user for user in users if user.username in free]
+                    try:
+                        self.insert(users)
+                    except IntegrityError as e:
+                        skipped += len(batch)
+                        self.stderr.write('Skipped the batch of rows {0} to {1}: {2}'.format(
+                            start + 1, start + len(batch), e
+                        ))
+                        continue
+                    skipped += taken
+                    self.stderr.write('Skipped {0} users of the rows {1} to {2} taken meanwhile.'.format(
+                        taken, start + 1, start + len(batch)
+                    ))
+                created += len(users)
+                elapsed = time.perf_counter() - started
+                self.stdout.write('Created {0}/{1} ({2:.1f} users/s).'.format(created, len(rows), created / elapsed))
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write('Created {0} users in {1:.1f}s, {2:.1f} users/s, {3} skipped.'.format(
+            created, elapsed, created / elapsed if elapsed else 0, skipped
+        ))
+
+    def insert(self, users):
+        """
+        Inserts `users` with their profiles, in a transaction.
+        """
+        user_model = get_user_model()
+        with transaction.atomic():
+            user_model.objects.bulk_create(users)
+            # bulk_create() doesn't send post_save nor returns the pks on every database.
+            pks = user_model.objects.filter(username__in=[user.username for user in users]).values_list(
+                'pk', flat=True
+            )
+            Profile.objects.bulk_create([Profile(user_id=pk) for pk in pks])
+
+    def validate(self, rows):
+        """
+        Returns the valid rows, without the ones repeating a username or email, and the number of skipped rows.
+        """
+        user_model = get_user_model()
+        username_validator = user_model.username_validator
+        username_length = user_model._meta.get_field('username').max_length
+        email_length = user_model._meta.get_field('email').max_length
+        valid = []
+        usernames = set()
+        emails = set()
+        for row in rows:
+            row['username'] = (row.get('username') or '').strip()
+            row['email'] = (row.get('email') or '').strip()
+            try:
+                username_validator(row['username'])
+                validate_email(row['email'])
+            except ValidationError:
+                continue
+            if len(row['username']) > username_length or len(row['email']) > email_length:
+                continue
+            if row['username'].upper() in usernames or row['email'].upper() in emails:
+                continue
+            usernames.add(row['username'].upper())
+            emails.add(row['email'].upper())
+            valid.append(row)
+        return valid, len(rows) - len(valid)
+
+    def exclude_taken(self, rows, batch_size):
+        """
+        Returns the rows whose username and email aren't taken and the number of taken ones. Compares on UPPER(),
+        which is served by the unique indexes (see core_account.models).
+        """
+        users = get_user_model().objects.all()
+        taken_usernames = set()
+        taken_emails = set()
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            taken_usernames.update(users.annotate(upper=Upper('username')).filter(
+                upper__in=[row['username'].upper() for row in batch]
+            ).values_list('upper', flat=True))
+            taken_emails.update(users.exclude(email='').annotate(upper=Upper('email')).filter(
+                upper__in=[row['email'].upper() for row in batch]
+            ).values_list('upper', flat=True))
+        free = [
+            row for row in rows
+            if row['username'].upper() not in taken_usernames and row['email'].upper() not in taken_emails
+        ]
+        return free, len(rows) - len(free)
@@ -0,0 +1,24 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from boards.models import ArchivedPost, Post
+from core_account.models import Profile
+
+
+class Command(BaseCommand):
+    help = 'Creates the missing user profiles and recomputes their post counters.'
+
+    def handle(self, *args, **options):
+        missing = get_user_model().objects.filter(profile__isnull=True).values_list('pk', flat=True)
+        Profile.objects.bulk_create([Profile(user_id=pk) for pk in missing], batch_size=1000)
+        counts = []
+        # Archived posts still count
+        for model in (Post, ArchivedPost):
+            posts = model.objects.filter(created_by=OuterRef('user')).order_by().values('created_by')
+            counts.append(
+                Coalesce(Subquery(posts.annotate(count=Count('pk')).values('count'), output_field=IntegerField()), 0)
+            )
+        updated = Profile.objects.update(post_count=counts[0] + counts[1])
+        self.stdout.write('Recounted {0} profiles.'.format(updated))
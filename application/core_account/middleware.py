@@ -0,0 +1,44 @@
+import logging
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.http import HttpResponse
+
+from core_account import hashing
+
+logger = logging.getLogger(__name__)
+
+
+class HashingBusyMiddleware:
+    """
+    Answers 503 with a Retry-After header when a view can't get a password hashed, because the hashing queue of
+    the worker is full or a pool process died (see core_account.hashing), instead of a 500. Covers every caller of
+    authenticate(), the admin login included.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_exception(self, request, exception):
+        if not isinstance(exception, (hashing.Busy, BrokenProcessPool)):
+            return None
+        logger.warning('Password hashing unavailable (%s), %s %s rejected.', type(exception).__name__,
+                       request.method, request.path)
+        # Expected under load, see HashingBusyFilter.
+        request.hashing_busy = True
+        response = HttpResponse('The server is busy, please try again later.', status=503)
+        response['Retry-After'] = str(getattr(settings, 'PASSWORD_HASHING_RETRY_AFTER', 5))
+        return response
+
+
+class HashingBusyFilter(logging.Filter):
+    """
+    Drops the django.request records of the responses of HashingBusyMiddleware, already logged as a warning, so
+    they aren't logged (and mailed to the admins) as errors.
+    """
+
+    def filter(self, record):
+        return not getattr(getattr(record, 'request', None), 'hashing_busy', False)
@@ -1,3 +1,56 @@
-from django.db import models
+import logging
 
-# Create your models here.
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import DatabaseError, connections, models, transaction
+from django.db.models.signals import post_migrate, post_save
+from django.dispatch import receiver
+
+logger = logging.getLogger(__name__)
+
+# Case insensitive uniqueness of the usernames and emails, the user model belongs to django.contrib.auth so they're
+# created after migrate. UPPER() is what the iexact lookups of SignUpForm compare on PostgreSQL.
+USER_INDEXES = [
+    ('core_account_user_username_upper_uniq', 'UPPER({username})', ''),
+    # Users created by createsuperuser or the admin may have no email. Partial, the email lookups exclude '' for
+    # PostgreSQL to use it.
+    ('core_account_user_email_upper_uniq', 'UPPER({email})', " WHERE {email} <> ''"),
+]
+
+
+class Profile(models.Model):
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='profile')
+    # Maintained with F() updates by the posting forms, recomputed by `manage.py recount_profiles`
+    post_count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return 'Profile #{0}'.format(self.pk)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def create_profile(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        Profile.objects.create(user=instance)
+
+
+@receiver(post_migrate)
+def create_user_indexes(sender, using='default', **kwargs):
+    """
+    Creates the USER_INDEXES once the migrations are applied. An index that can't be created, because of existing
+    duplicates, is logged and created again by the next migrate.
+    """
+    if sender.name != 'core_account':
+        return
+    connection = connections[using]
+    user_model = get_user_model()
+    quote = connection.ops.quote_name
+    columns = {field: quote(user_model._meta.get_field(field).column) for field in ('username', 'email')}
+    for name, expression, condition in USER_INDEXES:
+        sql = 'CREATE UNIQUE INDEX IF NOT EXISTS {0} ON {1} ({2}){3}'.format(
+            quote(name), quote(user_model._meta.db_table), expression.format(**columns), condition.format(**columns)
+        )
+        try:
+            with transaction.atomic(using=using), connection.cursor() as cursor:
+                cursor.execute(sql)
+        except DatabaseError as e:
+            logger.warning('Index %s not created: %s', name, e)
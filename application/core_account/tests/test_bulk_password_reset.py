@@ -0,0 +1,50 @@
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.tokens import default_token_generator
+from django.core import mail
+from django.core.management import call_command
+from django.template import loader
+from django.test import TestCase
+from django.urls import resolve
+
+
+class BulkPasswordResetTests(TestCase):
+
+    def setUp(self):
+        user_model = get_user_model()
+        for i in range(5):
+            user_model.objects.create_user('user{0}'.format(i), 'user{0}@doe.com'.format(i), '123abcdef')
+        user_model.objects.create_user('inactive', 'inactive@doe.com', '123abcdef', is_active=False)
+        user_model.objects.create_user('unusable', 'unusable@doe.com', None)
+
+    def call(self, **options):
+        stdout = StringIO()
+        call_command('bulk_password_reset', domain='testserver', stdout=stdout, **options)
+        return stdout.getvalue()
+
+    def test_emails_sent(self):
+        output = self.call(batch_size=2, connections=2)
+        self.assertIn('Sent 5 password reset emails', output)
+        self.assertEqual(
+            ['user{0}@doe.com'.format(i) for i in range(5)], sorted(email.to[0] for email in mail.outbox)
+        )
+        email = next(email for email in mail.outbox if email.to == ['user0@doe.com'])
+        self.assertEqual('[Django Boards] Please reset your password', email.subject)
+        self.assertIn('user0', email.body)
+
+    def test_reset_link_valid(self):
+        self.call()
+        email = next(email for email in mail.outbox if email.to == ['user0@doe.com'])
+        link = next(line for line in email.body.splitlines() if line.startswith('http://testserver/'))
+        match = resolve(link[len('http://testserver'):])
+        self.assertEqual('password_reset_confirm', match.url_name)
+        user = get_user_model().objects.get(username='user0')
+        self.assertTrue(default_token_generator.check_token(user, match.kwargs['token']))
+
+    def test_templates_compiled_once(self):
+        with mock.patch.object(loader, 'get_template', wraps=loader.get_template) as get_template:
+            self.call(batch_size=2)
+        self.assertEqual(2, get_template.call_count)
+        self.assertEqual(5, len(mail.outbox))
@@ -1,6 +1,8 @@
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction
 from django.test import TestCase
 
-from core_account.forms import SignUpForm
+from core_account.forms import DUPLICATE_EMAIL, DUPLICATE_USERNAME, SignUpForm
 
 
 class SignUpFormTest(TestCase):
@@ -10,3 +12,40 @@ class SignUpFormTest(TestCase):
         expected = ['username', 'email', 'password1', 'password2']
         actual = list(form.fields)
         self.assertSequenceEqual(expected, actual)
+
+
+class SignUpFormUniquenessTests(TestCase):
+
+    def setUp(self):
+        User.objects.create_user('john', 'john@doe.com', '123abcdef')
+
+    def get_form(self, username, email):
+        return SignUpForm({
+            'username': username, 'email': email, 'password1': 'abcdef123456', 'password2': 'abcdef123456'
+        })
+
+    def test_valid_in_one_query(self):
+        form = self.get_form('jane', 'jane@doe.com')
+        with self.assertNumQueries(1):
+            self.assertTrue(form.is_valid())
+
+    def test_username_taken_ignoring_case(self):
+        form = self.get_form('JOHN', 'jane@doe.com')
+        self.assertFalse(form.is_valid())
+        self.assertEqual([DUPLICATE_USERNAME], form.errors['username'])
+        self.assertNotIn('email', form.errors)
+
+    def test_email_taken_ignoring_case(self):
+        form = self.get_form('jane', 'John@Doe.com')
+        self.assertFalse(form.is_valid())
+        self.assertEqual([DUPLICATE_EMAIL], form.errors['email'])
+        self.assertNotIn('username', form.errors)
+
+    def test_unique_indexes(self):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            User.objects.create_user('John', 'jane@doe.com', '123abcdef')
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            User.objects.create_user('jane', 'JOHN@doe.com', '123abcdef')
+        # Users without an email don't conflict.
+        User.objects.create_user('jane', '', '123abcdef')
+        User.objects.create_user('jim', '', '123abcdef')
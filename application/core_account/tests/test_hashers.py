@@ -0,0 +1,60 @@
+from unittest import mock
+
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, check_password
+from django.contrib.auth.models import User
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from core_account.hashers import ScryptPasswordHasher, TunedPBKDF2PasswordHasher
+
+
+class ScryptPasswordHasherTests(TestCase):
+
+    @override_settings(PASSWORD_SCRYPT_N=2 ** 10)
+    def test_encode_verify(self):
+        hasher = ScryptPasswordHasher()
+        encoded = hasher.encode('secret123', hasher.salt())
+        self.assertTrue(encoded.startswith('scrypt$1024$'))
+        self.assertTrue(hasher.verify('secret123', encoded))
+        self.assertFalse(hasher.verify('secret124', encoded))
+
+    def test_must_update(self):
+        """
+        Hashes made with other costs than the configured ones should be upgraded.
+        """
+        with self.settings(PASSWORD_SCRYPT_N=2 ** 10):
+            encoded = ScryptPasswordHasher().encode('secret123', 'salt')
+            self.assertFalse(ScryptPasswordHasher().must_update(encoded))
+        with self.settings(PASSWORD_SCRYPT_N=2 ** 11):
+            self.assertTrue(ScryptPasswordHasher().must_update(encoded))
+
+
+class RehashOnLoginTests(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='john', email='john@doe.com', password='secret123')
+        self.user.password = PBKDF2PasswordHasher().encode('secret123', 'salt', iterations=1000)
+        self.user.save()
+
+    def test_login_upgrades_hash(self):
+        """
+        A successful login should rehash the password with the configured iterations.
+        """
+        self.assertTrue(self.client.login(username='john', password='secret123'))
+        self.user.refresh_from_db()
+        iterations = TunedPBKDF2PasswordHasher().iterations
+        self.assertTrue(self.user.password.startswith('pbkdf2_sha256${0}$'.format(iterations)))
+        self.assertTrue(check_password('secret123', self.user.password))
+
+
+class SignUpHashingTests(TestCase):
+
+    def test_signup_hashes_once(self):
+        """
+        Logging in the new user should not check the password again.
+        """
+        data = {'username': 'john', 'email': 'john@doe.com', 'password1': 'abcdef123456', 'password2': 'abcdef123456'}
+        with mock.patch.object(TunedPBKDF2PasswordHasher, 'verify') as verify:
+            response = self.client.post(reverse('signup'), data)
+        self.assertRedirects(response, reverse('home'))
+        verify.assert_not_called()
@@ -0,0 +1,124 @@
+from concurrent.futures.process import BrokenProcessPool
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import check_password, make_password
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from core_account import hashing
+
+
+class HashingTests(TestCase):
+
+    def setUp(self):
+        hashing.shutdown()
+        self.addCleanup(hashing.shutdown)
+
+    @override_settings(PASSWORD_HASHING_PROCESSES=1)
+    def test_hashed_in_pool(self):
+        encoded = hashing.make_password('abcdef123456')
+        self.assertTrue(check_password('abcdef123456', encoded))
+        self.assertEqual((True, False), hashing.verify('abcdef123456', encoded))
+        self.assertEqual((False, False), hashing.verify('wrong', encoded))
+        metrics = hashing.metrics()
+        self.assertEqual(3, metrics['completed'])
+        self.assertEqual(0, metrics['in_flight'])
+        self.assertIsNotNone(metrics['hash_ms']['p50'])
+        self.assertGreaterEqual(metrics['latency_ms']['max'], metrics['hash_ms']['max'])
+
+    def test_outdated_hash_must_update(self):
+        encoded = make_password('abcdef123456', hasher='pbkdf2_sha1')
+        self.assertEqual((True, True), hashing.verify('abcdef123456', encoded))
+
+    def test_login_upgrades_outdated_hash(self):
+        user = get_user_model().objects.create_user('john', 'john@doe.com')
+        user.password = make_password('abcdef123456', hasher='pbkdf2_sha1')
+        user.save()
+        response = self.client.post(reverse('login'), {'username': 'john', 'password': 'abcdef123456'})
+        self.assertRedirects(response, reverse('home'))
+        user.refresh_from_db()
+        self.assertTrue(user.password.startswith('pbkdf2_sha256$'))
+
+    @override_settings(PASSWORD_HASHING_QUEUE=1, PASSWORD_HASHING_WAIT=0, PASSWORD_HASHING_RETRY_AFTER=7)
+    def test_login_rejected_when_queue_full(self):
+        get_user_model().objects.create_user('john', 'john@doe.com', 'abcdef123456')
+        executor, slots = hashing._get_executor()
+        slots.acquire()
+        try:
+            with self.assertLogs(level='WARNING') as logs:
+                response = self.client.post(reverse('login'), {'username': 'john', 'password': 'abcdef123456'})
+        finally:
+            slots.release()
+        self.assertEqual(503, response.status_code)
+        self.assertEqual('7', response['Retry-After'])
+        # Logged once as a warning, not as an error by django.request.
+        self.assertEqual(
+            [('core_account.middleware', 'WARNING')], [(record.name, record.levelname) for record in logs.records]
+        )
+        self.assertEqual(1, hashing.metrics()['rejected'])
+
+    @override_settings(PASSWORD_HASHING_QUEUE=1, PASSWORD_HASHING_WAIT=0)
+    def test_signup_rejected_when_queue_full(self):
+        executor, slots = hashing._get_executor()
+        slots.acquire()
+        try:
+            with self.assertLogs(level='WARNING') as logs:
+                response = self.client.post(reverse('signup'), {
+                    'username': 'john', 'email': 'john@doe.com',
+                    'password1': 'abcdef123456', 'password2': 'abcdef123456',
+                })
+        finally:
+            slots.release()
+        self.assertEqual(503, response.status_code)
+        # Logged once as a warning, not as an error by django.request.
+        self.assertEqual(
+            [('core_account.middleware', 'WARNING')], [(record.name, record.levelname) for record in logs.records]
+        )
+        self.assertFalse(get_user_model().objects.exists())
+
+    @override_settings(PASSWORD_HASHING_QUEUE=1, PASSWORD_HASHING_WAIT=0)
+    def test_admin_login_rejected_when_queue_full(self):
+        get_user_model().objects.create_user('john', 'john@doe.com', 'abcdef123456', is_staff=True)
+        executor, slots = hashing._get_executor()
+        slots.acquire()
+        try:
+            with self.assertLogs(level='WARNING') as logs:
+                response = self.client.post(reverse('admin:login'), {
+                    'username': 'john', 'password': 'abcdef123456',
+                })
+        finally:
+            slots.release()
+        self.assertEqual(503, response.status_code)
+        self.assertEqual(
+            [('core_account.middleware', 'WARNING')], [(record.name, record.levelname) for record in logs.records]
+        )
+
+    def test_login_rejected_when_pool_broken(self):
+        get_user_model().objects.create_user('john', 'john@doe.com', 'abcdef123456')
+        with mock.patch.object(hashing, 'verify', side_effect=BrokenProcessPool), \
+                self.assertLogs(level='WARNING') as logs:
+            response = self.client.post(reverse('login'), {'username': 'john', 'password': 'abcdef123456'})
+        self.assertEqual(503, response.status_code)
+        self.assertEqual(
+            [('core_account.middleware', 'WARNING')], [(record.name, record.levelname) for record in logs.records]
+        )
+
+
+class HashingMetricsViewTests(TestCase):
+
+    def setUp(self):
+        self.url = reverse('hashing_metrics')
+
+    def test_staff_only(self):
+        user = get_user_model().objects.create_user('john', 'john@doe.com', 'abcdef123456')
+        self.client.force_login(user)
+        self.assertNotEqual(200, self.client.get(self.url).status_code)
+
+    def test_metrics(self):
+        user = get_user_model().objects.create_user('john', 'john@doe.com', 'abcdef123456', is_staff=True)
+        self.client.force_login(user)
+        response = self.client.get(self.url)
+        self.assertEqual(200, response.status_code)
+        self.assertIn('queued', response.json())
+        self.assertIn('latency_ms', response.json())
@@ -0,0 +1,85 @@
+import os
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from core_account.management.commands.provision_users import Command
+
+
+class ProvisionUsersTests(TestCase):
+
+    def setUp(self):
+        get_user_model().objects.create_user('john', 'john@doe.com', '123abcdef')
+
+    def call(self, lines, **options):
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as f:
+            f.write('\n'.join(lines))
+        self.addCleanup(os.remove, f.name)
+        stdout = StringIO()
+        self.stderr = StringIO()
+        call_command('provision_users', f.name, stdout=stdout, stderr=self.stderr, **options)
+        return stdout.getvalue()
+
+    def test_users_created(self):
+        output = self.call([
+            'username,email,password',
+            'jane,jane@doe.com,abcdef123456',
+            'jim,jim@doe.com,',
+            'joe,joe@doe.com,abcdef654321',
+        ], batch_size=2, processes=2)
+        self.assertIn('Created 3 users', output)
+        self.assertIn('users/s', output)
+        jane = get_user_model().objects.get(username='jane')
+        self.assertTrue(jane.check_password('abcdef123456'))
+        self.assertFalse(get_user_model().objects.get(username='jim').has_usable_password())
+        self.assertEqual(0, jane.profile.post_count)
+
+    def test_taken_repeated_and_invalid_skipped(self):
+        output = self.call([
+            'username,email',
+            'JOHN,other@doe.com',
+            'jane,John@doe.com',
+            'jim,jim@doe.com',
+            'Jim,jim2@doe.com',
+            'joe,not an email',
+        ], processes=1)
+        self.assertIn('Creating 1 users, 2 invalid or repeated and 2 taken skipped', output)
+        self.assertEqual(['jim', 'john'], sorted(get_user_model().objects.values_list('username', flat=True)))
+
+    def test_too_long_skipped(self):
+        output = self.call([
+            'username,email',
+            '{0},jane@doe.com'.format('j' * 151),
+            'jim,{0}@doe.com'.format('j' * 64 + '.j' * 94),
+            'joe,joe@doe.com',
+        ], processes=1)
+        self.assertIn('Creating 1 users, 2 invalid or repeated and 0 taken skipped', output)
+        self.assertEqual(['joe', 'john'], sorted(get_user_model().objects.values_list('username', flat=True)))
+
+    def test_batch_taken_meanwhile_skipped(self):
+        exclude_taken = Command.exclude_taken
+
+        def signup_meanwhile(command, rows, batch_size):
+            result = exclude_taken(command, rows, batch_size)
+            if not get_user_model().objects.filter(username='jim').exists():
+                get_user_model().objects.create_user('jim', 'jim@other.com')
+            return result
+
+        with mock.patch.object(Command, 'exclude_taken', autospec=True, side_effect=signup_meanwhile):
+            output = self.call([
+                'username,email',
+                'jane,jane@doe.com',
+                'jim,jim@doe.com',
+                'joe,joe@doe.com',
+            ], batch_size=3, processes=1)
+        self.assertIn('Created 2 users', output)
+        self.assertIn('1 skipped', output)
+        self.assertIn('Skipped 1 users of the rows 1 to 3 taken meanwhile', self.stderr.getvalue())
+        self.assertEqual('jim@other.com', get_user_model().objects.get(username='jim').email)
+        self.assertEqual(
+            ['jane', 'jim', 'joe', 'john'], sorted(get_user_model().objects.values_list('username', flat=True))
+        )
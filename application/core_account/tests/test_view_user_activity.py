@@ -0,0 +1,85 @@
+from io import StringIO
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import resolve, reverse
+
+from boards.forms import NewTopicForm, PostForm
+from boards.models import Board, Post, Topic
+from core_account.models import Profile
+from core_account.views import UserActivityView
+
+
+class UserActivityTestCase(TestCase):
+
+    def setUp(self):
+        self.board = Board.objects.create(name='Django', description='Django board.')
+        self.user = User.objects.create_user(username='john', email='john@doe.com', password='123')
+        self.client.login(username='john', password='123')
+        self.url = reverse('user_activity', kwargs={'username': 'john'})
+
+
+class UserActivityTests(UserActivityTestCase):
+
+    def setUp(self):
+        super().setUp()
+        form = NewTopicForm({'subject': 'Hello, world', 'message': 'First post'}, user=self.user, board=self.board)
+        self.assertTrue(form.is_valid())
+        self.topic = form.save()
+        form = PostForm({'message': 'Second post'}, user=self.user, topic=self.topic)
+        self.assertTrue(form.is_valid())
+        form.save()
+        self.response = self.client.get(self.url)
+
+    def test_view_function(self):
+        view = resolve('/users/john/')
+        self.assertEqual(view.func.view_class, UserActivityView)
+
+    def test_not_found_status_code(self):
+        response = self.client.get(reverse('user_activity', kwargs={'username': 'jane'}))
+        self.assertEqual(response.status_code, 404)
+
+    def test_post_count_maintained_by_forms(self):
+        self.assertEqual(2, Profile.objects.get(user=self.user).post_count)
+        self.assertContains(self.response, 'Posts: 2')
+
+    def test_lists_topics_and_posts(self):
+        topic_posts_url = reverse('topic_posts', kwargs={'pk': self.board.pk, 'topic_pk': self.topic.pk})
+        self.assertContains(self.response, 'href="{0}"'.format(topic_posts_url))
+        self.assertEqual(['Second post', 'First post'], [post.message for post in self.response.context['posts']])
+
+    def test_navigation_links_to_activity(self):
+        self.assertContains(self.response, 'href="{0}">My account'.format(self.url))
+
+    def test_recount_profiles(self):
+        Profile.objects.all().delete()
+        call_command('recount_profiles', stdout=StringIO())
+        self.assertEqual(2, Profile.objects.get(user=self.user).post_count)
+
+
+class UserActivityPaginationTests(UserActivityTestCase):
+
+    def setUp(self):
+        super().setUp()
+        topic = Topic.objects.create(subject='Hello, world', board=self.board, starter=self.user)
+        Post.objects.bulk_create([
+            Post(message='Post {0}'.format(i), topic=topic, created_by=self.user) for i in range(5)
+        ])
+        # Same creation time for all the posts, the id breaks the ties.
+        Post.objects.update(created_at=Post.objects.first().created_at)
+
+    def test_pages_cover_all_posts_once(self):
+        UserActivityView.paginate_by, paginate_by = 2, UserActivityView.paginate_by
+        self.addCleanup(setattr, UserActivityView, 'paginate_by', paginate_by)
+        messages, url = [], self.url
+        while url:
+            response = self.client.get(url)
+            messages += [post.message for post in response.context['posts']]
+            cursor = response.context.get('next_cursor')
+            url = '{0}?before={1}'.format(self.url, cursor) if cursor else None
+        self.assertEqual(['Post {0}'.format(i) for i in reversed(range(5))], messages)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.url, {'before': 'nope'})
+        self.assertEqual(response.status_code, 404)
@@ -1,25 +1,102 @@
-from django.contrib.auth import authenticate, login
+from datetime import datetime, timedelta
+
+from django.contrib.auth import get_user_model, login
+from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.auth.views import LoginView
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.http import Http404, JsonResponse
 from django.shortcuts import redirect
 from django.urls import reverse_lazy
-from django.views.generic import CreateView
+from django.utils import timezone
+from django.views.generic import CreateView, DetailView, View
 
+from boards.models import Post, Topic
+from core.ratelimit import RateLimitMixin
+from core.views import StaffRequiredMixin
+from core_account import hashing
 from core_account.forms import SignUpForm
 
+CURSOR_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def encode_cursor(post):
+    """
+    Returns the position of `post` in the activity feed as 'microseconds-id'.
+    """
+    return '{0}-{1}'.format((post.created_at - CURSOR_EPOCH) // timedelta(microseconds=1), post.pk)
+
 
-class SignUpView(CreateView):
+def decode_cursor(cursor):
+    """
+    Returns the (created_at, id) tuple of an `encode_cursor` value, raises ValueError when it's invalid.
+    """
+    microseconds, pk = cursor.split('-')
+    return CURSOR_EPOCH + timedelta(microseconds=int(microseconds)), int(pk)
+
+
+class SignUpView(RateLimitMixin, CreateView):
     form_class = SignUpForm
     template_name = 'accounts/signup.html'
     success_url = reverse_lazy('home')
+    ratelimit_scope = 'signup'
 
     def form_valid(self, form):
-        form.save()
-        username = form.cleaned_data.get('username')
-        raw_password = form.cleaned_data.get('password1')
-        user = authenticate(username=username, password=raw_password)
+        try:
+            with transaction.atomic():
+                user = form.save()
+        except IntegrityError:
+            # Taken by a concurrent sign up since the form checked it, the unique indexes tell.
+            form.add_error(None, 'A user with that username or email address already exists.')
+            return self.form_invalid(form)
+        # The password was just hashed by the form, log the new user in without checking it a second time.
         login(self.request, user)
         return redirect('home')
 
 
 class LoginUpdatedView(LoginView):
     template_name = 'accounts/login.html'
+
+
+class UserActivityView(LoginRequiredMixin, DetailView):
+    """
+    Lists the topics and posts of a user, newest first. The posts are keyset paginated on (created_at, id):
+    a page starts after the position given by the `before` parameter, so it costs the same at any depth.
+    """
+    template_name = 'accounts/activity.html'
+    context_object_name = 'profile_user'
+    slug_field = 'username'
+    slug_url_kwarg = 'username'
+    paginate_by = 20
+    topics_limit = 10
+
+    def get_queryset(self):
+        return get_user_model().objects.select_related('profile')
+
+    def get_context_data(self, **kwargs):
+        context = super(UserActivityView, self).get_context_data(**kwargs)
+        posts = Post.objects.filter(created_by=self.object).select_related('topic').defer('message', 'message_html')
+        posts = posts.order_by('-created_at', '-pk')
+        before = self.request.GET.get('before')
+        if before:
+            try:
+                created_at, pk = decode_cursor(before)
+            except (ValueError, OverflowError):
+                raise Http404('Invalid page.')
+            posts = posts.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk))
+        # One more than a page tells if there is a next one.
+        posts = list(posts[:self.paginate_by + 1])
+        context['posts'] = posts[:self.paginate_by]
+        if len(posts) > self.paginate_by:
+            context['next_cursor'] = encode_cursor(posts[self.paginate_by - 1])
+        context['topics'] = Topic.objects.filter(starter=self.object).order_by('-pk')[:self.topics_limit]
+        return context
+
+
+class HashingMetricsView(StaffRequiredMixin, View):
+    """
+    Returns the hashing queue metrics of the worker answering, as JSON.
+    """
+
+    def get(self, request, *args, **kwargs):
+        return JsonResponse(hashing.metrics())